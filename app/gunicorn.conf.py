@@ -1,6 +1,6 @@
 # https://github.com/benoitc/gunicorn/blob/master/examples/example_config.py
 
-import multiprocessing
+from app.src.infrastructure.db.pool import worker_count
 
 bind = "0.0.0.0:80"
 
@@ -8,7 +8,9 @@ bind = "0.0.0.0:80"
 backlog = 2048
 
 # workers - The number of worker processes that this server should keep alive for handling requests.
-workers = multiprocessing.cpu_count() * 2 + 1
+# Shared with the database pool sizing (DB_CONNECTION_BUDGET is split between workers), set with WEB_CONCURRENCY.
+# Without it, 2 x CPU + 1 capped to what DB_CONNECTION_BUDGET allows.
+workers = worker_count()
 
 # worker_class - The type of workers to use.
 worker_class = "uvicorn.workers.UvicornWorker"
@@ -36,6 +38,10 @@ preload_app = True
 
 
 def post_fork(server, worker):
+    # With preload_app the engines were created in the master: give this worker its own pools
+    from app.src.infrastructure.db.session import reset_engines_after_fork
+
+    reset_engines_after_fork()
     server.log.info("Worker spawned (pid: %s)", worker.pid)
 
 
@@ -0,0 +1,100 @@
+from bisect import bisect_right
+from collections.abc import Hashable, Iterable, Iterator
+from datetime import UTC, datetime
+from typing import Generic, NamedTuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MIN_TIME = datetime.min.replace(tzinfo=UTC)
+_MAX_TIME = datetime.max.replace(tzinfo=UTC)
+
+
+class TagWindow(NamedTuple):
+    """
+    Période [start_at, end_at) pendant laquelle une balise est affectée à une pièce (None : non borné).
+    """
+    source_address: str
+    start_at: datetime | None = None
+    end_at: datetime | None = None
+
+    @property
+    def bounds(self) -> tuple[datetime, datetime]:
+        """Bornes explicites (dates extrêmes si non bornée), pour les paramètres SQL"""
+        return self.start_at or _MIN_TIME, self.end_at or _MAX_TIME
+
+
+class IntervalIndex(Generic[K, V]):
+    """
+    Intervalles [début, fin) par clé (None : non borné).
+
+    Les bornes de chaque clé découpent l'axe du temps en segments élémentaires, chacun associé aux valeurs
+    des intervalles qui le couvrent : values_at ne fait qu'un bisect.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[K, datetime | None, datetime | None, V]]):
+        by_key: dict[K, list[tuple[datetime | None, datetime | None, V]]] = {}
+        for key, start, end, value in intervals:
+            by_key.setdefault(key, []).append((start, end, value))
+
+        self._bounds: dict[K, list[datetime]] = {}
+        self._segments: dict[K, list[tuple[V, ...]]] = {}
+        for key, items in by_key.items():
+            bounds = sorted({bound for start, end, _ in items for bound in (start, end) if bound is not None})
+            # Segment i : [bounds[i - 1], bounds[i]), le premier et le dernier ne sont pas bornés
+            segments = []
+            for i in range(len(bounds) + 1):
+                lower = bounds[i - 1] if i > 0 else None
+                upper = bounds[i] if i < len(bounds) else None
+                segments.append(tuple(dict.fromkeys(
+                    value for start, end, value in items
+                    if (start is None or (lower is not None and start <= lower))
+                    and (end is None or (upper is not None and end >= upper))
+                )))
+            self._bounds[key] = bounds
+            self._segments[key] = segments
+
+    def values_at(self, key: K, time: datetime) -> tuple[V, ...]:
+        bounds = self._bounds.get(key)
+        if bounds is None:
+            return ()
+        return self._segments[key][bisect_right(bounds, time)]
+
+    def merged(self, key: K) -> list[tuple[datetime | None, datetime | None]]:
+        """
+        Union des intervalles de la clé, triée et sans chevauchement.
+        """
+        bounds = self._bounds.get(key, [])
+        merged: list[tuple[datetime | None, datetime | None]] = []
+        for i, values in enumerate(self._segments.get(key, [])):
+            if not values:
+                continue
+            lower = bounds[i - 1] if i > 0 else None
+            upper = bounds[i] if i < len(bounds) else None
+            if merged and merged[-1][1] == lower:
+                merged[-1] = (merged[-1][0], upper)
+            else:
+                merged.append((lower, upper))
+        return merged
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._bounds)
+
+
+def tag_window_index(room_windows: dict[int, list[TagWindow]]) -> IntervalIndex[str, tuple[int, TagWindow]]:
+    """
+    Index balise -> (pièce, période) des affectations, pour attribuer chaque mesure à la bonne pièce.
+    """
+    return IntervalIndex(
+        (window.source_address, window.start_at, window.end_at, (room_id, window))
+        for room_id, windows in room_windows.items()
+        for window in dict.fromkeys(windows)
+    )
+
+
+def merge_tag_windows(windows: Iterable[TagWindow]) -> list[TagWindow]:
+    """
+    Périodes à lire pour chaque balise, toutes pièces confondues (union des affectations).
+    """
+    index = IntervalIndex((window.source_address, window.start_at, window.end_at, True) for window in windows)
+    return [TagWindow(source, start, end) for source in index for start, end in index.merged(source)]
@@ -0,0 +1,115 @@
+"""
+Pagination par clé (keyset) : curseurs opaques et signés.
+
+Un curseur désigne une position dans l'ordre des clés de la collection et un sens de lecture :
+- next : éléments situés après la clé (clé vide : début de la collection)
+- prev : éléments situés avant la clé (clé vide : fin de la collection)
+Il est encodé avec common/utils.encode puis signé (HMAC-SHA256) par un CursorCodec, dont la clé est fournie
+par le câblage (presentation/dependencies.py) : un curseur modifié ou fabriqué par le client est refusé
+(DecodedFailedError).
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import math
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, Generic, Literal, TypeVar
+
+from app.src.common.cache import ResultCache
+from app.src.common.exception import DecodedFailedError
+from app.src.common.utils import decode, encode
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+Direction = Literal["next", "prev"]
+
+_DIRECTION_FIELD = "_dir"
+_SIGNATURE_SIZE = 16
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    direction: Direction = "next"
+    key: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    items: list[T]
+    has_next: bool
+    has_prev: bool
+    # Clés du premier et du dernier élément de la page
+    first_key: dict[str, Any] | None = None
+    last_key: dict[str, Any] | None = None
+
+    def map(self, convert: Callable[[T], U]) -> "KeysetPage[U]":
+        return KeysetPage([convert(item) for item in self.items], self.has_next, self.has_prev, self.first_key, self.last_key)
+
+
+# Premier et dernier chunk : positions fixes, sans requête
+FIRST_CURSOR = KeysetCursor("next")
+LAST_CURSOR = KeysetCursor("prev")
+
+
+class CursorCodec:
+    def __init__(self, secret_key: str):
+        self._secret_key = secret_key.encode()
+
+    def _sign(self, payload: bytes) -> str:
+        digest = hmac.new(self._secret_key, payload, hashlib.sha256).digest()[:_SIGNATURE_SIZE]
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+    def encode(self, cursor: KeysetCursor) -> str:
+        payload = encode({**cursor.key, _DIRECTION_FIELD: cursor.direction}).encode()
+        return f"{base64.urlsafe_b64encode(payload).rstrip(b'=').decode()}.{self._sign(payload)}"
+
+    def decode(self, cursor: str | None, resource_name: str = "Unknown element") -> KeysetCursor | None:
+        """Curseur reçu du client -> KeysetCursor (valeurs de clé en texte). Lève DecodedFailedError si invalide."""
+        if not cursor:
+            return None
+
+        encoded, _, signature = cursor.partition(".")
+        try:
+            payload = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        except (binascii.Error, ValueError) as e:
+            raise DecodedFailedError(resource_name, "Malformed cursor") from e
+        if not signature or not hmac.compare_digest(signature, self._sign(payload)):
+            raise DecodedFailedError(resource_name, "Invalid cursor signature")
+
+        values = decode(payload.decode(), resource_name)
+        direction = values.pop(_DIRECTION_FIELD, None)
+        if direction not in ("next", "prev"):
+            raise DecodedFailedError(resource_name, "Invalid cursor direction")
+        return KeysetCursor(direction, values)
+
+    def page_cursors(self, page: KeysetPage, cursor: str | None) -> dict[str, str | None]:
+        """Curseurs du chunk courant, du premier, du dernier, du suivant et du précédent"""
+        first_cursor = self.encode(FIRST_CURSOR)
+        return {
+            "current_cursor": cursor or first_cursor,
+            "first_cursor": first_cursor,
+            "last_cursor": self.encode(LAST_CURSOR),
+            "next_cursor": self.encode(KeysetCursor("next", page.last_key)) if page.has_next else None,
+            "prev_cursor": self.encode(KeysetCursor("prev", page.first_key)) if page.has_prev else None,
+        }
+
+
+def count_total(cache: ResultCache | None, key: Hashable, count: Callable[[], int]) -> int:
+    """Nombre total d'éléments, relu dans le cache tant qu'il n'a pas expiré"""
+    if cache is None:
+        return count()
+
+    total = cache.get(key)
+    if total is None:
+        total = count()
+        cache.set(key, total)
+    return total
+
+
+def chunk_count(total: int | None, limit: int | None) -> int | None:
+    if total is None:
+        return None
+    return math.ceil(total / limit) if limit else 1
@@ -0,0 +1,162 @@
+"""
+Quantiles approchés par sketch fusionnable (DDSketch).
+
+Chaque valeur est rangée dans un intervalle logarithmique (bin) : un quantile est connu à RELATIVE_ACCURACY près
+quelle que soit la distribution, et un sketch ne contient que des compteurs par bin. Deux sketches se fusionnent
+en additionnant leurs compteurs : les sketches par balise et par intervalle (rollups, requêtes SQL) se combinent
+en sketches par pièce, par intervalle de lissage ou sur toute la période, sans relire les mesures.
+
+Le calcul du bin existe aussi en SQL (sketch_bin_sql), pour construire les sketches dans la base.
+"""
+import math
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any
+
+from app.src.common.interval_index import TagWindow, tag_window_index
+from app.src.common.time_series import to_epoch_us
+
+# Quantiles renvoyés par l'API : p5, p50, p95
+QUANTILES: tuple[float, ...] = (0.05, 0.5, 0.95)
+
+RELATIVE_ACCURACY = 0.01
+
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+# Valeurs absolues plus petites : bin 0 (valeur 0)
+_MIN_VALUE = 1e-6
+# Décalage des bins : les bins positifs et négatifs ne se chevauchent pas et l'ordre des bins est celui des valeurs
+_OFFSET = 1 - math.ceil(math.log(_MIN_VALUE) / _LOG_GAMMA)
+
+_US_PER_MINUTE = 60_000_000
+
+
+def sketch_bin(value: float) -> int:
+    magnitude = abs(value)
+    if magnitude < _MIN_VALUE:
+        return 0
+    index = math.ceil(math.log(magnitude) / _LOG_GAMMA) + _OFFSET
+    return index if value > 0 else -index
+
+
+def bin_value(key: int) -> float:
+    """Valeur représentative d'un bin (erreur relative maximale RELATIVE_ACCURACY)"""
+    if key == 0:
+        return 0.0
+    value = 2 * _GAMMA ** (abs(key) - _OFFSET) / (_GAMMA + 1)
+    return value if key > 0 else -value
+
+
+def sketch_bin_sql(column: str) -> str:
+    """Expression SQL équivalente à sketch_bin"""
+    return (
+        f"CASE WHEN abs({column}) < {_MIN_VALUE!r} THEN 0 "
+        f"ELSE (sign({column}) * (ceil(ln(abs({column})::float8) / {_LOG_GAMMA!r}) + {_OFFSET}))::integer END"
+    )
+
+
+class QuantileSketch:
+    """
+    Compteurs de mesures par bin.
+    """
+    __slots__ = ("bins", "count")
+
+    def __init__(self):
+        self.bins: dict[int, int] = {}
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        self.add_bin(sketch_bin(value), count)
+
+    def add_bin(self, key: int, count: int = 1) -> None:
+        self.bins[key] = self.bins.get(key, 0) + count
+        self.count += count
+
+    def merge(self, other: "QuantileSketch") -> None:
+        for key, count in other.bins.items():
+            self.add_bin(key, count)
+
+    @classmethod
+    def combine(cls, parts: Iterable["QuantileSketch"]) -> "QuantileSketch":
+        result = cls()
+        for part in parts:
+            result.merge(part)
+        return result
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        cumulated = 0
+        for key in sorted(self.bins):
+            cumulated += self.bins[key]
+            if cumulated > rank:
+                return bin_value(key)
+        return bin_value(max(self.bins))
+
+    def quantiles(self) -> dict[str, float | None]:
+        """{"p5": ..., "p50": ..., "p95": ...} arrondis à 2 décimales"""
+        return {
+            _quantile_name(q): round(value, 2) if (value := self.quantile(q)) is not None else None
+            for q in QUANTILES
+        }
+
+
+def _quantile_name(q: float) -> str:
+    return f"p{q * 100:g}"
+
+
+class RoomQuantiles:
+    """
+    Sketches par pièce et par intervalle (alignés sur l'epoch, comme les rollups).
+
+    Comme StreamingSmoother, une mesure n'est comptée que pour les pièces où sa balise était affectée à cet instant.
+    Les sketches déjà agrégés (rollups, requête SQL) sont ajoutés bin par bin avec add_bin.
+    """
+
+    def __init__(self, room_windows: dict[int, list[TagWindow]], interval_minutes: int):
+        self.room_windows = {room_id: list(dict.fromkeys(windows)) for room_id, windows in room_windows.items()}
+        self._width_us = interval_minutes * _US_PER_MINUTE
+        self._index = tag_window_index(self.room_windows)
+        self._sketches: dict[int, dict[int, QuantileSketch]] = {room_id: {} for room_id in self.room_windows}
+
+    def bucket_us(self, time_us: int) -> int:
+        return time_us - time_us % self._width_us
+
+    def add(self, source: str, time: datetime, value: float) -> None:
+        keys = self._index.values_at(source, time)
+        if not keys:
+            return
+        key = sketch_bin(value)
+        bucket_us = self.bucket_us(to_epoch_us(time))
+        for room_id, _ in keys:
+            sketch = self._sketches[room_id].get(bucket_us)
+            if sketch is None:
+                sketch = self._sketches[room_id][bucket_us] = QuantileSketch()
+            sketch.bins[key] = sketch.bins.get(key, 0) + 1
+            sketch.count += 1
+
+    def add_bin(self, room_id: int, bucket_us: int, key: int, count: int = 1) -> None:
+        buckets = self._sketches[room_id]
+        sketch = buckets.get(bucket_us)
+        if sketch is None:
+            sketch = buckets[bucket_us] = QuantileSketch()
+        sketch.add_bin(key, count)
+
+    def results(self, after_us: int | None = None) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        (pièce, {"quantiles": ..., "quantile_data": [[timestamp_ms, p5, p50, p95], ...]}) par pièce ayant des mesures.
+        Avec after_us, quantile_data ne contient que les intervalles se terminant après after_us.
+        """
+        for room_id, buckets in self._sketches.items():
+            if not buckets:
+                continue
+            quantile_data = [
+                [bucket_us // 1000, *buckets[bucket_us].quantiles().values()]
+                for bucket_us in sorted(buckets)
+                if after_us is None or bucket_us + self._width_us > after_us
+            ]
+            yield room_id, {
+                "quantiles": QuantileSketch.combine(buckets.values()).quantiles(),
+                "quantile_data": quantile_data,
+            }
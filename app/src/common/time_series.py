@@ -0,0 +1,419 @@
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta, tzinfo
+from statistics import mean
+
+import numpy as np
+
+from app.src.common.interval_index import TagWindow, tag_window_index
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_US = timedelta(microseconds=1)
+_US_PER_MINUTE = 60_000_000
+
+
+def to_epoch_us(value: datetime) -> int:
+    """
+    Convertit une date en microsecondes depuis epoch (même convention que datetime.timestamp)
+    """
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - _EPOCH) // _ONE_US
+
+
+def from_epoch_us(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def grid_start(min_time: datetime, interval_minutes: int) -> datetime:
+    """
+    Premier point de la grille de lissage : prochain multiple de interval_minutes après min_time.
+    """
+    current_time = min_time
+    minutes_offset = current_time.minute % interval_minutes
+    if minutes_offset != 0:
+        current_time = current_time.replace(
+            minute=current_time.minute - minutes_offset,
+            second=0,
+            microsecond=0
+        )
+        current_time += timedelta(minutes=interval_minutes)
+    return current_time
+
+
+def build_time_grid(min_time: datetime, max_time: datetime, interval_minutes: int) -> np.ndarray:
+    """
+    Construit la grille de lissage (epoch µs) entre min_time et max_time.
+    """
+    start_us = to_epoch_us(grid_start(min_time, interval_minutes))
+    end_us = to_epoch_us(max_time)
+    if start_us > end_us:
+        return np.empty(0, dtype=np.int64)
+
+    step_us = interval_minutes * _US_PER_MINUTE
+    count = (end_us - start_us) // step_us + 1
+    return start_us + np.arange(count, dtype=np.int64) * step_us
+
+
+def continue_time_grid(last_us: int, end_us: int, interval_minutes: int) -> np.ndarray:
+    """
+    Points de grille suivant un point déjà calculé (last_us exclu) jusqu'à end_us.
+    """
+    step_us = interval_minutes * _US_PER_MINUTE
+    if last_us + step_us > end_us:
+        return np.empty(0, dtype=np.int64)
+
+    count = (end_us - last_us) // step_us
+    return last_us + np.arange(1, count + 1, dtype=np.int64) * step_us
+
+
+def interpolate_on_grid(times_us: np.ndarray, values: np.ndarray, grid_us: np.ndarray) -> np.ndarray:
+    """
+    Interpole linéairement une source sur la grille.
+
+    - point exact : valeur brute
+    - entre deux mesures : interpolation linéaire arrondie à 2 décimales
+    - avant la première / après la dernière mesure : valeur la plus proche
+    Retourne NaN partout si la source est vide.
+    """
+    result = np.full(grid_us.shape, np.nan, dtype=np.float64)
+    if times_us.size == 0 or grid_us.size == 0:
+        return result
+
+    order = np.argsort(times_us, kind="stable")
+    times_us = times_us[order]
+    values = values[order].astype(np.float64, copy=False)
+    last = times_us.size - 1
+
+    # Premier échantillon >= point de grille
+    after_idx = np.searchsorted(times_us, grid_us, side="left")
+    clipped_idx = np.minimum(after_idx, last)
+    exact = (after_idx <= last) & (times_us[clipped_idx] == grid_us)
+
+    before_only = after_idx > last
+    after_only = (after_idx == 0) & ~exact
+    between = ~exact & ~before_only & ~after_only
+
+    result[exact] = values[after_idx[exact]]
+    result[before_only] = values[last]
+    result[after_only] = values[0]
+
+    if between.any():
+        right = after_idx[between]
+        left = right - 1
+        t0 = times_us[left]
+        ratio = (grid_us[between] - t0) / (times_us[right] - t0)
+        interpolated = values[left] + ratio * (values[right] - values[left])
+        result[between] = round_half_cent(interpolated)
+
+    return result
+
+
+def smooth_and_aggregate(
+    series_by_source: dict[str, tuple[np.ndarray, np.ndarray]],
+    interval_minutes: int,
+    tz: tzinfo | None = None,
+    after_us: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lisse chaque source sur une grille commune puis fait la moyenne des sources (moyenne masquée).
+
+    series_by_source : source_address -> (temps en epoch µs, valeurs)
+    tz : fuseau des mesures, utilisé pour aligner la grille (fuseau local si None)
+    after_us : dernier point de grille déjà connu, seuls les points suivants sont calculés
+    Retourne (grille epoch µs, moyennes arrondies à 2 décimales) sans les points vides.
+    """
+    series = [(times, values) for times, values in series_by_source.values() if times.size]
+    if not series:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    max_us = max(int(times.max()) for times, _ in series)
+    if after_us is not None:
+        grid_us = continue_time_grid(after_us, max_us, interval_minutes)
+    else:
+        min_us = min(int(times.min()) for times, _ in series)
+        grid_us = build_time_grid(
+            from_epoch_us(min_us).astimezone(tz),
+            from_epoch_us(max_us).astimezone(tz),
+            interval_minutes
+        )
+
+    return aggregate_on_grid(series, grid_us)
+
+
+def aggregate_on_grid(
+    series: list[tuple[np.ndarray, np.ndarray]],
+    grid_us: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Interpole chaque série sur la grille donnée et fait la moyenne (arrondie) des valeurs présentes.
+    """
+    if grid_us.size == 0 or not series:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    stacked = np.vstack([interpolate_on_grid(times, values, grid_us) for times, values in series])
+    return average_sources(stacked, grid_us)
+
+
+def average_sources(stacked: np.ndarray, grid_us: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Moyenne arrondie par point de grille des valeurs présentes (une ligne par source, NaN si absente).
+    """
+    mask = ~np.isnan(stacked)
+    counts = mask.sum(axis=0)
+    sums = np.where(mask, stacked, 0.0).sum(axis=0)
+
+    has_value = counts > 0
+    raw_averages = sums[has_value] / counts[has_value]
+    averages = np.round(raw_averages, 2)
+
+    # Sur les égalités au demi-centime, refait la moyenne exacte (statistics.mean) colonne par colonne
+    columns = np.flatnonzero(has_value)
+    for idx in np.flatnonzero(_half_cent_ties(raw_averages)):
+        column = stacked[mask[:, columns[idx]], columns[idx]]
+        averages[idx] = round(mean(column.tolist()), 2)
+
+    return grid_us[has_value], averages
+
+
+class RunningStats:
+    """
+    Nombre, min, max, moyenne et variance calculés en une passe (algorithme de Welford),
+    sans conserver les valeurs.
+    """
+    __slots__ = ("count", "m2", "max", "mean", "min")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        """Variance de population (0 sans valeur)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @classmethod
+    def combine(cls, parts: Iterable["RunningStats"]) -> "RunningStats":
+        """
+        Fusionne des statistiques partielles (formule de Chan et al.).
+        """
+        result = cls()
+        for part in parts:
+            if not part.count:
+                continue
+            count = result.count + part.count
+            delta = part.mean - result.mean
+            result.mean += delta * part.count / count
+            result.m2 += part.m2 + delta * delta * result.count * part.count / count
+            result.count = count
+            result.min = min(result.min, part.min)
+            result.max = max(result.max, part.max)
+        return result
+
+
+class _RoomGrid:
+    __slots__ = ("start_us",)
+
+    def __init__(self, start_us: int | None):
+        self.start_us = start_us
+
+
+class _Track:
+    """
+    Mesures d'une affectation balise / pièce : statistiques, dernière mesure,
+    et valeurs lissées sur la grille de la pièce jusqu'au point next_us (exclu).
+    """
+    __slots__ = ("column", "last_us", "last_value", "next_us", "room", "stats")
+
+    def __init__(self, room: _RoomGrid):
+        self.room = room
+        self.column = array("d")
+        self.next_us = room.start_us
+        self.stats = RunningStats()
+        self.last_us: int | None = None
+        self.last_value = 0.0
+
+
+class StreamingSmoother:
+    """
+    Version en flux de smooth_and_aggregate, pour plusieurs pièces à la fois.
+
+    Les mesures sont passées une par une par ordre chronologique (curseur ORDER BY time) et attribuées,
+    via l'index des affectations, aux seules pièces où la balise se trouvait à cet instant. Chaque affectation
+    est une série : ses points de grille sont interpolés dès que sa mesure suivante est lue, seules sa dernière
+    mesure et ses valeurs lissées sont conservées. Résultat identique à smooth_and_aggregate sur les séries complètes.
+    """
+
+    def __init__(
+        self,
+        room_windows: dict[int, list[TagWindow]],
+        interval_minutes: int,
+        after_us: int | None = None,
+    ):
+        self.room_windows = {room_id: list(dict.fromkeys(windows)) for room_id, windows in room_windows.items()}
+        self.interval_minutes = interval_minutes
+        self.tz: tzinfo | None = None
+        self._step_us = interval_minutes * _US_PER_MINUTE
+        self._index = tag_window_index(self.room_windows)
+
+        start_us = after_us + self._step_us if after_us is not None else None
+        self._rooms = {room_id: _RoomGrid(start_us) for room_id in self.room_windows}
+        self._tracks = {
+            (room_id, window): _Track(self._rooms[room_id])
+            for room_id, windows in self.room_windows.items()
+            for window in windows
+        }
+
+    def add(self, source: str, time: datetime, value: float) -> None:
+        # Fuseau de la première mesure, utilisé pour aligner la grille (comme smooth_and_aggregate)
+        if self.tz is None:
+            self.tz = time.tzinfo
+        time_us = None
+
+        for key in self._index.values_at(source, time):
+            if time_us is None:
+                time_us = to_epoch_us(time)
+                value = float(value)
+
+            track = self._tracks[key]
+            if track.next_us is None:
+                room = track.room
+                if room.start_us is None:
+                    room.start_us = to_epoch_us(grid_start(time.astimezone(self.tz), self.interval_minutes))
+                track.next_us = room.start_us
+            if track.next_us <= time_us:
+                self._fill(track, time_us, value)
+
+            track.last_us = time_us
+            track.last_value = value
+            track.stats.add(value)
+
+    def _fill(self, track: _Track, time_us: int, value: float) -> None:
+        """Points de grille jusqu'à time_us : valeur exacte, interpolée, ou première valeur de la série"""
+        point_us = track.next_us
+        previous_us, previous_value = track.last_us, track.last_value
+        while point_us <= time_us:
+            if previous_us is None or point_us == time_us:
+                track.column.append(value)
+            else:
+                ratio = (point_us - previous_us) / (time_us - previous_us)
+                track.column.append(round(previous_value + ratio * (value - previous_value), 2))
+            point_us += self._step_us
+        track.next_us = point_us
+
+    def results(self) -> Iterator[tuple[int, RunningStats, np.ndarray, np.ndarray]]:
+        """
+        (pièce, statistiques, grille epoch µs, moyennes) pour chaque pièce ayant au moins une mesure.
+        Les points suivant la dernière mesure d'une série prennent sa dernière valeur.
+        """
+        for room_id, windows in self.room_windows.items():
+            tracks = [self._tracks[room_id, window] for window in windows]
+            tracks = [track for track in tracks if track.last_us is not None]
+            if not tracks:
+                continue
+
+            start_us = self._rooms[room_id].start_us
+            end_us = max(track.last_us for track in tracks)
+            count = (end_us - start_us) // self._step_us + 1 if start_us <= end_us else 0
+            grid_us = start_us + np.arange(count, dtype=np.int64) * self._step_us
+            stacked = np.empty((len(tracks), count), dtype=np.float64)
+            for row, track in enumerate(tracks):
+                track.column.extend([track.last_value] * (count - len(track.column)))
+                stacked[row] = np.frombuffer(track.column, dtype=np.float64)
+
+            stats = RunningStats.combine(track.stats for track in tracks)
+            yield (room_id, stats, *average_sources(stacked, grid_us))
+
+
+def round_half_cent(values: np.ndarray) -> np.ndarray:
+    """
+    Arrondi à 2 décimales vectorisé, identique au round() Python.
+    np.round peut différer sur les égalités (x.xx5), qui sont recalculées avec round().
+    """
+    rounded = np.round(values, 2)
+    for idx in np.flatnonzero(_half_cent_ties(values)):
+        rounded[idx] = round(float(values[idx]), 2)
+    return rounded
+
+
+def _half_cent_ties(values: np.ndarray) -> np.ndarray:
+    scaled = np.abs(values) * 100
+    return np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+
+
+def to_data_points(grid_us: np.ndarray, values: np.ndarray) -> list[list[float]]:
+    """
+    Format de sortie de l'API : [[timestamp_ms, valeur]]
+    """
+    timestamps_ms = (grid_us / 1e6 * 1000).astype(np.int64)
+    return [
+        [timestamp, round(value, 2)]
+        for timestamp, value in zip(timestamps_ms.tolist(), values.tolist(), strict=True)
+    ]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets : indices des points à garder pour tracer la série avec max_points points.
+
+    Premier et dernier points conservés, puis dans chaque intervalle le point formant le plus grand triangle
+    avec le point retenu précédemment et la moyenne de l'intervalle suivant (les pics sont conservés).
+    Bornes et moyennes des intervalles sont calculées en une fois, la boucle ne fait qu'un argmax par intervalle.
+    """
+    size = x.size
+    if max_points >= size or max_points < 3:
+        return np.arange(size)
+
+    x = x.astype(np.float64, copy=False)
+    y = y.astype(np.float64, copy=False)
+
+    # Intervalles des points intermédiaires (1 .. size - 2) ; le dernier point sert de dernier intervalle "suivant"
+    bucket_count = max_points - 2
+    edges = (np.arange(bucket_count + 1) * (size - 2) / bucket_count).astype(np.int64) + 1
+    next_edges = np.append(edges[2:], size)
+
+    x_sums = np.concatenate(([0.0], np.cumsum(x)))
+    y_sums = np.concatenate(([0.0], np.cumsum(y)))
+    next_counts = next_edges - edges[1:]
+    next_x = (x_sums[next_edges] - x_sums[edges[1:]]) / next_counts
+    next_y = (y_sums[next_edges] - y_sums[edges[1:]]) / next_counts
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = size - 1
+    anchor = 0
+    for bucket in range(bucket_count):
+        start, end = edges[bucket], edges[bucket + 1]
+        areas = np.abs(
+            (x[anchor] - next_x[bucket]) * (y[start:end] - y[anchor])
+            - (x[anchor] - x[start:end]) * (next_y[bucket] - y[anchor])
+        )
+        anchor = start + int(np.argmax(areas))
+        selected[bucket + 1] = anchor
+
+    return selected
+
+
+def downsample_points(points: list[list[float]], max_points: int) -> list[list[float]]:
+    """
+    Réduit une série au format de l'API ([[timestamp_ms, valeur]]) à max_points points (LTTB).
+    """
+    if len(points) <= max_points:
+        return points
+
+    matrix = np.asarray(points, dtype=np.float64)
+    return [points[idx] for idx in lttb_indices(matrix[:, 0], matrix[:, 1], max_points).tolist()]
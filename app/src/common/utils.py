@@ -1,3 +1,4 @@
+from datetime import UTC, datetime
 from urllib.parse import parse_qs, urlencode
 
 from app.src.common.exception import DecodedFailedError
@@ -12,3 +13,10 @@ def decode(cursor: str, resource_name: str = "Unknown element") -> dict:
     if not parsed:
         raise DecodedFailedError(resource_name, "Decoded value is empty")
     return {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
+
+
+def as_utc(value: datetime | None) -> datetime | None:
+    """Date en UTC ; une date sans fuseau (naïve) est considérée comme UTC"""
+    if value is None:
+        return None
+    return value.astimezone(UTC) if value.tzinfo else value.replace(tzinfo=UTC)
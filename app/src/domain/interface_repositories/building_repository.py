@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.building import Building
 
 
@@ -9,11 +10,7 @@ class BuildingRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_buildings(self, cursor: int | None, limit: int) -> tuple[list[Building], int, Building | None, Building | None]:
-        pass
-
-    @abstractmethod
-    def select_buildings(self, offset: int | None = None, limit: int | None = None) -> list[Building | None]:
+    def paginate_buildings(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Building]:
         pass
 
     @abstractmethod
@@ -32,10 +29,6 @@ class BuildingRepository(ABC):
     def delete_building(self, building_id: int) -> bool:
         pass
 
-    @abstractmethod
-    def get_building_by_position(self, position: int) -> Building:
-        pass
-
     @abstractmethod
     def get_building(self, position: int) -> Building:
         pass
@@ -1,14 +1,44 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
+from app.src.common.interval_index import TagWindow
 
-class DataRepository(ABC):
+
+class AsyncDataRepository(ABC):
     @abstractmethod
-    def get_rooms_with_sensor_data(
+    async def get_rooms_with_sensor_data(
         self,
         room_ids: list[int] | None = None,
         first_value_date: datetime | None = None,
-        smooth_interval_minutes: int = 30
+        smooth_interval_minutes: int = 30,
+        since: datetime | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
     ) -> list[dict[str, Any]]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_rooms_latest_values(
+        self,
+        room_ids: list[int] | None = None,
+        building_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def get_tag_windows(self, tag_id: int | None = None, room_id: int | None = None) -> list[TagWindow]:
+        pass
+
+    @abstractmethod
+    def iter_rooms_with_sensor_data(
+        self,
+        room_ids: list[int] | None = None,
+        first_value_date: datetime | None = None,
+        smooth_interval_minutes: int = 30,
+        since: datetime | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.event import Event
 
 
@@ -9,11 +10,7 @@ class EventRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_events(self, cursor: int | None, limit: int) -> tuple[list[Event], int, Event | None, Event | None]:
-        pass
-
-    @abstractmethod
-    def select_events(self, offset: int | None = None, limit: int | None = None) -> list[Event | None]:
+    def paginate_events(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Event]:
         pass
 
     @abstractmethod
@@ -32,10 +29,6 @@ class EventRepository(ABC):
     def delete_event(self, event_id: int) -> bool:
         pass
 
-    @abstractmethod
-    def get_event_by_position(self, position: int) -> Event:
-        pass
-
     @abstractmethod
     def get_event(self, position: int) -> Event:
         pass
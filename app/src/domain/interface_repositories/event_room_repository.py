@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.event_room import EventRoom
 
 
@@ -9,11 +10,7 @@ class EventRoomRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_event_rooms(self, cursor: int | None, limit: int) -> tuple[list[EventRoom], int, EventRoom | None, EventRoom | None]:
-        pass
-
-    @abstractmethod
-    def select_event_rooms(self, offset: int | None = None, limit: int | None = None) -> list[EventRoom | None]:
+    def paginate_event_rooms(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[EventRoom]:
         pass
 
     @abstractmethod
@@ -32,10 +29,6 @@ class EventRoomRepository(ABC):
     def delete_event_room(self, event_room_id: int) -> bool:
         pass
 
-    @abstractmethod
-    def get_event_room_by_position(self, position: int) -> EventRoom:
-        pass
-
     @abstractmethod
     def get_event_room(self, position: int) -> EventRoom:
         pass
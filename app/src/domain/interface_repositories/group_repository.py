@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.group import Group
 
 
@@ -9,11 +10,7 @@ class GroupRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_groups(self, cursor: int | None, limit: int) -> tuple[list[Group], int, Group | None, Group | None]:
-        pass
-
-    @abstractmethod
-    def select_groups(self, offset: int | None = None, limit: int | None = None) -> list[Group | None]:
+    def paginate_groups(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Group]:
         pass
 
     @abstractmethod
@@ -32,10 +29,6 @@ class GroupRepository(ABC):
     def delete_group(self, group_id: int) -> bool:
         pass
 
-    @abstractmethod
-    def get_group_by_position(self, position: int) -> Group:
-        pass
-
     @abstractmethod
     def get_group(self, position: int) -> Group:
         pass
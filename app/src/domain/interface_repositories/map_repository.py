@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.map import Map
 
 
@@ -9,11 +10,7 @@ class MapRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_maps(self, cursor: int | None, limit: int) -> tuple[list[Map], int, Map | None, Map | None]:
-        pass
-
-    @abstractmethod
-    def select_maps(self, offset: int | None = None, limit: int | None = None) -> list[Map | None]:
+    def paginate_maps(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Map]:
         pass
 
     @abstractmethod
@@ -32,10 +29,6 @@ class MapRepository(ABC):
     def delete_map(self, map_id: int) -> bool:
         pass
 
-    @abstractmethod
-    def get_map_by_position(self, position: int) -> Map:
-        pass
-
     @abstractmethod
     def get_map(self, position: int) -> Map:
         pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.room import Room
 
 
@@ -30,15 +31,5 @@ class RoomRepository(ABC):
 
 
     @abstractmethod
-    def get_room_by_position(self, position: int) -> Room | None:
+    def paginate_rooms_with_tags(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Room]:
         pass
-
-    @abstractmethod
-    def select_rooms_with_tags(self, cursor: int | None, limit: int) -> list[Room]:
-        pass
-
-    @abstractmethod
-    def paginate_rooms_with_tags(self, cursor: int | None, limit: InterruptedError) -> tuple[list[Room], int, Room | None, Room | None]:       
-        pass
-
-
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.room_tag import RoomTag
 
 
@@ -10,11 +11,7 @@ class RoomTagRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_roomtag(self, cursor: int | None, limit: int, active_only: bool = False) -> tuple[list[RoomTag], int, RoomTag | None, RoomTag | None]:
-        pass
-
-    @abstractmethod
-    def select_roomtag(self, offset: int | None = None, limit: int | None = None, active_only: bool = False) -> list[RoomTag | None]:
+    def paginate_roomtag(self, cursor: KeysetCursor | None, limit: int, active_only: bool = False) -> KeysetPage[RoomTag]:
         pass
 
     @abstractmethod
@@ -33,10 +30,6 @@ class RoomTagRepository(ABC):
     def delete_roomtag(self, roomtag_id: int) -> bool:
         pass
 
-    @abstractmethod
-    def get_roomtag_by_position(self, position: int, active_only: bool = False) -> RoomTag:
-        pass
-
     @abstractmethod
     def update_roomtag_by_tag_id_room_id(self, tag_id: int, room_id: int, start_at: datetime, end_at: datetime | None) -> RoomTag:
         pass
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from app.src.common.interval_index import TagWindow
+
+
+class SensorColumn(NamedTuple):
+    """Colonne d'une table de capteurs, pour valider les lignes reçues en lot"""
+    name: str
+    python_type: type
+    default: Any
+    nullable: bool
+
+
+class SensorRepository(ABC):
+    @abstractmethod
+    def distinct_source_addresses(self) -> list[str]:
+        pass
+
+    @abstractmethod
+    def last_seen(self, source_addresses: list[str]) -> dict[str, datetime]:
+        pass
+
+
+class AsyncSensorRepository(ABC):
+    @abstractmethod
+    async def get_all(self, limit: int = 100, windows: list[TagWindow] | None = None) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def get_range(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int | None = None,
+        windows: list[TagWindow] | None = None,
+    ) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def record_columns(self) -> list[SensorColumn]:
+        pass
+
+    @abstractmethod
+    async def copy_records(self, columns: list[str], batches: AsyncIterable[list[tuple]]) -> int:
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.tag import Tag
 
 
@@ -10,11 +11,7 @@ class TagRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_tags(self, cursor: int | None, limit: int, with_rooms: bool = False) -> tuple[list[Tag], int, Tag | None, Tag | None]:
-        pass
-
-    @abstractmethod
-    def select_tags(self, offset: int | None = None, limit: int | None = None, with_rooms: bool = False) -> list[Tag | None]:
+    def paginate_tags(self, cursor: KeysetCursor | None, limit: int, with_rooms: bool = False) -> KeysetPage[Tag]:
         pass
 
     @abstractmethod
@@ -30,15 +27,15 @@ class TagRepository(ABC):
         pass
 
     @abstractmethod
-    def update_tag(self, tag_id: int, tag_data: dict) -> Tag:
+    def select_all_source_addresses(self) -> set[str]:
         pass
 
     @abstractmethod
-    def delete_tag(self, tag_id: int) -> bool:
+    def update_tag(self, tag_id: int, tag_data: dict) -> Tag:
         pass
 
     @abstractmethod
-    def get_tag_by_position(self, position: int) -> Tag:
+    def delete_tag(self, tag_id: int) -> bool:
         pass
 
     @abstractmethod
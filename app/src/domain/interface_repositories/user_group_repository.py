@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.user_group import UserGroup
 
 
@@ -9,11 +10,7 @@ class UserGroupRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_user_groups(self, cursor: int | None, limit: int) -> tuple[list[UserGroup], int, UserGroup | None, UserGroup | None]:
-        pass
-
-    @abstractmethod
-    def select_user_groups(self, offset: int | None = None, limit: int | None = None) -> list[UserGroup | None]:
+    def paginate_user_groups(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[UserGroup]:
         pass
 
     @abstractmethod
@@ -32,10 +29,6 @@ class UserGroupRepository(ABC):
     def delete_user_group(self, user_group_id: int) -> bool:
         pass
 
-    @abstractmethod
-    def get_user_group_by_position(self, position: int) -> UserGroup:
-        pass
-
     @abstractmethod
     def get_user_group(self, position: int) -> UserGroup:
         pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.src.common.pagination import KeysetCursor, KeysetPage
 from app.src.domain.entities.user import User
 
 
@@ -9,7 +10,11 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    def paginate_users(self, cursor: int | None, limit: int) -> tuple[list[User], int, User | None, User | None]:
+    def paginate_users(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[User]:
+        pass
+
+    @abstractmethod
+    def count_all_users(self) -> int:
         pass
 
     @abstractmethod
@@ -119,3 +119,11 @@ class SensorButtonModel(SQLModel, table=True):
     button: int
     event_id: int | None = None
     relevance: float = 1.0
+
+
+# Types de capteurs lissés par les routes de données : clé de la réponse -> (modèle, colonne de valeur)
+SENSOR_KINDS = {
+    "temperature": (SensorTemperatureModel, "temperature"),
+    "humidity": (SensorHumidityModel, "humidity"),
+    "pressure": (SensorPressureModel, "atmospheric_pressure"),
+}
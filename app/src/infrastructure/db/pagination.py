@@ -0,0 +1,77 @@
+"""
+Lecture d'un chunk par clé (keyset) : une seule requête par chunk, quel que soit le rang de la page.
+
+    WHERE (clés) > (curseur) ORDER BY clés ASC LIMIT n + 1     -- next
+    WHERE (clés) < (curseur) ORDER BY clés DESC LIMIT n + 1    -- prev, remis dans l'ordre croissant
+
+La ligne supplémentaire indique s'il existe un chunk au-delà. Les clés doivent former un ordre total
+(clé primaire, ou colonnes terminées par la clé primaire) couvert par un index.
+"""
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlmodel import Session
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.src.common.exception import DecodedFailedError
+from app.src.common.pagination import KeysetCursor, KeysetPage
+
+
+def _key_values(keys: list[InstrumentedAttribute], cursor: KeysetCursor) -> list[Any]:
+    if set(cursor.key) != {key.key for key in keys}:
+        raise DecodedFailedError("pagination cursor", f"Expected keys {[key.key for key in keys]}")
+
+    values = []
+    for key in keys:
+        raw = cursor.key[key.key]
+        python_type = key.type.python_type
+        try:
+            values.append(datetime.fromisoformat(raw) if python_type is datetime else python_type(raw))
+        except (TypeError, ValueError) as e:
+            raise DecodedFailedError("pagination cursor", f"Invalid value for {key.key}") from e
+    return values
+
+
+def paginate_keyset(
+    session: Session,
+    statement: SelectOfScalar,
+    keys: list[InstrumentedAttribute],
+    cursor: KeysetCursor | None,
+    limit: int
+) -> KeysetPage:
+    """
+    statement : select(Model) avec ses filtres, sans ORDER BY ni LIMIT
+    keys : colonnes de tri, ordre total
+    """
+    cursor = cursor or KeysetCursor()
+    backward = cursor.direction == "prev"
+
+    if cursor.key:
+        values = _key_values(keys, cursor)
+        position, values = (keys[0], values[0]) if len(keys) == 1 else (tuple_(*keys), tuple_(*values))
+        statement = statement.where(position < values if backward else position > values)
+
+    statement = statement.order_by(*(key.desc() if backward else key.asc() for key in keys)).limit(limit + 1)
+    rows = list(session.exec(statement).all())
+
+    more = len(rows) > limit
+    rows = rows[:limit]
+    if backward:
+        rows.reverse()
+
+    if not rows:
+        return KeysetPage(items=[], has_next=False, has_prev=False)
+
+    def key_of(row: Any) -> dict[str, Any]:
+        return {key.key: getattr(row, key.key) for key in keys}
+
+    return KeysetPage(
+        items=rows,
+        # Un curseur positionné vient d'un élément de l'autre côté
+        has_next=bool(cursor.key) if backward else more,
+        has_prev=more if backward else bool(cursor.key),
+        first_key=key_of(rows[0]),
+        last_key=key_of(rows[-1]),
+    )
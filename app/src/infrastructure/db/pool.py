@@ -0,0 +1,142 @@
+"""
+Taille des pools de connexions, calculée à partir d'un budget de connexions pour toute l'application.
+
+Chaque worker gunicorn ouvre ses propres pools, un par moteur (bases app et recorded, psycopg2 et asyncpg) :
+    connexions max = workers x moteurs x (pool_size + max_overflow) <= DB_CONNECTION_BUDGET
+Le budget doit rester sous max_connections du serveur PostgreSQL, moins les connexions d'administration
+et des autres clients (migrations, rollups, psql).
+Une requête de données lit les types de capteurs en parallèle, une session par type : chaque pool de la base
+enregistrée doit pouvoir servir ces REQUEST_FAN_OUT connexions. Sans WEB_CONCURRENCY, le nombre de workers est
+limité pour que le budget suffise ; avec, un budget trop petit réduit les pools (avertissement au démarrage).
+Avec un réplica de lecture, les moteurs du réplica ont les mêmes pools : le budget vaut pour chaque serveur.
+"""
+import logging
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.src.infrastructure.db.models.sensor_model import SENSOR_KINDS
+from app.src.presentation.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Moteurs créés par chaque worker (infrastructure/db/session.py)
+ENGINES_PER_WORKER = 4
+# Connexions d'une requête de données sur la base enregistrée : une session par type de capteur, plus celle de la requête
+REQUEST_FAN_OUT = len(SENSOR_KINDS) + 1
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    pool_size: int
+    max_overflow: int
+
+    @property
+    def max_connections(self) -> int:
+        return self.pool_size + self.max_overflow
+
+
+def pool_settings(
+    budget: int,
+    workers: int,
+    engines: int = ENGINES_PER_WORKER,
+    overflow_ratio: float = 0.5,
+    min_connections: int = 1
+) -> PoolSettings:
+    """
+    Part du budget d'un moteur (au moins une connexion), répartie entre connexions gardées ouvertes (pool_size)
+    et connexions temporaires (max_overflow). Une part sous min_connections est loguée : un pool plus petit
+    que les sessions ouvertes en même temps par une requête la fait attendre des connexions libres.
+    """
+    share = budget // max(workers * engines, 1)
+    if share < min_connections:
+        share = max(share, 1)
+        logger.warning(
+            f"DB_CONNECTION_BUDGET={budget} trop petit pour {workers} workers x {engines} moteurs x "
+            f"{min_connections} connexions (il en faut au moins {workers * engines * min_connections}) : "
+            f"pools réduits à {share} connexion(s), moins de workers avec WEB_CONCURRENCY"
+        )
+    max_overflow = min(int(share * overflow_ratio), share - 1)
+    return PoolSettings(pool_size=share - max_overflow, max_overflow=max_overflow)
+
+
+def max_workers(budget: int, engines: int = ENGINES_PER_WORKER, min_connections: int = REQUEST_FAN_OUT) -> int:
+    """Workers dont chaque pool peut servir min_connections connexions sans dépasser le budget"""
+    return max(budget // (engines * min_connections), 1)
+
+
+def worker_count() -> int:
+    """
+    Workers gunicorn : WEB_CONCURRENCY, sinon 2 x CPU + 1 limité à ce que permet DB_CONNECTION_BUDGET.
+    """
+    if settings.WEB_CONCURRENCY:
+        return settings.WEB_CONCURRENCY
+    return min(settings.worker_count, max_workers(settings.DB_CONNECTION_BUDGET))
+
+
+def engine_options(driver: Literal["psycopg2", "asyncpg"], min_connections: int = 1) -> dict[str, Any]:
+    """
+    Arguments de create_engine / create_async_engine communs à tous les moteurs.
+    min_connections : connexions ouvertes en même temps par une requête (REQUEST_FAN_OUT pour la base enregistrée)
+    """
+    pool = pool_settings(
+        settings.DB_CONNECTION_BUDGET,
+        worker_count(),
+        overflow_ratio=settings.DB_POOL_OVERFLOW_RATIO,
+        min_connections=min_connections
+    )
+    options: dict[str, Any] = {
+        "echo": settings.database_echo,
+        "pool_size": pool.pool_size,
+        "max_overflow": pool.max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        options["connect_args"] = (
+            {"options": f"-c statement_timeout={timeout}"}
+            if driver == "psycopg2"
+            else {"server_settings": {"statement_timeout": timeout}}
+        )
+    return options
+
+
+def warm_up(engine: Engine, count: int) -> int:
+    """
+    Ouvre jusqu'à count connexions en même temps puis les rend au pool, qui les garde ouvertes.
+    Limité à pool_size : les connexions en overflow seraient fermées dès leur retour.
+    """
+    count = min(count, engine.pool.size())
+    with ExitStack() as stack:
+        for _ in range(count):
+            stack.enter_context(engine.connect())
+    return count
+
+
+async def async_warm_up(engine: AsyncEngine, count: int) -> int:
+    count = min(count, engine.pool.size())
+    async with AsyncExitStack() as stack:
+        for _ in range(count):
+            await stack.enter_async_context(engine.connect())
+    return count
+
+
+def pool_stats(engines: dict[str, Engine | AsyncEngine]) -> dict[str, dict[str, Any]]:
+    """État des pools du worker courant"""
+    stats = {}
+    for name, engine in engines.items():
+        pool = engine.pool
+        stats[name] = {
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": getattr(pool, "_max_overflow", 0),
+        }
+    return stats
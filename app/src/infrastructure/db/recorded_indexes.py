@@ -0,0 +1,103 @@
+"""
+Index (source_address, time DESC) des tables de capteurs de la base enregistrée.
+
+La base enregistrée n'est pas gérée par Alembic (migrations de la base applicative uniquement) : comme les rollups,
+ces index sont créés par une commande idempotente, à lancer une fois par base :
+    python -m app.src.infrastructure.db.recorded_indexes
+
+Les lectures par balise (filtres source_address / tag_id / room_id, périodes d'affectation, dernières valeurs,
+adresses distinctes) parcourent une plage de cet index par balise, déjà triée par date.
+"""
+import logging
+
+from sqlalchemy import Connection, text
+
+from app.src.infrastructure.db.models.sensor_model import (
+    SensorButtonModel,
+    SensorHumidityModel,
+    SensorMotionModel,
+    SensorNeighborsCountModel,
+    SensorNeighborsDetailModel,
+    SensorPressureModel,
+    SensorTemperatureModel,
+    SensorVoltageModel,
+)
+
+logger = logging.getLogger(__name__)
+
+SENSOR_TABLES: tuple[str, ...] = tuple(
+    model.__tablename__
+    for model in (
+        SensorButtonModel,
+        SensorHumidityModel,
+        SensorMotionModel,
+        SensorNeighborsCountModel,
+        SensorNeighborsDetailModel,
+        SensorPressureModel,
+        SensorTemperatureModel,
+        SensorVoltageModel,
+    )
+)
+
+
+def source_time_index_name(table: str) -> str:
+    # Nom donné par PostgreSQL à CREATE INDEX ON <table> (source_address, time DESC)
+    return f"{table}_source_address_time_idx"
+
+
+def _is_hypertable(connection: Connection, table: str) -> bool:
+    if not connection.execute(text("SELECT to_regclass('timescaledb_information.hypertables') IS NOT NULL")).scalar():
+        return False
+    return connection.execute(
+        text("SELECT EXISTS (SELECT 1 FROM timescaledb_information.hypertables WHERE hypertable_name = :table)"),
+        {"table": table}
+    ).scalar()
+
+
+def create_source_time_indexes(connection: Connection) -> list[str]:
+    """
+    Crée les index manquants et retourne leurs noms. La connexion doit être en autocommit.
+
+    PostgreSQL : CREATE INDEX CONCURRENTLY, sans bloquer les insertions. Un index laissé invalide
+    par une création interrompue est supprimé puis recréé.
+    TimescaleDB : CONCURRENTLY n'est pas supporté sur une hypertable, l'index est créé chunk par chunk,
+    une transaction par chunk (timescaledb.transaction_per_chunk).
+    """
+    created = []
+    for table in SENSOR_TABLES:
+        if not connection.execute(text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}).scalar():
+            logger.warning(f"Table {table} absente, index ignoré")
+            continue
+
+        index = source_time_index_name(table)
+        valid = connection.execute(
+            text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:index)"),
+            {"index": index}
+        ).scalar()
+        if valid:
+            continue
+        if valid is False:
+            connection.execute(text(f"DROP INDEX CONCURRENTLY {index}"))
+
+        if _is_hypertable(connection, table):
+            connection.execute(text(
+                f"CREATE INDEX {index} ON {table} (source_address, time DESC) WITH (timescaledb.transaction_per_chunk)"
+            ))
+        else:
+            connection.execute(text(f"CREATE INDEX CONCURRENTLY {index} ON {table} (source_address, time DESC)"))
+        logger.info(f"Index {index} créé")
+        created.append(index)
+
+    return created
+
+
+if __name__ == "__main__":
+    from app.src.common.logging import setup_logging
+    from app.src.infrastructure.db.session import engine_recorded
+
+    setup_logging()
+
+    with engine_recorded.connect().execution_options(isolation_level="AUTOCOMMIT") as index_connection:
+        # Construction d'index sur une grosse table : pas de statement_timeout
+        index_connection.exec_driver_sql("SET statement_timeout = 0")
+        create_source_time_indexes(index_connection)
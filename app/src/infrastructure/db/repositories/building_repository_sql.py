@@ -6,6 +6,8 @@ from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.building import Building
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.infrastructure.db.models.building_model import BuildingModel
 from app.src.domain.interface_repositories.building_repository import BuildingRepository
 from app.src.common.exception import (
@@ -53,43 +55,14 @@ class SQLBuildingRepository(BuildingRepository):
 
         return Building.from_dict(building_model.model_dump())
 
-    def paginate_buildings(self, cursor: int | None, limit: int) -> tuple[list[Building], int, Building | None, Building | None]:
-
-        buildings = self.select_buildings(cursor, limit)
-        total = self.count_all_buildings()
-        first_building = self.get_building_by_position(0)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
-        )
-
-        last_building = self.get_building_by_position(last_page_offset)
-
-        return buildings, total, first_building, last_building
-
-    def select_buildings(self, cursor: int | None, limit: int) -> list[Building]:
-        statement = select(BuildingModel).order_by(BuildingModel.id)
-        if cursor:
-            statement = statement.where(BuildingModel.id >= cursor)
-        statement = statement.limit(limit)
-
-        results = self.session.exec(statement).all()
-        return [Building(**building.model_dump()) for building in results]
+    def paginate_buildings(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Building]:
+        page = paginate_keyset(self.session, select(BuildingModel), [BuildingModel.id], cursor, limit)
+        return page.map(lambda building: Building(**building.model_dump()))
 
     def count_all_buildings(self) -> int:
         total = self.session.exec(select(func.count()).select_from(BuildingModel)).one()
         return total
 
-    def get_building_by_position(self, position: int) -> Building | None:
-        if position >= 0:
-            statement = select(BuildingModel).order_by(BuildingModel.id.asc()).offset(position).limit(1)
-        else:
-            statement = select(BuildingModel).order_by(BuildingModel.id.desc()).offset(abs(position) - 1).limit(1)
-
-        result = self.session.exec(statement).first()
-        return Building(**result.model_dump()) if result else None
-
     def select_building_by_id(self, building_id: int) -> Building:
         building_model = self.session.get(BuildingModel, building_id)
         if not building_model:
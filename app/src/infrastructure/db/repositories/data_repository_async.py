@@ -0,0 +1,342 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.src.common.interval_index import TagWindow
+from app.src.domain.interface_repositories.data_repository import AsyncDataRepository
+from app.src.infrastructure.db.models.sensor_model import SENSOR_KINDS
+from app.src.infrastructure.db.repositories.sensor_data_queries import SensorDataQueries
+from app.src.infrastructure.db.repositories.sensor_repository_async import AsyncSQLSensorRepository
+from app.src.infrastructure.db.repositories.sensor_repository_sql import SQLSensorRepository
+from app.src.infrastructure.db.rollups import iter_rollup, rollup_has_sketches, select_rollup
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncSQLDataRepository(AsyncDataRepository):
+    """
+    Données capteurs par pièce, sur des sessions asyncpg.
+
+    Les requêtes de SensorDataQueries sont exécutées avec AsyncSession.run_sync : le code synchrone
+    tourne dans un greenlet et chaque aller-retour avec PostgreSQL rend la main à la boucle d'événements.
+    Les types de capteurs sont lus en parallèle (asyncio.gather), chacun sur sa propre session.
+
+    En mode python, le lissage et les quantiles (calcul Python) sont exécutés dans executor
+    (executor par défaut de la boucle si None) : seules les lectures restent sur la boucle d'événements.
+    """
+
+    def __init__(
+        self,
+        session_app: AsyncSession,
+        session_recorded: AsyncSession,
+        aggregation_mode: str = "python",
+        use_rollups: bool = False,
+        executor: Executor | None = None
+    ):
+        self.session_app = session_app
+        self.session_recorded = session_recorded
+        self.aggregation_mode = aggregation_mode
+        self.use_rollups = use_rollups
+        self.executor = executor
+
+    async def get_rooms_with_sensor_data(
+        self,
+        room_ids: list[int] | None = None,
+        first_value_date: datetime | None = None,
+        smooth_interval_minutes: int = 30,
+        since: datetime | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> list[dict[str, Any]]:
+        try:
+            rooms_data = await self._get_rooms_tags(room_ids, first_value_date)
+
+            sensor_data_by_room = await self._get_rooms_sensor_data(
+                {room_id: room_info["windows"] for room_id, room_info in rooms_data.items()},
+                first_value_date,
+                smooth_interval_minutes,
+                since,
+                quantiles,
+                with_stats
+            )
+
+            return [
+                self._queries().build_room_data(room_info, sensor_data_by_room.get(room_id, {}))
+                for room_id, room_info in rooms_data.items()
+            ]
+
+        except Exception as e:
+            logger.error(f"Erreur lors de la récupération des données: {e}")
+            raise
+
+    async def iter_rooms_with_sensor_data(
+        self,
+        room_ids: list[int] | None = None,
+        first_value_date: datetime | None = None,
+        smooth_interval_minutes: int = 30,
+        since: datetime | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Version streaming : les pièces sont traitées une par une (par id croissant),
+        seules les données capteurs de la pièce en cours sont en mémoire.
+        """
+        try:
+            rooms_data = await self._get_rooms_tags(room_ids, first_value_date)
+
+            for room_id in sorted(rooms_data):
+                room_info = rooms_data.pop(room_id)
+                sensor_data = await self._get_rooms_sensor_data(
+                    {room_id: room_info["windows"]},
+                    first_value_date,
+                    smooth_interval_minutes,
+                    since,
+                    quantiles,
+                    with_stats
+                )
+                yield self._queries().build_room_data(room_info, sensor_data.get(room_id, {}))
+
+        except Exception as e:
+            logger.error(f"Erreur lors du streaming des données: {e}")
+            raise
+        finally:
+            # Le corps d'une StreamingResponse est envoyé après la fermeture des dépendances FastAPI :
+            # on rend ici les connexions rouvertes par le générateur
+            await self.session_app.close()
+            await self.session_recorded.close()
+
+    async def get_rooms_latest_values(
+        self,
+        room_ids: list[int] | None = None,
+        building_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Valeur courante de chaque type de capteur par pièce : moyenne des dernières mesures des balises
+        actuellement affectées, avec la date de la plus récente.
+        """
+        try:
+            rooms, room_windows = await self.session_app.run_sync(
+                lambda session: self._queries(session_app=session).get_active_windows(room_ids, building_id)
+            )
+            return await self.session_recorded.run_sync(
+                lambda session: self._queries(session_recorded=session).get_latest_values(rooms, room_windows)
+            )
+
+        except Exception as e:
+            logger.error(f"Erreur lors de la lecture des dernières valeurs: {e}")
+            raise
+
+    async def get_tag_windows(self, tag_id: int | None = None, room_id: int | None = None) -> list[TagWindow]:
+        return await self.session_app.run_sync(
+            lambda session: self._queries(session_app=session).get_tag_windows(tag_id, room_id)
+        )
+
+    def _queries(self, session_app: Session | None = None, session_recorded: Session | None = None) -> SensorDataQueries:
+        return SensorDataQueries(session_app, session_recorded, self.aggregation_mode)
+
+    async def _get_rooms_tags(
+        self,
+        room_ids: list[int] | None,
+        first_value_date: datetime | None
+    ) -> dict[int, dict[str, Any]]:
+        return await self.session_app.run_sync(
+            lambda session: self._queries(session_app=session).get_rooms_tags(room_ids, first_value_date)
+        )
+
+    async def _get_rooms_sensor_data(
+        self,
+        room_windows: dict[int, list[TagWindow]],
+        first_value_date: datetime | None,
+        smooth_interval_minutes: int,
+        since: datetime | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Une requête par type de capteur pour toutes les pièces, puis répartition par pièce :
+        une mesure ne compte que pour les pièces où sa balise était affectée à cet instant.
+        Avec since (dernier point déjà reçu par le client), seuls les points suivants sont calculés.
+        Les statistiques et quantiles sur la période portent sur toute la période (depuis first_value_date) :
+        ils ne se déduisent pas des seuls nouveaux points et sont recalculés par la base, sauf sans with_stats.
+        Avec quantiles, chaque type de capteur a aussi ses quantiles sur la période et par intervalle.
+        """
+        room_windows = {
+            room_id: list(dict.fromkeys(windows))
+            for room_id, windows in room_windows.items()
+            if windows
+        }
+        result = {room_id: {} for room_id in room_windows}
+        if not room_windows:
+            return result
+
+        keys = list(SENSOR_KINDS)
+        data_by_kind = await asyncio.gather(*(
+            self._get_sensor_type_data(
+                *SENSOR_KINDS[key], room_windows, first_value_date, smooth_interval_minutes, since, quantiles, with_stats
+            )
+            for key in keys
+        ))
+
+        for key, sensor_data_by_room in zip(keys, data_by_kind, strict=True):
+            for room_id, sensor_data in sensor_data_by_room.items():
+                result[room_id][key] = sensor_data
+
+        return result
+
+    async def _get_sensor_type_data(
+        self,
+        model_class,
+        value_field: str,
+        room_windows: dict[int, list[TagWindow]],
+        first_value_date: datetime | None,
+        smooth_interval_minutes: int,
+        since: datetime | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> dict[int, dict[str, Any]]:
+        args = (model_class, value_field, room_windows, first_value_date, smooth_interval_minutes, since, quantiles, with_stats)
+        # Une AsyncSession ne supporte pas les requêtes concurrentes : une session (et une connexion) par type
+        async with AsyncSession(self.session_recorded.bind) as session:
+            if self.aggregation_mode != "python":
+                # Lissage calculé par la base : il ne reste que des lectures, exécutées avec run_sync
+                return await session.run_sync(
+                    lambda sync_session: self._queries(session_recorded=sync_session).get_sensor_type_data_in_db(*args)
+                )
+
+            rollup = select_rollup(smooth_interval_minutes) if self.use_rollups else None
+            # En mode incrémental, les quantiles sont calculés par la base sur les mesures brutes
+            if rollup and quantiles and not since and not await session.run_sync(
+                lambda sync_session: rollup_has_sketches(sync_session, model_class.__tablename__, rollup[0])
+            ):
+                rollup = None
+            if since:
+                return await self._get_sensor_type_data_after(session, *args, rollup[0] if rollup else None)
+            if rollup:
+                return await self._get_sensor_type_data_from_rollup(session, rollup[0], *args[:5], quantiles)
+
+            try:
+                queries = self._queries()
+                sensor_repository = AsyncSQLSensorRepository(session, model_class, "time")
+
+                # Une passe sur le curseur : chaque paquet lu est ajouté au lissage (statistiques, quantiles)
+                # dans l'executor pendant que la boucle reste libre
+                values_pass = queries.values_pass(room_windows, smooth_interval_minutes, quantiles)
+                async for rows in sensor_repository.iter_value_chunks(
+                    value_field,
+                    start=first_value_date,
+                    windows=queries.all_windows(room_windows)
+                ):
+                    await self._compute(queries.add_values, values_pass, rows)
+                return await self._compute(queries.values_pass_result, values_pass)
+
+            except Exception as e:
+                logger.error(f"Erreur lors du traitement des données {value_field}: {e}")
+                return {}
+
+    async def _get_sensor_type_data_from_rollup(
+        self,
+        session: AsyncSession,
+        rollup_suffix: str,
+        model_class,
+        value_field: str,
+        room_windows: dict[int, list[TagWindow]],
+        first_value_date: datetime | None,
+        smooth_interval_minutes: int,
+        quantiles: bool
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Même traitement que sur les données brutes, à partir des moyennes par intervalle du rollup.
+        Les quantiles fusionnent les sketches des intervalles du rollup.
+        """
+        queries = self._queries()
+        try:
+            rows = await session.run_sync(lambda sync_session: list(iter_rollup(
+                sync_session,
+                model_class.__tablename__,
+                rollup_suffix,
+                queries.all_windows(room_windows),
+                first_value_date,
+                with_sketches=quantiles
+            )))
+            return await self._compute(
+                queries.sensor_type_data_from_rollup_rows, rows, room_windows, smooth_interval_minutes, quantiles
+            )
+
+        except Exception as e:
+            logger.error(f"Erreur lors de la lecture du rollup {rollup_suffix} des données {value_field}: {e}")
+            return {}
+
+    async def _get_sensor_type_data_after(
+        self,
+        session: AsyncSession,
+        model_class,
+        value_field: str,
+        room_windows: dict[int, list[TagWindow]],
+        first_value_date: datetime | None,
+        smooth_interval_minutes: int,
+        since: datetime,
+        quantiles: bool,
+        with_stats: bool,
+        rollup_suffix: str | None = None
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Mode incrémental : statistiques calculées par la base, lissage des seuls points postérieurs à since
+        à partir de la dernière mesure de chaque balise à since ou avant.
+        Avec rollup_suffix, le lissage part des intervalles du rollup à partir de celui de since, précédés du dernier
+        intervalle de chaque affectation.
+        Sans with_stats, aucune mesure antérieure à since n'est lue (hors dernière mesure de chaque balise).
+        Lectures sur la session, calcul dans l'executor.
+        """
+        table = model_class.__tablename__
+        try:
+            stats_rows = []
+            if with_stats:
+                stats_rows = await session.run_sync(lambda sync_session: self._queries(
+                    session_recorded=sync_session
+                ).get_stats_in_db(table, value_field, room_windows, first_value_date))
+                if not stats_rows:
+                    return {}
+
+            queries = self._queries()
+            windows = queries.all_windows(room_windows)
+            if rollup_suffix:
+                start = queries.interval_start(since, smooth_interval_minutes, first_value_date)
+                anchors = queries.windows_from(windows, first_value_date)
+                rows = await session.run_sync(lambda sync_session: list(
+                    iter_rollup(sync_session, table, rollup_suffix, windows, start, anchors=anchors)
+                ))
+                data_by_room = await self._compute(
+                    queries.smooth_rollup_rows_after, rows, room_windows, smooth_interval_minutes, since
+                )
+            else:
+                values = await session.run_sync(lambda sync_session: list(SQLSensorRepository(
+                    sync_session, model_class, "time"
+                ).iter_values_after(value_field, windows, since, first_value_date)))
+                data_by_room = await self._compute(queries.smooth_after, room_windows, smooth_interval_minutes, since, values)
+
+            room_quantiles = None
+            if quantiles:
+                sketch_rows = await session.run_sync(lambda sync_session: list(self._queries(
+                    session_recorded=sync_session
+                ).get_sketch_rows(table, value_field, room_windows, first_value_date, smooth_interval_minutes, since, with_stats)))
+                room_quantiles = await self._compute(
+                    queries.quantiles_from_sketch_rows, sketch_rows, room_windows, smooth_interval_minutes
+                )
+            return queries.result_after(data_by_room, stats_rows, room_quantiles, since, with_stats)
+
+        except Exception as e:
+            logger.error(f"Erreur lors du traitement incrémental des données {value_field}: {e}")
+            return {}
+
+    async def _compute(self, function: Callable[..., T], *args) -> T:
+        """Calcul Python (lissage, quantiles) hors de la boucle d'événements"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
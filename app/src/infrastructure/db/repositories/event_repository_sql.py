@@ -6,6 +6,8 @@ from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.event import Event
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.infrastructure.db.models.event_model import EventModel
 from app.src.domain.interface_repositories.event_repository import EventRepository
 from app.src.common.exception import (
@@ -47,43 +49,14 @@ class SQLEventRepository(EventRepository):
 
         return Event.from_dict(event_model.model_dump())
 
-    def paginate_events(self, cursor: int | None, limit: int) -> tuple[list[Event], int, Event | None, Event | None]:
-
-        events = self.select_events(cursor, limit)
-        total = self.count_all_events()
-        first_event = self.get_event_by_position(0)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
-        )
-
-        last_event = self.get_event_by_position(last_page_offset)
-
-        return events, total, first_event, last_event
-
-    def select_events(self, cursor: int | None, limit: int) -> list[Event]:
-        statement = select(EventModel).order_by(EventModel.id)
-        if cursor:
-            statement = statement.where(EventModel.id >= cursor)
-        statement = statement.limit(limit)
-
-        results = self.session.exec(statement).all()
-        return [Event(**event.model_dump()) for event in results]
+    def paginate_events(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Event]:
+        page = paginate_keyset(self.session, select(EventModel), [EventModel.id], cursor, limit)
+        return page.map(lambda event: Event(**event.model_dump()))
 
     def count_all_events(self) -> int:
         total = self.session.exec(select(func.count()).select_from(EventModel)).one()
         return total
 
-    def get_event_by_position(self, position: int) -> Event | None:
-        if position >= 0:
-            statement = select(EventModel).order_by(EventModel.id.asc()).offset(position).limit(1)
-        else:
-            statement = select(EventModel).order_by(EventModel.id.desc()).offset(abs(position) - 1).limit(1)
-
-        result = self.session.exec(statement).first()
-        return Event(**result.model_dump()) if result else None
-
     def select_event_by_id(self, event_id: int) -> Event:
         event_model = self.session.get(EventModel, event_id)
         if not event_model:
@@ -6,6 +6,8 @@ from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.event_room import EventRoom
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.infrastructure.db.models.event_room_model import EventRoomModel
 from app.src.domain.interface_repositories.event_room_repository import EventRoomRepository
 from app.src.common.exception import (
@@ -48,43 +50,14 @@ class SQLEventRoomRepository(EventRoomRepository):
 
         return EventRoom.from_dict(event_room_model.model_dump())
 
-    def paginate_event_rooms(self, cursor: int | None, limit: int) -> tuple[list[EventRoom], int, EventRoom | None, EventRoom | None]:
-
-        event_rooms = self.select_event_rooms(cursor, limit)
-        total = self.count_all_event_rooms()
-        first_event_room = self.get_event_room_by_position(0)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
-        )
-
-        last_event_room = self.get_event_room_by_position(last_page_offset)
-
-        return event_rooms, total, first_event_room, last_event_room
-
-    def select_event_rooms(self, cursor: int | None, limit: int) -> list[EventRoom]:
-        statement = select(EventRoomModel).order_by(EventRoomModel.id)
-        if cursor:
-            statement = statement.where(EventRoomModel.id >= cursor)
-        statement = statement.limit(limit)
-
-        results = self.session.exec(statement).all()
-        return [EventRoom(**event_room.model_dump()) for event_room in results]
+    def paginate_event_rooms(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[EventRoom]:
+        page = paginate_keyset(self.session, select(EventRoomModel), [EventRoomModel.id], cursor, limit)
+        return page.map(lambda event_room: EventRoom(**event_room.model_dump()))
 
     def count_all_event_rooms(self) -> int:
         total = self.session.exec(select(func.count()).select_from(EventRoomModel)).one()
         return total
 
-    def get_event_room_by_position(self, position: int) -> EventRoom | None:
-        if position >= 0:
-            statement = select(EventRoomModel).order_by(EventRoomModel.id.asc()).offset(position).limit(1)
-        else:
-            statement = select(EventRoomModel).order_by(EventRoomModel.id.desc()).offset(abs(position) - 1).limit(1)
-
-        result = self.session.exec(statement).first()
-        return EventRoom(**result.model_dump()) if result else None
-
     def select_event_room_by_id(self, event_room_id: int) -> EventRoom:
         event_room_model = self.session.get(EventRoomModel, event_room_id)
         if not event_room_model:
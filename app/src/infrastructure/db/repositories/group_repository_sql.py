@@ -6,6 +6,8 @@ from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.group import Group
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.infrastructure.db.models.group_model import GroupModel
 from app.src.domain.interface_repositories.group_repository import GroupRepository
 from app.src.common.exception import (
@@ -49,43 +51,14 @@ class SQLGroupRepository(GroupRepository):
 
         return Group.from_dict(group_model.model_dump())
 
-    def paginate_groups(self, cursor: int | None, limit: int) -> tuple[list[Group], int, Group | None, Group | None]:
-
-        groups = self.select_groups(cursor, limit)
-        total = self.count_all_groups()
-        first_group = self.get_group_by_position(0)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
-        )
-
-        last_group = self.get_group_by_position(last_page_offset)
-
-        return groups, total, first_group, last_group
-
-    def select_groups(self, cursor: int | None, limit: int) -> list[Group]:
-        statement = select(GroupModel).order_by(GroupModel.id)
-        if cursor:
-            statement = statement.where(GroupModel.id >= cursor)
-        statement = statement.limit(limit)
-
-        results = self.session.exec(statement).all()
-        return [Group(**group.model_dump()) for group in results]
+    def paginate_groups(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Group]:
+        page = paginate_keyset(self.session, select(GroupModel), [GroupModel.id], cursor, limit)
+        return page.map(lambda group: Group(**group.model_dump()))
 
     def count_all_groups(self) -> int:
         total = self.session.exec(select(func.count()).select_from(GroupModel)).one()
         return total
 
-    def get_group_by_position(self, position: int) -> Group | None:
-        if position >= 0:
-            statement = select(GroupModel).order_by(GroupModel.id.asc()).offset(position).limit(1)
-        else:
-            statement = select(GroupModel).order_by(GroupModel.id.desc()).offset(abs(position) - 1).limit(1)
-
-        result = self.session.exec(statement).first()
-        return Group(**result.model_dump()) if result else None
-
     def select_group_by_id(self, group_id: int) -> Group:
         group_model = self.session.get(GroupModel, group_id)
         if not group_model:
@@ -6,6 +6,8 @@ from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.map import Map
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.infrastructure.db.models.map_model import MapModel
 from app.src.domain.interface_repositories.map_repository import MapRepository
 from app.src.common.exception import (
@@ -51,43 +53,14 @@ class SQLMapRepository(MapRepository):
 
         return Map.from_dict(map_model.model_dump())
 
-    def paginate_maps(self, cursor: int | None, limit: int) -> tuple[list[Map], int, Map | None, Map | None]:
-
-        maps = self.select_maps(cursor, limit)
-        total = self.count_all_maps()
-        first_map = self.get_map_by_position(0)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
-        )
-
-        last_map = self.get_map_by_position(last_page_offset)
-
-        return maps, total, first_map, last_map
-
-    def select_maps(self, cursor: int | None, limit: int) -> list[Map]:
-        statement = select(MapModel).order_by(MapModel.id)
-        if cursor:
-            statement = statement.where(MapModel.id >= cursor)
-        statement = statement.limit(limit)
-
-        results = self.session.exec(statement).all()
-        return [Map(**map.model_dump()) for map in results]
+    def paginate_maps(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Map]:
+        page = paginate_keyset(self.session, select(MapModel), [MapModel.id], cursor, limit)
+        return page.map(lambda map_model: Map(**map_model.model_dump()))
 
     def count_all_maps(self) -> int:
         total = self.session.exec(select(func.count()).select_from(MapModel)).one()
         return total
 
-    def get_map_by_position(self, position: int) -> Map | None:
-        if position >= 0:
-            statement = select(MapModel).order_by(MapModel.id.asc()).offset(position).limit(1)
-        else:
-            statement = select(MapModel).order_by(MapModel.id.desc()).offset(abs(position) - 1).limit(1)
-
-        result = self.session.exec(statement).first()
-        return Map(**result.model_dump()) if result else None
-
     def select_map_by_id(self, map_id: int) -> Map:
         map_model = self.session.get(MapModel, map_id)
         if not map_model:
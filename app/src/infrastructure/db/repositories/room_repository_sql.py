@@ -2,11 +2,15 @@ import logging
 
 from psycopg2 import errors
 from sqlalchemy import func, text
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.room import Room
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.infrastructure.db.models.room_model import RoomModel
+from app.src.infrastructure.db.models.room_tag_model import RoomTagModel
 from app.src.domain.interface_repositories.room_repository import RoomRepository
 from app.src.common.exception import (
     CreationFailedError,
@@ -19,6 +23,10 @@ from app.src.common.exception import (
 
 logger = logging.getLogger(__name__)
 
+def with_tags_option():
+    # Liens pièce-tag d'une page de pièces en une requête (IN), tags joints : 2 requêtes par page
+    return selectinload(RoomModel.room_tags).joinedload(RoomTagModel.tag)
+
 
 class SQLRoomRepository(RoomRepository):
     def __init__(self, session: Session):
@@ -153,32 +161,11 @@ class SQLRoomRepository(RoomRepository):
 
 
 
-    def paginate_rooms_with_tags(self, cursor: int | None, limit: InterruptedError) -> tuple[list[Room], int, Room | None, Room | None]:       
-        tags = self.select_rooms_with_tags(cursor, limit)
-        total = self.count_all_rooms()
-        first_tag = self.get_room_by_position(0)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
-        )
-
-        last_tag = self.get_room_by_position(last_page_offset)
-
-        return tags, total, first_tag, last_tag
-
-
-    def select_rooms_with_tags(self, cursor: int | None, limit: int) -> list[Room]:
-        statement = select(RoomModel).order_by(RoomModel.id)
-
-        if cursor:
-            statement = statement.where(RoomModel.id >= cursor)
-        statement = statement.limit(limit)
+    def paginate_rooms_with_tags(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[Room]:
+        page = paginate_keyset(self.session, select(RoomModel).options(with_tags_option()), [RoomModel.id], cursor, limit)
 
-        results = self.session.exec(statement).all()
-  
-        return [
-            Room(
+        return page.map(
+            lambda room: Room(
                 **room.model_dump(),
                 tags=[
                     {
@@ -188,18 +175,5 @@ class SQLRoomRepository(RoomRepository):
                     for room_tag in room.room_tags
                 ],
             )
-            for room in results
-        ]
-
-
-
-
-    def get_room_by_position(self, position: int) -> Room | None:
-        if position >= 0:
-            statement = select(RoomModel).order_by(RoomModel.id.asc()).offset(position).limit(1)
-        else:
-            statement = select(RoomModel).order_by(RoomModel.id.desc()).offset(abs(position) - 1).limit(1)
-
-        result = self.session.exec(statement).first()
-        return Room(**result.model_dump()) if result else None
+        )
 
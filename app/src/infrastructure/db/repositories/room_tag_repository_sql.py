@@ -7,6 +7,8 @@ from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.room_tag import RoomTag
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.domain.interface_repositories.room_tag_repository import RoomTagRepository
 from app.src.infrastructure.db.models.room_tag_model import RoomTagModel
 from app.src.common.exception import (
@@ -67,71 +69,31 @@ class SQLRoomTagRepository(RoomTagRepository):
     
 
 
-    def paginate_roomtag(self, cursor: int | None, limit: int, active_only: bool = False) -> tuple[list[RoomTag], int, RoomTag | None, RoomTag | None]:
-        room_tags = self.select_roomtag(cursor, limit, active_only)
-        total = self.count_all_roomtag(active_only)
-        first_room_tag = self.get_roomtag_by_position(0, active_only)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
+    @staticmethod
+    def _active_condition():
+        now = datetime.now()
+        return and_(
+            or_(RoomTagModel.start_at.is_(None), RoomTagModel.start_at <= now),
+            or_(RoomTagModel.end_at.is_(None), RoomTagModel.end_at >= now)
         )
-        last_room_tag = self.get_roomtag_by_position(last_page_offset, active_only)
 
-        return room_tags, total, first_room_tag, last_room_tag
-
-
-    def select_roomtag(self, cursor: int | None, limit: int, active_only: bool = False) -> list[RoomTag]:
-        statement = select(RoomTagModel).order_by(RoomTagModel.id)
-        if cursor:
-            statement = statement.where(RoomTagModel.id >= cursor)
 
+    def paginate_roomtag(self, cursor: KeysetCursor | None, limit: int, active_only: bool = False) -> KeysetPage[RoomTag]:
+        statement = select(RoomTagModel)
         if active_only:
-            now = datetime.now()
-            statement = statement.where(
-                and_(
-                    or_(RoomTagModel.start_at is None, RoomTagModel.start_at <= now),
-                    or_(RoomTagModel.end_at is None, RoomTagModel.end_at >= now)
-                )
-            )
+            statement = statement.where(self._active_condition())
 
-        statement = statement.limit(limit)
-        results = self.session.exec(statement).all()
-        return [RoomTag(**room_tag.model_dump()) for room_tag in results]
+        page = paginate_keyset(self.session, statement, [RoomTagModel.id], cursor, limit)
+        return page.map(lambda room_tag: RoomTag(**room_tag.model_dump()))
 
 
     def count_all_roomtag(self, active_only: bool = False) -> int:
         statement = select(func.count()).select_from(RoomTagModel)
         if active_only:
-            now = datetime.now()
-            statement = statement.where(
-                and_(
-                    or_(RoomTagModel.start_at is None, RoomTagModel.start_at <= now),
-                    or_(RoomTagModel.end_at is None, RoomTagModel.end_at >= now)
-                )
-            )
+            statement = statement.where(self._active_condition())
         return self.session.exec(statement).one()
 
 
-    def get_roomtag_by_position(self, position: int, active_only: bool = False) -> RoomTag | None:
-        if position >= 0:
-            statement = select(RoomTagModel).order_by(RoomTagModel.id.asc()).offset(position).limit(1)
-        else:
-            statement = select(RoomTagModel).order_by(RoomTagModel.id.desc()).offset(abs(position) - 1).limit(1)
-
-        if active_only:
-            now = datetime.now()
-            statement = statement.where(
-                and_(
-                    or_(RoomTagModel.start_at is None, RoomTagModel.start_at <= now),
-                    or_(RoomTagModel.end_at is None, RoomTagModel.end_at >= now)
-                )
-            )
-
-        result = self.session.exec(statement).first()
-        return RoomTag(**result.model_dump()) if result else None
-
-
     def select_roomtag_by_id(self, tag_id: int) -> RoomTag:
         tag_model = self.session.get(RoomTagModel, tag_id)
         if not tag_model:
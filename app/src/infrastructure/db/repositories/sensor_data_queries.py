@@ -0,0 +1,728 @@
+import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.src.common.exception import NotFoundError
+from app.src.common.interval_index import TagWindow, tag_window_index
+from app.src.common.quantile_sketch import RoomQuantiles, sketch_bin_sql
+from app.src.common.time_series import (
+    RunningStats,
+    StreamingSmoother,
+    grid_start,
+    smooth_and_aggregate,
+    to_data_points,
+    to_epoch_us,
+)
+from app.src.common.utils import as_utc
+
+from app.src.infrastructure.db.models.room_model import RoomModel
+from app.src.infrastructure.db.models.room_tag_model import RoomTagModel
+from app.src.infrastructure.db.models.sensor_model import SENSOR_KINDS
+from app.src.infrastructure.db.models.tag_model import TagModel
+
+logger = logging.getLogger(__name__)
+
+# Affectations pièce -> balise sur [start_at, end_at), passées en tableaux pour ne faire qu'une requête
+# pour toutes les pièces
+_MAPPING_CTE = """
+    mapping AS (
+        SELECT DISTINCT room_id, source_address, start_at, end_at
+        FROM unnest(CAST(:room_ids AS integer[]), CAST(:sources AS text[]),
+                    CAST(:starts AS timestamptz[]), CAST(:ends AS timestamptz[])) AS m(room_id, source_address, start_at, end_at)
+    )
+"""
+
+_STATS_QUERY = """
+    WITH {mapping}
+    SELECT m.room_id, min(t.time) AS first_time, max(t.time) AS last_time,
+           min(t.{column}) AS min, max(t.{column}) AS max, avg(t.{column}) AS average,
+           count(t.{column}) AS nombre_values
+    FROM mapping AS m
+    JOIN {table} AS t ON t.source_address = m.source_address AND t.time >= m.start_at AND t.time < m.end_at
+    WHERE t.{column} IS NOT NULL {since}
+    GROUP BY m.room_id
+"""
+
+# Même lissage que le mode Python : pour chaque point de la grille de la pièce et chaque affectation,
+# mesure précédente / suivante dans la période (index source_address, time) puis interpolation linéaire.
+_SQL_SERIES_QUERY = """
+    WITH {mapping},
+    bounds AS (
+        SELECT *
+        FROM unnest(CAST(:bound_room_ids AS integer[]), CAST(:grid_starts AS timestamptz[]),
+                    CAST(:grid_ends AS timestamptz[])) AS r(room_id, grid_start, grid_end)
+    )
+    SELECT r.room_id, g.bucket, avg(
+        CASE
+            WHEN b.time IS NULL THEN a.value
+            WHEN a.time IS NULL OR b.time = g.bucket THEN b.value
+            ELSE round((b.value + (a.value - b.value)
+                * extract(epoch FROM g.bucket - b.time) / extract(epoch FROM a.time - b.time))::numeric, 2)::float8
+        END
+    ) AS value
+    FROM bounds AS r
+    CROSS JOIN LATERAL generate_series(r.grid_start, r.grid_end, make_interval(mins => :interval)) AS g(bucket)
+    JOIN mapping AS m ON m.room_id = r.room_id
+    LEFT JOIN LATERAL (
+        SELECT time, {column}::float8 AS value FROM {table}
+        WHERE source_address = m.source_address AND time <= g.bucket AND {column} IS NOT NULL {since}
+          AND time >= m.start_at AND time < m.end_at
+        ORDER BY time DESC LIMIT 1
+    ) AS b ON true
+    LEFT JOIN LATERAL (
+        SELECT time, {column}::float8 AS value FROM {table}
+        WHERE source_address = m.source_address AND time > g.bucket AND {column} IS NOT NULL {since}
+          AND time >= m.start_at AND time < m.end_at
+        ORDER BY time LIMIT 1
+    ) AS a ON true
+    GROUP BY r.room_id, g.bucket
+    HAVING count(b.time) + count(a.time) > 0
+    ORDER BY r.room_id, g.bucket
+"""
+
+# Moyenne par intervalle et par affectation, trous interpolés (interpolate) puis prolongés (locf)
+_TIMESCALE_SERIES_QUERY = """
+    WITH {mapping},
+    bounds AS (
+        SELECT *
+        FROM unnest(CAST(:bound_room_ids AS integer[]), CAST(:grid_ends AS timestamptz[])) AS r(room_id, grid_end)
+    ),
+    per_window AS (
+        SELECT time_bucket_gapfill(
+                   CAST(:bucket_width AS interval), t.time,
+                   CAST(:series_start AS timestamptz), CAST(:series_end AS timestamptz)
+               ) AS bucket,
+               m.room_id, m.source_address, m.start_at,
+               interpolate(avg(t.{column})::float8) AS interpolated,
+               locf(avg(t.{column})::float8) AS carried
+        FROM {table} AS t
+        JOIN mapping AS m ON m.source_address = t.source_address AND t.time >= m.start_at AND t.time < m.end_at
+        WHERE t.{column} IS NOT NULL AND t.time >= :series_start AND t.time < :series_end
+        GROUP BY bucket, m.room_id, m.source_address, m.start_at
+    )
+    SELECT p.room_id, p.bucket, avg(coalesce(p.interpolated, p.carried)) AS value
+    FROM per_window AS p
+    JOIN bounds AS r ON r.room_id = p.room_id AND p.bucket <= r.grid_end {since}
+    GROUP BY p.room_id, p.bucket
+    HAVING count(coalesce(p.interpolated, p.carried)) > 0
+    ORDER BY p.room_id, p.bucket
+"""
+
+# Sketch de quantiles par pièce, par intervalle (aligné sur l'epoch) et par bin : seuls les compteurs sont renvoyés
+_SKETCH_QUERY = """
+    WITH {mapping}
+    SELECT m.room_id, {bucket} AS bucket, {sketch_bin} AS sketch_bin, count(*) AS value_count
+    FROM mapping AS m
+    JOIN {table} AS t ON t.source_address = m.source_address AND t.time >= m.start_at AND t.time < m.end_at
+    WHERE t.{column} IS NOT NULL {since}
+    GROUP BY 1, 2, 3
+"""
+
+# Dernière mesure de chaque affectation active (une lecture d'index par balise et par type),
+# moyenne des balises par pièce
+_LATEST_VALUES_QUERY = """
+    WITH {mapping}
+    SELECT m.room_id, {columns}
+    FROM mapping AS m
+    {laterals}
+    GROUP BY m.room_id
+"""
+
+_LATEST_VALUE_LATERAL = """
+    LEFT JOIN LATERAL (
+        SELECT time, {column}::float8 AS value FROM {table}
+        WHERE source_address = m.source_address AND {column} IS NOT NULL
+          AND time >= m.start_at AND time < m.end_at
+        ORDER BY time DESC LIMIT 1
+    ) AS {key} ON true
+"""
+
+
+class SensorDataQueries:
+    """
+    Requêtes et calculs des données capteurs par pièce, utilisés par AsyncSQLDataRepository.
+
+    Les requêtes sont synchrones (exécutées avec AsyncSession.run_sync) ; les méthodes de calcul
+    (values_pass, add_values, smooth_after, ...) ne lisent pas la base et peuvent tourner dans un executor.
+    Chaque session peut être None si aucune requête correspondante n'est faite.
+    """
+
+    def __init__(
+        self,
+        session_app: Session | None = None,
+        session_recorded: Session | None = None,
+        aggregation_mode: str = "python"
+    ):
+        self.session_app = session_app
+        self.session_recorded = session_recorded
+        self.aggregation_mode = aggregation_mode
+
+    def get_tag_windows(self, tag_id: int | None = None, room_id: int | None = None) -> list[TagWindow]:
+        """
+        Périodes de mesure à lire : toutes les mesures d'une balise, ou celles des balises d'une pièce pendant
+        leurs affectations (limitées à la balise tag_id si elle est aussi donnée).
+        """
+        if room_id is None:
+            source_address = self.session_app.exec(select(TagModel.source_address).where(TagModel.id == tag_id)).first()
+            if source_address is None:
+                raise NotFoundError("Tag", tag_id)
+            return [TagWindow(source_address)]
+
+        if self.session_app.get(RoomModel, room_id) is None:
+            raise NotFoundError("Room", room_id)
+        statement = (
+            select(TagModel.source_address, RoomTagModel.start_at, RoomTagModel.end_at)
+            .join(RoomTagModel, TagModel.id == RoomTagModel.tag_id)
+            .where(RoomTagModel.room_id == room_id)
+        )
+        if tag_id is not None:
+            statement = statement.where(TagModel.id == tag_id)
+        return [TagWindow(*row) for row in self.session_app.exec(statement).all()]
+
+    def get_active_windows(
+        self,
+        room_ids: list[int] | None,
+        building_id: int | None
+    ) -> tuple[dict[int, RoomModel], dict[int, list[TagWindow]]]:
+        now = datetime.now(UTC)
+        statement = (
+            select(RoomModel, TagModel.source_address, RoomTagModel.start_at, RoomTagModel.end_at)
+            .join(RoomTagModel, RoomModel.id == RoomTagModel.room_id)
+            .join(TagModel, TagModel.id == RoomTagModel.tag_id)
+            .where((RoomTagModel.start_at.is_(None)) | (RoomTagModel.start_at <= now))
+            .where((RoomTagModel.end_at.is_(None)) | (RoomTagModel.end_at > now))
+        )
+        if room_ids:
+            statement = statement.where(RoomModel.id.in_(room_ids))
+        if building_id is not None:
+            statement = statement.where(RoomModel.building_id == building_id)
+
+        rooms = {}
+        room_windows: dict[int, list[TagWindow]] = {}
+        for room, source_address, start_at, end_at in self.session_app.exec(statement).all():
+            rooms[room.id] = room
+            room_windows.setdefault(room.id, []).append(TagWindow(source_address, start_at, end_at))
+        return rooms, room_windows
+
+    def get_latest_values(
+        self,
+        rooms: dict[int, RoomModel],
+        room_windows: dict[int, list[TagWindow]]
+    ) -> list[dict[str, Any]]:
+        if not rooms:
+            return []
+
+        query = _LATEST_VALUES_QUERY.format(
+            mapping=_MAPPING_CTE,
+            columns=", ".join(f"avg({key}.value) AS {key}_value, max({key}.time) AS {key}_time" for key in SENSOR_KINDS),
+            laterals="".join(
+                _LATEST_VALUE_LATERAL.format(key=key, table=model_class.__tablename__, column=value_field)
+                for key, (model_class, value_field) in SENSOR_KINDS.items()
+            )
+        )
+        rows = self.session_recorded.execute(text(query), self._mapping_params(room_windows)).mappings().all()
+
+        result = []
+        for row in sorted(rows, key=lambda row: row["room_id"]):
+            room = rooms[row["room_id"]]
+            latest = {
+                "id": room.id,
+                "name": room.name,
+                "floor": room.floor,
+                "building_id": room.building_id,
+            }
+            for key in SENSOR_KINDS:
+                if row[f"{key}_value"] is not None:
+                    latest[key] = {"value": round(row[f"{key}_value"], 2), "time": row[f"{key}_time"]}
+            result.append(latest)
+
+        return result
+
+    def get_rooms_tags(
+        self,
+        room_ids: list[int] | None,
+        first_value_date: datetime | None
+    ) -> dict[int, dict[str, Any]]:
+        statement = (
+            select(RoomModel, TagModel, RoomTagModel)
+            .join(RoomTagModel, RoomModel.id == RoomTagModel.room_id)
+            .join(TagModel, TagModel.id == RoomTagModel.tag_id)
+        )
+
+        if room_ids:
+            statement = statement.where(RoomModel.id.in_(room_ids))
+
+        if first_value_date:
+            # Affectations encore en cours à first_value_date ou commencées après
+            statement = statement.where(
+                (RoomTagModel.end_at.is_(None)) | (RoomTagModel.end_at > first_value_date)
+            )
+
+        results = self.session_app.exec(statement).all()
+
+        rooms_data = {}
+        for room, tag, room_tag in results:
+            room_id = room.id
+            if room_id not in rooms_data:
+                rooms_data[room_id] = {
+                    "room": room,
+                    "tags": [],
+                    "windows": []
+                }
+            
+            rooms_data[room_id]["tags"].append({
+                "id": room_tag.id,
+                "tag": tag,
+                "start_at": room_tag.start_at,
+                "end_at": room_tag.end_at,
+                "created_at": room_tag.created_at,
+                "updated_at": room_tag.updated_at
+            })
+            rooms_data[room_id]["windows"].append(TagWindow(tag.source_address, room_tag.start_at, room_tag.end_at))
+
+        return rooms_data
+
+    def build_room_data(self, room_info: dict[str, Any], sensor_data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **room_info["room"].model_dump(),
+            "tags": room_info["tags"],
+            **sensor_data
+        }
+
+    def values_pass(
+        self,
+        room_windows: dict[int, list[TagWindow]],
+        smooth_interval_minutes: int,
+        quantiles: bool
+    ) -> tuple[StreamingSmoother, RoomQuantiles | None]:
+        """
+        Lissage et quantiles alimentés au fil des mesures par add_values (calcul seul, sans requête).
+        """
+        smoother = StreamingSmoother(room_windows, smooth_interval_minutes)
+        return smoother, RoomQuantiles(room_windows, smooth_interval_minutes) if quantiles else None
+
+    def add_values(
+        self,
+        values_pass: tuple[StreamingSmoother, RoomQuantiles | None],
+        rows: Iterable[tuple[datetime, str | None, Any]]
+    ) -> None:
+        smoother, room_quantiles = values_pass
+        for time, source, value in rows:
+            smoother.add(source, time, value)
+            if room_quantiles:
+                room_quantiles.add(source, time, value)
+
+    def values_pass_result(self, values_pass: tuple[StreamingSmoother, RoomQuantiles | None]) -> dict[int, dict[str, Any]]:
+        smoother, room_quantiles = values_pass
+        result = {
+            room_id: {**self._stats_from_running(stats), "data": to_data_points(grid_us, smoothed_values)}
+            for room_id, stats, grid_us, smoothed_values in smoother.results()
+        }
+        return self._add_quantiles(result, room_quantiles) if room_quantiles else result
+
+    def smooth_after(
+        self,
+        room_windows: dict[int, list[TagWindow]],
+        smooth_interval_minutes: int,
+        since: datetime,
+        rows: Iterable[tuple[datetime, str | None, Any]]
+    ) -> dict[int, list]:
+        """Points lissés postérieurs à since, par pièce (calcul seul, sans requête)"""
+        smoother = StreamingSmoother(room_windows, smooth_interval_minutes, after_us=to_epoch_us(since))
+        for time, source, value in rows:
+            smoother.add(source, time, value)
+        return {
+            room_id: to_data_points(grid_us, smoothed_values)
+            for room_id, _, grid_us, smoothed_values in smoother.results()
+        }
+
+    def result_after(
+        self,
+        data_by_room: dict[int, list],
+        stats_rows: list,
+        room_quantiles: RoomQuantiles | None,
+        since: datetime,
+        with_stats: bool
+    ) -> dict[int, dict[str, Any]]:
+        if with_stats:
+            result = {
+                row["room_id"]: {**self._stats_from_row(row), "data": data_by_room.get(row["room_id"], [])}
+                for row in stats_rows
+            }
+        else:
+            result = {room_id: {"data": data} for room_id, data in data_by_room.items() if data}
+        if room_quantiles:
+            self._add_quantiles(result, room_quantiles, since)
+        return result if with_stats else self._without_stats(result)
+
+    def _without_stats(self, sensor_data_by_room: dict[int, dict[str, Any]]) -> dict[int, dict[str, Any]]:
+        """Points seuls (et quantiles par intervalle) : le client a déjà les statistiques de la période"""
+        for sensor_data in sensor_data_by_room.values():
+            for key in ("min", "max", "average", "nombre_values", "quantiles"):
+                sensor_data.pop(key, None)
+        return sensor_data_by_room
+
+    def _add_quantiles(
+        self,
+        sensor_data_by_room: dict[int, dict[str, Any]],
+        room_quantiles: RoomQuantiles,
+        since: datetime | None = None
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Ajoute quantiles et quantile_data ; avec since, l'intervalle contenant since est renvoyé mis à jour.
+        """
+        for room_id, quantile_data in room_quantiles.results(to_epoch_us(since) if since else None):
+            if room_id in sensor_data_by_room:
+                sensor_data_by_room[room_id].update(quantile_data)
+        return sensor_data_by_room
+
+    def _get_quantiles_in_db(
+        self,
+        table: str,
+        value_field: str,
+        room_windows: dict[int, list[TagWindow]],
+        first_value_date: datetime | None,
+        interval_minutes: int,
+        since: datetime | None = None,
+        with_history: bool = True
+    ) -> RoomQuantiles:
+        """
+        Sketches par pièce et par intervalle construits par la base : une ligne par (pièce, intervalle, bin).
+        Avec since, les intervalles antérieurs à celui de since ne sont pas renvoyés : leurs mesures sont
+        regroupées dans un seul intervalle, qui ne compte que pour les quantiles sur la période
+        (ou ne sont pas lues du tout sans with_history).
+        """
+        rows = self.get_sketch_rows(
+            table, value_field, room_windows, first_value_date, interval_minutes, since, with_history
+        )
+        return self.quantiles_from_sketch_rows(rows, room_windows, interval_minutes)
+
+    def get_sketch_rows(
+        self,
+        table: str,
+        value_field: str,
+        room_windows: dict[int, list[TagWindow]],
+        first_value_date: datetime | None,
+        interval_minutes: int,
+        since: datetime | None = None,
+        with_history: bool = True
+    ):
+        width = interval_minutes * 60
+        since_bucket = int(since.timestamp()) // width * width if since else None
+        bucket = "floor(extract(epoch FROM t.time) / :width)::bigint * :width"
+        if since and with_history:
+            bucket = f"CASE WHEN t.time < to_timestamp(:since_bucket) THEN :since_bucket - :width ELSE {bucket} END"
+
+        return self.session_recorded.execute(
+            text(_SKETCH_QUERY.format(
+                mapping=_MAPPING_CTE,
+                table=table,
+                column=value_field,
+                bucket=bucket,
+                sketch_bin=sketch_bin_sql(f"t.{value_field}"),
+                since=" ".join(filter(None, (
+                    "AND t.time >= :first_value_date" if first_value_date else "",
+                    "AND t.time >= to_timestamp(:since_bucket)" if since and not with_history else "",
+                )))
+            )),
+            {
+                **self._mapping_params(room_windows),
+                "first_value_date": first_value_date,
+                "width": width,
+                "since_bucket": since_bucket,
+            },
+            execution_options={"yield_per": 10_000}
+        )
+
+    def quantiles_from_sketch_rows(
+        self,
+        rows: Iterable,
+        room_windows: dict[int, list[TagWindow]],
+        interval_minutes: int
+    ) -> RoomQuantiles:
+        room_quantiles = RoomQuantiles(room_windows, interval_minutes)
+        for room_id, bucket, sketch_bin, value_count in rows:
+            room_quantiles.add_bin(room_id, int(bucket) * 1_000_000, sketch_bin, value_count)
+        return room_quantiles
+
+    def get_stats_in_db(
+        self,
+        table: str,
+        value_field: str,
+        room_windows: dict[int, list[TagWindow]],
+        first_value_date: datetime | None,
+        after: datetime | None = None
+    ) -> list:
+        """
+        Statistiques par pièce (bornes, min, max, moyenne, nombre) calculées par la base enregistrée.
+        Avec after, seules les mesures postérieures sont lues.
+        """
+        rows = self.session_recorded.execute(
+            text(_STATS_QUERY.format(
+                mapping=_MAPPING_CTE,
+                table=table,
+                column=value_field,
+                since=" ".join(filter(None, (
+                    "AND t.time >= :first_value_date" if first_value_date else "",
+                    "AND t.time > :after" if after else "",
+                )))
+            )),
+            {**self._mapping_params(room_windows), "first_value_date": first_value_date, "after": after}
+        ).mappings().all()
+        return [row for row in rows if row["nombre_values"]]
+
+    def all_windows(self, room_windows: dict[int, list[TagWindow]]) -> list[TagWindow]:
+        return list(dict.fromkeys(window for windows in room_windows.values() for window in windows))
+
+    def _mapping_params(self, room_windows: dict[int, list[TagWindow]]) -> dict[str, list]:
+        """Paramètres de _MAPPING_CTE : une entrée par affectation"""
+        pairs = [(room_id, window) for room_id, windows in room_windows.items() for window in windows]
+        return {
+            "room_ids": [room_id for room_id, _ in pairs],
+            "sources": [window.source_address for _, window in pairs],
+            "starts": [window.bounds[0] for _, window in pairs],
+            "ends": [window.bounds[1] for _, window in pairs],
+        }
+
+    def _stats_from_row(self, row) -> dict[str, Any]:
+        return {
+            "min": float(row["min"]),
+            "max": float(row["max"]),
+            "average": round(float(row["average"]), 2),
+            "nombre_values": int(row["nombre_values"]),
+        }
+
+    def _stats_from_running(self, stats: RunningStats) -> dict[str, Any]:
+        return {
+            "min": stats.min,
+            "max": stats.max,
+            "average": round(stats.mean, 2),
+            "nombre_values": stats.count,
+        }
+
+    def sensor_type_data_from_rollup_rows(
+        self,
+        rows: Iterable,
+        room_windows: dict[int, list[TagWindow]],
+        smooth_interval_minutes: int,
+        quantiles: bool = False
+    ) -> dict[int, dict[str, Any]]:
+        """Calcul seul, à partir des lignes de iter_rollup"""
+        room_quantiles = RoomQuantiles(room_windows, smooth_interval_minutes) if quantiles else None
+        arrays_by_window, tz = self._rollup_arrays_by_window(rows, room_windows, room_quantiles)
+
+        result = {}
+        for room_id, windows in room_windows.items():
+            room_arrays = {
+                window: arrays_by_window[room_id, window]
+                for window in windows if (room_id, window) in arrays_by_window
+            }
+            if not room_arrays:
+                continue
+
+            averages = np.concatenate([arrays[1] for arrays in room_arrays.values()])
+            counts = np.concatenate([arrays[4] for arrays in room_arrays.values()])
+            stats = {
+                "min": float(min(arrays[2].min() for arrays in room_arrays.values())),
+                "max": float(max(arrays[3].max() for arrays in room_arrays.values())),
+                "average": round(float((averages * counts).sum() / counts.sum()), 2),
+                "nombre_values": int(counts.sum()),
+            }
+            series_by_window = {
+                window: (arrays[0].astype(np.int64), arrays[1].astype(np.float64))
+                for window, arrays in room_arrays.items()
+            }
+            result[room_id] = self._build_sensor_data(series_by_window, smooth_interval_minutes, tz, stats)
+
+        return self._add_quantiles(result, room_quantiles) if room_quantiles else result
+
+    def _rollup_arrays_by_window(
+        self,
+        rows: Iterable,
+        room_windows: dict[int, list[TagWindow]],
+        room_quantiles: RoomQuantiles | None = None
+    ) -> tuple[dict[tuple[int, TagWindow], tuple[np.ndarray, ...]], Any]:
+        """
+        Colonnes (bucket, moyenne, min, max, nombre) par (pièce, affectation) et fuseau des buckets ;
+        les sketches des lignes sont ajoutés à room_quantiles.
+        """
+        index = tag_window_index(room_windows)
+        tz = None
+        data_by_window = {}
+        for bucket, source, min_value, max_value, avg_value, value_count, *sketch in rows:
+            if tz is None:
+                tz = bucket.tzinfo
+            for key in index.values_at(source, bucket):
+                if room_quantiles and sketch[0]:
+                    bucket_us = room_quantiles.bucket_us(to_epoch_us(bucket))
+                    for sketch_bin, count in zip(*sketch, strict=True):
+                        room_quantiles.add_bin(key[0], bucket_us, sketch_bin, count)
+
+                if key not in data_by_window:
+                    data_by_window[key] = ([], [], [], [], [])
+
+                columns = data_by_window[key]
+                for column, value in zip(columns, (to_epoch_us(bucket), avg_value, min_value, max_value, value_count), strict=True):
+                    column.append(value)
+
+        arrays_by_window = {
+            key: tuple(np.asarray(column) for column in columns)
+            for key, columns in data_by_window.items()
+        }
+        return arrays_by_window, tz
+
+    def interval_start(
+        self,
+        since: datetime,
+        smooth_interval_minutes: int,
+        first_value_date: datetime | None,
+        intervals_before: int = 0
+    ) -> datetime:
+        """Début de l'intervalle de lissage de since (aligné sur l'epoch, comme les rollups), ou d'un précédent"""
+        width = smooth_interval_minutes * 60
+        start = datetime.fromtimestamp((int(since.timestamp()) // width - intervals_before) * width, UTC)
+        return max(start, as_utc(first_value_date)) if first_value_date else start
+
+    def windows_from(self, windows: list[TagWindow], first_value_date: datetime | None) -> list[TagWindow]:
+        """Affectations limitées aux mesures postérieures à first_value_date"""
+        if not first_value_date:
+            return windows
+        start = as_utc(first_value_date)
+        return [window._replace(start_at=max(window.bounds[0], start)) for window in windows]
+
+    def _series_start(
+        self,
+        stats_rows: list,
+        smooth_interval_minutes: int,
+        since: datetime | None,
+        first_value_date: datetime | None
+    ) -> datetime:
+        """
+        Début de la lecture de time_bucket_gapfill : première mesure, ou avec since l'intervalle qui précède
+        (interpolation et locf des premiers points) sans relire les mesures plus anciennes.
+        """
+        if not since:
+            return min(row["first_time"] for row in stats_rows)
+        return self.interval_start(since, smooth_interval_minutes, first_value_date, intervals_before=1)
+
+    def smooth_rollup_rows_after(
+        self,
+        rows: Iterable,
+        room_windows: dict[int, list[TagWindow]],
+        smooth_interval_minutes: int,
+        since: datetime
+    ) -> dict[int, list]:
+        """Points lissés postérieurs à since à partir des moyennes par intervalle du rollup (calcul seul)"""
+        arrays_by_window, tz = self._rollup_arrays_by_window(rows, room_windows)
+        data_by_room = {}
+        for room_id, windows in room_windows.items():
+            series_by_window = {
+                window: (arrays[0].astype(np.int64), arrays[1].astype(np.float64))
+                for window in windows if (arrays := arrays_by_window.get((room_id, window))) is not None
+            }
+            if series_by_window:
+                data_by_room[room_id] = to_data_points(
+                    *smooth_and_aggregate(series_by_window, smooth_interval_minutes, tz, to_epoch_us(since))
+                )
+        return data_by_room
+
+    def _build_sensor_data(
+        self,
+        series_by_window: dict[TagWindow, tuple[np.ndarray, np.ndarray]],
+        smooth_interval_minutes: int,
+        tz,
+        stats: dict[str, Any]
+    ) -> dict[str, Any]:
+        grid_us, smoothed_values = smooth_and_aggregate(series_by_window, smooth_interval_minutes, tz)
+
+        return {
+            **stats,
+            "data": to_data_points(grid_us, smoothed_values)
+        }
+
+    def get_sensor_type_data_in_db(
+        self,
+        model_class,
+        value_field: str,
+        room_windows: dict[int, list[TagWindow]],
+        first_value_date: datetime | None,
+        smooth_interval_minutes: int,
+        since: datetime | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Lissage et agrégation faits par la base enregistrée : une ligne par intervalle au lieu d'une par mesure.
+        Avec since et sans with_stats, les bornes des grilles sont lues sur les seules mesures postérieures à since.
+        """
+        try:
+            table = model_class.__tablename__
+            mapping = _MAPPING_CTE
+            first_value_filter = "AND time >= :first_value_date" if first_value_date else ""
+            params = {
+                **self._mapping_params(room_windows),
+                "first_value_date": first_value_date,
+                "last_bucket": since,
+            }
+
+            new_points_only = since is not None and not with_stats
+            stats_rows = self.get_stats_in_db(
+                table, value_field, room_windows, first_value_date, since if new_points_only else None
+            )
+            if not stats_rows:
+                return {}
+
+            result = {
+                row["room_id"]: {**self._stats_from_row(row), "data": []}
+                for row in stats_rows
+            }
+
+            bound_room_ids = [row["room_id"] for row in stats_rows]
+            if self.aggregation_mode == "timescale":
+                query = _TIMESCALE_SERIES_QUERY.format(
+                    mapping=mapping,
+                    table=table,
+                    column=value_field,
+                    since="AND p.bucket > :last_bucket" if since else ""
+                )
+                series_params = {
+                    "bound_room_ids": bound_room_ids,
+                    "grid_ends": [row["last_time"] for row in stats_rows],
+                    "bucket_width": timedelta(minutes=smooth_interval_minutes),
+                    "series_start": self._series_start(stats_rows, smooth_interval_minutes, since, first_value_date),
+                    "series_end": max(row["last_time"] for row in stats_rows) + timedelta(microseconds=1),
+                }
+            else:
+                query = _SQL_SERIES_QUERY.format(mapping=mapping, table=table, column=value_field, since=first_value_filter)
+                if since:
+                    # Reprise de la grille après le dernier point reçu : les points antérieurs ne sont pas recalculés
+                    grid_starts = [since + timedelta(minutes=smooth_interval_minutes)] * len(stats_rows)
+                else:
+                    grid_starts = [grid_start(row["first_time"], smooth_interval_minutes) for row in stats_rows]
+                series_params = {
+                    "bound_room_ids": bound_room_ids,
+                    "grid_starts": grid_starts,
+                    "grid_ends": [row["last_time"] for row in stats_rows],
+                    "interval": smooth_interval_minutes,
+                }
+
+            rows = self.session_recorded.execute(text(query), {**params, **series_params}).all()
+            for room_id, bucket, value in rows:
+                result[room_id]["data"].append([int(bucket.timestamp() * 1000), round(value, 2)])
+
+            if quantiles:
+                room_quantiles = self._get_quantiles_in_db(
+                    table, value_field, room_windows, first_value_date, smooth_interval_minutes, since, with_stats
+                )
+                self._add_quantiles(result, room_quantiles, since)
+            return self._without_stats(result) if new_points_only else result
+
+        except Exception as e:
+            logger.error(f"Erreur lors de l'agrégation en base des données {value_field}: {e}")
+            self.session_recorded.rollback()
+            return {}
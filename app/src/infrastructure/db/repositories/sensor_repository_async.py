@@ -0,0 +1,133 @@
+from __future__ import annotations
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime
+from typing import Any, Type
+
+from sqlalchemy import func, text
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.src.common.interval_index import TagWindow
+from app.src.common.pagination import KeysetCursor
+from app.src.domain.interface_repositories.sensor_repository import AsyncSensorRepository
+from app.src.infrastructure.db.repositories.sensor_repository_sql import (
+    _HAS_TIMESCALE_QUERY,
+    _RELTUPLES_ESTIMATE_QUERY,
+    _STREAM_CHUNK_SIZE,
+    _TIMESCALE_ESTIMATE_QUERY,
+    SensorTableMixin,
+)
+
+
+class AsyncSQLSensorRepository(SensorTableMixin, AsyncSensorRepository):
+    """Version asyncpg de SQLSensorRepository"""
+
+    def __init__(self, session: AsyncSession, model: Type[SQLModel], ts_attr: str | None = None):
+        self.session = session
+        self.model = model
+        self.ts_attr = ts_attr or self._detect_ts_attr()
+
+    async def get_latest(self) -> Any | None:
+        """Retourne la dernière mesure insérée"""
+        stmt = select(self.model).order_by(self.ts_col.desc()).limit(1)
+        return (await self.session.exec(stmt)).first()
+
+    async def get_all(self, limit: int = 100, windows: list[TagWindow] | None = None) -> list[dict[str, Any]]:
+        """Retourne les N dernières mesures (lignes brutes), éventuellement limitées aux périodes des balises"""
+        return await self.get_range(None, None, limit, windows)
+
+    async def get_range(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int | None = None,
+        windows: list[TagWindow] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Retourne les mesures dans un intervalle temporel (lignes brutes, sans objets ORM)"""
+        stmt = self._measurements_statement(start, end, limit, windows)
+        if stmt is None:
+            return []
+        return [dict(row) for row in (await self.session.execute(stmt)).mappings()]
+
+    async def copy_records(self, columns: list[str], batches: AsyncIterable[list[tuple]]) -> int:
+        """
+        Insère les lignes avec COPY FROM STDIN (format binaire d'asyncpg), un COPY par paquet reçu, dans une seule
+        transaction : en cas d'erreur de la base, aucune ligne du lot n'est insérée.
+        Le paquet suivant est préparé pendant que PostgreSQL insère le précédent (un seul COPY à la fois).
+        """
+        connection = await self.session.connection()
+        driver_connection = (await connection.get_raw_connection()).driver_connection
+        inserted = 0
+        copy: asyncio.Task | None = None
+        try:
+            async for records in batches:
+                if copy is not None:
+                    await copy
+                if records:
+                    copy = asyncio.create_task(driver_connection.copy_records_to_table(
+                        self.model.__tablename__, records=records, columns=columns
+                    ))
+                    inserted += len(records)
+            if copy is not None:
+                await copy
+            await self.session.commit()
+        except BaseException:
+            if copy is not None and not copy.done():
+                copy.cancel()
+                await asyncio.gather(copy, return_exceptions=True)
+            await self.session.rollback()
+            raise
+        return inserted
+
+    async def iter_values(
+        self,
+        value_attr: str,
+        source_addresses: list[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        windows: list[TagWindow] | None = None,
+    ) -> AsyncIterator[tuple[datetime, str | None, Any]]:
+        """
+        Parcourt (time, source_address, valeur) par ordre chronologique avec un curseur serveur.
+        """
+        async for rows in self.iter_value_chunks(value_attr, source_addresses, start, end, windows):
+            for row in rows:
+                yield row
+
+    async def iter_value_chunks(
+        self,
+        value_attr: str,
+        source_addresses: list[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        windows: list[TagWindow] | None = None,
+    ) -> AsyncIterator[list[tuple[datetime, str | None, Any]]]:
+        """
+        Comme iter_values, par paquets de lignes : chaque paquet peut être traité hors de la boucle d'événements.
+        """
+        stmt = self._values_statement(value_attr, source_addresses, start, end, windows)
+        result = await self.session.stream(stmt, execution_options={"yield_per": _STREAM_CHUNK_SIZE})
+        async for rows in result.partitions():
+            yield [tuple(row) for row in rows]
+
+    async def paginate(
+        self, cursor: KeysetCursor | None, limit: int, exact_total: bool = False
+    ) -> tuple[list[dict[str, Any]], int, dict[str, Any] | None]:
+        """
+        Pagination par clé (date, rang dans la date), voir SQLSensorRepository.paginate.
+        """
+        result = await self.session.execute(self._page_statement(cursor, limit))
+        rows = [dict(row) for row in result.mappings()]
+        rows, next_key = self._split_page(rows, limit, cursor)
+        return rows, await self.count(exact_total), next_key
+
+    async def count(self, exact: bool = False) -> int:
+        if not exact:
+            table = self.model.__tablename__
+            has_timescale = (await self.session.execute(text(_HAS_TIMESCALE_QUERY))).scalar()
+            query = _TIMESCALE_ESTIMATE_QUERY if has_timescale else _RELTUPLES_ESTIMATE_QUERY
+            estimate = (await self.session.execute(text(query), {"table": table})).scalar()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+        return int((await self.session.exec(select(func.count()).select_from(self.model))).one())
@@ -1,18 +1,56 @@
 from __future__ import annotations
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Type
 
 from sqlmodel import Session, select, SQLModel
-from sqlalchemy import func
+from sqlalchemy import ARRAY, TIMESTAMP, String, TypeDecorator, and_, cast, func, text, true, union_all
+
+from app.src.common.exception import DecodedFailedError
+from app.src.common.interval_index import TagWindow, merge_tag_windows
+from app.src.common.pagination import KeysetCursor
+from app.src.domain.interface_repositories.sensor_repository import SensorColumn, SensorRepository
 
 _TS_CANDIDATES = ("time", "recorded_at", "measured_at", "created_at", "timestamp", "ts")
+_STREAM_CHUNK_SIZE = 10_000
+_PAGE_CURSOR = "Sensor pagination cursor"
 
+# Parcours d'index par sauts (loose index scan) : une descente dans l'index (source_address, time)
+# par adresse distincte, au lieu de lire toutes les lignes comme SELECT DISTINCT
+_DISTINCT_SOURCES_QUERY = """
+    WITH RECURSIVE sources AS (
+        (SELECT source_address FROM {table} WHERE source_address IS NOT NULL ORDER BY source_address LIMIT 1)
+        UNION ALL
+        SELECT (
+            SELECT t.source_address FROM {table} AS t
+            WHERE t.source_address > s.source_address
+            ORDER BY t.source_address LIMIT 1
+        )
+        FROM sources AS s
+        WHERE s.source_address IS NOT NULL
+    )
+    SELECT source_address FROM sources WHERE source_address IS NOT NULL
+"""
 
-class SQLSensorRepository:
-    def __init__(self, session: Session, model: Type[SQLModel], ts_attr: str | None = None):
-        self.session = session
-        self.model = model
-        self.ts_attr = ts_attr or self._detect_ts_attr()
+# Nombre de lignes estimé : approximate_row_count pour une hypertable (les lignes sont dans les chunks),
+# statistiques du planificateur sinon (-1 si la table n'a jamais été analysée)
+_HAS_TIMESCALE_QUERY = "SELECT to_regprocedure('approximate_row_count(regclass)') IS NOT NULL"
+_TIMESCALE_ESTIMATE_QUERY = "SELECT approximate_row_count(CAST(:table AS regclass))"
+_RELTUPLES_ESTIMATE_QUERY = "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"
+
+_LAST_SEEN_QUERY = """
+    SELECT s.source_address, l.time
+    FROM unnest(CAST(:sources AS text[])) AS s(source_address)
+    CROSS JOIN LATERAL (
+        SELECT {ts} AS time FROM {table} WHERE source_address = s.source_address ORDER BY {ts} DESC LIMIT 1
+    ) AS l
+"""
+
+
+class SensorTableMixin:
+    """Modèle de table de capteurs et colonne temporelle, communs aux dépôts sync et async"""
+    model: Type[SQLModel]
+    ts_attr: str
 
     def _detect_ts_attr(self) -> str:
         for name in _TS_CANDIDATES:
@@ -26,45 +64,268 @@ class SQLSensorRepository:
     def ts_col(self):
         return getattr(self.model, self.ts_attr)
 
+    def record_columns(self) -> list[SensorColumn]:
+        """Colonnes de la table dans l'ordre du modèle, avec la valeur par défaut du modèle"""
+        columns = []
+        for column in self.model.__table__.columns:
+            field = self.model.model_fields[column.name]
+            default = None if field.is_required() else field.get_default(call_default_factory=True)
+            # AutoString (SQLModel) est un TypeDecorator de String
+            column_type = column.type.impl if isinstance(column.type, TypeDecorator) else column.type
+            columns.append(SensorColumn(column.name, column_type.python_type, default, column.nullable))
+        return columns
+
+    def _windows_subquery(self, windows: list[TagWindow]):
+        """(source_address, start_at, end_at) des périodes, passées en tableaux"""
+        starts, ends = zip(*(window.bounds for window in windows), strict=True) if windows else ((), ())
+        return select(
+            func.unnest(cast([window.source_address for window in windows], ARRAY(String))).label("source_address"),
+            func.unnest(cast(list(starts), ARRAY(TIMESTAMP(timezone=True)))).label("start_at"),
+            func.unnest(cast(list(ends), ARRAY(TIMESTAMP(timezone=True)))).label("end_at"),
+        ).subquery("windows")
+
+    def _measurements_statement(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+        windows: list[TagWindow] | None = None,
+    ):
+        """
+        Mesures brutes de la plus récente à la plus ancienne, entre start et end (inclus).
+        windows : mesures de chaque balise pendant ses périodes, une branche par période lue dans l'index
+        (source_address, time DESC) et limitée avant la fusion. Aucune période : None.
+        """
+        columns = self.model.__table__.columns
+        if windows is None:
+            stmt = select(*columns)
+            if start is not None:
+                stmt = stmt.where(self.ts_col >= start)
+            if end is not None:
+                stmt = stmt.where(self.ts_col <= end)
+            stmt = stmt.order_by(self.ts_col.desc())
+            return stmt.limit(limit) if limit else stmt
+
+        branches = []
+        for window in merge_tag_windows(windows):
+            branch = select(*columns).where(self.model.source_address == window.source_address)
+            lower = max(filter(None, (start, window.start_at)), default=None)
+            if lower is not None:
+                branch = branch.where(self.ts_col >= lower)
+            if window.end_at is not None:
+                branch = branch.where(self.ts_col < window.end_at)
+            if end is not None:
+                branch = branch.where(self.ts_col <= end)
+            if limit:
+                branch = branch.order_by(self.ts_col.desc()).limit(limit)
+            branches.append(branch)
+        if not branches:
+            return None
+
+        measurements = union_all(*branches).subquery("measurements")
+        stmt = select(*measurements.c).order_by(measurements.c[self.ts_col.name].desc())
+        return stmt.limit(limit) if limit else stmt
+
+    def _page_order(self, columns) -> list:
+        """Ordre total des mesures : date, puis toutes les autres colonnes (les doublons exacts sont interchangeables)"""
+        ts_name = self.ts_col.name
+        return [columns[ts_name], *(column.asc().nulls_first() for column in columns if column.name != ts_name)]
+
+    def _page_statement(self, cursor: KeysetCursor | None, limit: int):
+        """
+        Page après le curseur (date, nombre de mesures de cette date déjà lues), avec une ligne de plus pour
+        savoir s'il y a une suite. Les tables de capteurs n'ont pas de clé unique : les mesures de même date
+        sont départagées par leur position dans _page_order, seules les lignes de la date du curseur sont
+        relues (OFFSET), les suivantes sont lues dans l'index temporel.
+        """
+        columns = self.model.__table__.columns
+        if cursor is None:
+            return select(*columns).order_by(*self._page_order(columns)).limit(limit + 1)
+
+        cursor_time, skip = self._cursor_position(cursor)
+        same_time = (
+            select(*columns).where(self.ts_col == cursor_time)
+            .order_by(*self._page_order(columns)).offset(skip).limit(limit + 1)
+        )
+        later = select(*columns).where(self.ts_col > cursor_time).order_by(*self._page_order(columns)).limit(limit + 1)
+        page = union_all(same_time, later).subquery("page")
+        return select(*page.c).order_by(*self._page_order(page.c)).limit(limit + 1)
+
+    @staticmethod
+    def _cursor_position(cursor: KeysetCursor) -> tuple[datetime, int]:
+        try:
+            skip = int(cursor.key["skip"])
+            cursor_time = datetime.fromisoformat(cursor.key["time"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise DecodedFailedError(_PAGE_CURSOR, str(e)) from e
+        if cursor.direction != "next" or skip < 0:
+            raise DecodedFailedError(_PAGE_CURSOR, "Invalid cursor position")
+        return cursor_time, skip
+
+    def _split_page(
+        self, rows: list[dict[str, Any]], limit: int, cursor: KeysetCursor | None
+    ) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+        """Lignes de la page et clé du curseur suivant (None pour la dernière page)"""
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last_time = rows[-1][self.ts_col.name]
+        skip = sum(1 for row in rows if row[self.ts_col.name] == last_time)
+        if cursor is not None:
+            cursor_time, cursor_skip = self._cursor_position(cursor)
+            if cursor_time == last_time:
+                skip += cursor_skip
+        return rows, {"time": last_time.isoformat(), "skip": skip}
+
+    def _values_statement(
+        self,
+        value_attr: str,
+        source_addresses: list[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        windows: list[TagWindow] | None = None,
+    ):
+        value_col = getattr(self.model, value_attr)
+        stmt = select(self.ts_col, self.model.source_address, value_col).where(value_col.is_not(None))
+        if source_addresses is not None:
+            stmt = stmt.where(self.model.source_address.in_(source_addresses))
+        if windows is not None:
+            merged = self._windows_subquery(merge_tag_windows(windows))
+            stmt = stmt.join(merged, self._in_window(merged))
+        if start is not None:
+            stmt = stmt.where(self.ts_col >= start)
+        if end is not None:
+            stmt = stmt.where(self.ts_col <= end)
+        return stmt.order_by(self.ts_col)
+
+    def _in_window(self, windows_subquery):
+        return and_(
+            self.model.source_address == windows_subquery.c.source_address,
+            self.ts_col >= windows_subquery.c.start_at,
+            self.ts_col < windows_subquery.c.end_at,
+        )
+
+
+class SQLSensorRepository(SensorTableMixin, SensorRepository):
+    def __init__(self, session: Session, model: Type[SQLModel], ts_attr: str | None = None):
+        self.session = session
+        self.model = model
+        self.ts_attr = ts_attr or self._detect_ts_attr()
 
     def get_latest(self) -> Any | None:
         """Retourne la dernière mesure insérée"""
         stmt = select(self.model).order_by(self.ts_col.desc()).limit(1)
         return self.session.exec(stmt).first()
 
-    def get_all(self, limit: int = 100) -> list[Any]:
-        """Retourne les N dernières mesures"""
-        stmt = select(self.model).order_by(self.ts_col.desc()).limit(limit)
-        return list(self.session.exec(stmt).all())
+    def get_all(self, limit: int = 100, windows: list[TagWindow] | None = None) -> list[dict[str, Any]]:
+        """Retourne les N dernières mesures (lignes brutes), éventuellement limitées aux périodes des balises"""
+        return self.get_range(None, None, limit, windows)
+
+    def distinct_source_addresses(self) -> list[str]:
+        """Adresses sources présentes dans la table (skip scan de l'index (source_address, time))"""
+        query = _DISTINCT_SOURCES_QUERY.format(table=self.model.__tablename__)
+        return list(self.session.execute(text(query)).scalars())
+
+    def last_seen(self, source_addresses: list[str]) -> dict[str, datetime]:
+        """Date de la dernière mesure de chaque adresse (une lecture d'index par adresse)"""
+        if not source_addresses:
+            return {}
+        query = _LAST_SEEN_QUERY.format(table=self.model.__tablename__, ts=self.ts_col.name)
+        return dict(self.session.execute(text(query), {"sources": source_addresses}).all())
+
+    def get_range(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int | None = None,
+        windows: list[TagWindow] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Retourne les mesures dans un intervalle temporel (lignes brutes, sans objets ORM)"""
+        stmt = self._measurements_statement(start, end, limit, windows)
+        if stmt is None:
+            return []
+        return [dict(row) for row in self.session.execute(stmt).mappings()]
+
+    def iter_values(
+        self,
+        value_attr: str,
+        source_addresses: list[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        windows: list[TagWindow] | None = None,
+    ) -> Iterator[tuple[datetime, str | None, Any]]:
+        """
+        Parcourt (time, source_address, valeur) par ordre chronologique, directement depuis le curseur.
+        Seules ces trois colonnes sont lues, les valeurs NULL sont exclues.
+        windows : seules les mesures de chaque balise comprises dans ses périodes sont lues
+        """
+        stmt = self._values_statement(value_attr, source_addresses, start, end, windows)
+        result = self.session.execute(stmt, execution_options={"yield_per": _STREAM_CHUNK_SIZE})
+        for row in result:
+            yield tuple(row)
+
+    def iter_values_after(
+        self,
+        value_attr: str,
+        windows: list[TagWindow],
+        after: datetime,
+        start: datetime | None = None,
+    ) -> Iterator[tuple[datetime, str | None, Any]]:
+        """
+        Comme iter_values, limité aux mesures postérieures à `after`, précédées de la dernière mesure
+        de chaque période à `after` ou avant (nécessaire pour interpoler les premiers points suivants).
+        """
+        value_col = getattr(self.model, value_attr)
+        periods = self._windows_subquery(list(dict.fromkeys(windows)))
+
+        anchor = select(self.ts_col.label("time"), value_col.label("value")).where(
+            self._in_window(periods),
+            value_col.is_not(None),
+            self.ts_col <= after,
+        )
+        if start is not None:
+            anchor = anchor.where(self.ts_col >= start)
+        anchor = anchor.order_by(self.ts_col.desc()).limit(1).lateral("anchor")
+
+        stmt = (
+            select(anchor.c.time, periods.c.source_address, anchor.c.value)
+            .select_from(periods)
+            .join(anchor, true())
+            .distinct()
+            .order_by(anchor.c.time)
+        )
+        for row in self.session.execute(stmt):
+            yield tuple(row)
 
-    def get_range(self, start: datetime, end: datetime, limit: int | None = None) -> list[Any]:
-        """Retourne les mesures dans un intervalle temporel"""
+        merged = self._windows_subquery(merge_tag_windows(windows))
         stmt = (
-            select(self.model)
-            .where(self.ts_col >= start, self.ts_col <= end)
-            .order_by(self.ts_col.desc())
+            select(self.ts_col, self.model.source_address, value_col)
+            .join(merged, self._in_window(merged))
+            .where(value_col.is_not(None), self.ts_col > after)
+            .order_by(self.ts_col)
         )
-        if limit:
-            stmt = stmt.limit(limit)
-        return list(self.session.exec(stmt).all())
+        result = self.session.execute(stmt, execution_options={"yield_per": _STREAM_CHUNK_SIZE})
+        for row in result:
+            yield tuple(row)
 
     def paginate(
-        self, cursor_time: datetime | None, limit: int
-    ) -> tuple[list[Any], int, Any | None, Any | None]:
+        self, cursor: KeysetCursor | None, limit: int, exact_total: bool = False
+    ) -> tuple[list[dict[str, Any]], int, dict[str, Any] | None]:
         """
-        Pagination basée sur la colonne temporelle (TimescaleDB friendly).
+        Pagination par clé (date, rang dans la date) : chaque page reprend l'index au curseur, sans doublon
+        ni saut entre mesures de même date. Retourne (lignes, total, clé du curseur suivant).
+        Le total est estimé, sauf avec exact_total (count(*) sur toute la table).
         """
-        stmt = select(self.model)
-        if cursor_time is not None:
-            stmt = stmt.where(self.ts_col >= cursor_time)
-        stmt = stmt.order_by(self.ts_col).limit(limit)
-
-        rows = self.session.exec(stmt).all()
-
-        # Compte total
-        total = self.session.exec(select(func.count()).select_from(self.model)).one()
-        total = total[0] if isinstance(total, tuple) else total
+        rows = [dict(row) for row in self.session.execute(self._page_statement(cursor, limit)).mappings()]
+        rows, next_key = self._split_page(rows, limit, cursor)
+        return rows, self.count(exact_total), next_key
 
-        first_row = rows[0] if rows else None
-        last_row = rows[-1] if rows else None
-        return list(rows), int(total or 0), first_row, last_row
+    def count(self, exact: bool = False) -> int:
+        if not exact:
+            table = self.model.__tablename__
+            has_timescale = self.session.execute(text(_HAS_TIMESCALE_QUERY)).scalar()
+            query = _TIMESCALE_ESTIMATE_QUERY if has_timescale else _RELTUPLES_ESTIMATE_QUERY
+            estimate = self.session.execute(text(query), {"table": table}).scalar()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+        return int(self.session.exec(select(func.count()).select_from(self.model)).one())
@@ -3,10 +3,14 @@ import logging
 
 from psycopg2 import errors
 from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.tag import Tag
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
+from app.src.infrastructure.db.models.room_model import RoomModel
 from app.src.infrastructure.db.models.room_tag_model import RoomTagModel
 from app.src.infrastructure.db.models.tag_model import TagModel
 from app.src.domain.interface_repositories.tag_repository import TagRepository
@@ -22,6 +26,10 @@ from app.src.common.exception import (
 
 logger = logging.getLogger(__name__)
 
+def with_rooms_option():
+    # Liens pièce-tag d'une page de tags en une requête (IN), pièce et bâtiment joints : 2 requêtes par page
+    return selectinload(TagModel.room_tags).joinedload(RoomTagModel.room).joinedload(RoomModel.building)
+
 
 class SQLTagRepository(TagRepository):
     def __init__(self, session: Session):
@@ -53,32 +61,13 @@ class SQLTagRepository(TagRepository):
         return Tag.from_dict(tag_model.model_dump())
 
 
-    def paginate_tags(self, cursor: int | None, limit: int, with_rooms: bool = False) -> tuple[list[Tag], int, Tag | None, Tag | None]:       
-        tags = self.select_tags(cursor, limit, with_rooms)
-        total = self.count_all_tags()
-        first_tag = self.get_tag_by_position(0)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
-        )
-
-        last_tag = self.get_tag_by_position(last_page_offset)
-
-        return tags, total, first_tag, last_tag
-
-
-    def select_tags(self, cursor: int | None, limit: int, with_rooms: bool = False) -> list[Tag]:
-        statement = select(TagModel).order_by(TagModel.id)
-        if cursor:
-            statement = statement.where(TagModel.id >= cursor)
-        statement = statement.limit(limit)
-
-        results = self.session.exec(statement).all()
+    def paginate_tags(self, cursor: KeysetCursor | None, limit: int, with_rooms: bool = False) -> KeysetPage[Tag]:
+        statement = select(TagModel).options(with_rooms_option()) if with_rooms else select(TagModel)
+        page = paginate_keyset(self.session, statement, [TagModel.id], cursor, limit)
 
         if with_rooms:
-            return [
-                Tag(
+            return page.map(
+                lambda tag: Tag(
                     **tag.model_dump(),
                     rooms=[
                         {
@@ -93,11 +82,9 @@ class SQLTagRepository(TagRepository):
                         for room_tag in tag.room_tags
                     ],
                 )
-                for tag in results
-            ]
+            )
         else:
-            return [Tag(**tag.model_dump()) for tag in results]
-
+            return page.map(lambda tag: Tag(**tag.model_dump()))
 
 
     def count_all_tags(self) -> int:
@@ -105,18 +92,8 @@ class SQLTagRepository(TagRepository):
         return total
 
 
-    def get_tag_by_position(self, position: int) -> Tag | None:
-        if position >= 0:
-            statement = select(TagModel).order_by(TagModel.id.asc()).offset(position).limit(1)
-        else:
-            statement = select(TagModel).order_by(TagModel.id.desc()).offset(abs(position) - 1).limit(1)
-
-        result = self.session.exec(statement).first()
-        return Tag(**result.model_dump()) if result else None
-
-
     def select_tag_by_id(self, tag_id: int, with_rooms: bool = False) -> Tag:
-        tag_model = self.session.get(TagModel, tag_id)
+        tag_model = self.session.get(TagModel, tag_id, options=[with_rooms_option()] if with_rooms else None)
         if not tag_model:
             raise NotFoundError("Tag", tag_id)
 
@@ -227,6 +204,10 @@ class SQLTagRepository(TagRepository):
         return Tag(**tag_model.model_dump())
 
 
+    def select_all_source_addresses(self) -> set[str]:
+        return set(self.session.exec(select(TagModel.source_address)).all())
+
+
     def create_with_room_link(self, tag: Tag, room_id: int, start_at: datetime, end_at: datetime | None = None) -> Tag:
         try:       
             tag_model = TagModel(
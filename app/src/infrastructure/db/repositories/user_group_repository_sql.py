@@ -6,6 +6,8 @@ from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
 from app.src.domain.entities.user_group import UserGroup
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.infrastructure.db.models.user_group_model import UserGroupModel
 from app.src.domain.interface_repositories.user_group_repository import UserGroupRepository
 from app.src.common.exception import (
@@ -45,45 +47,16 @@ class SQLUserGroupRepository(UserGroupRepository):
 
         return UserGroup.from_dict(user_group_model.model_dump())
 
-    def paginate_user_groups(self, cursor: tuple[int, int] | None, limit: int) -> tuple[list[UserGroup], int, UserGroup | None, UserGroup | None]:
-
-        user_groups = self.select_user_groups(cursor, limit)
-        total = self.count_all_user_groups()
-        first_user_group = self.get_user_group_by_position(0)
-        last_page_offset = (
-            (total // (limit - 1)) * (limit - 1)
-            if total % (limit - 1) != 0
-            else ((total // (limit - 1)) - 1) * (limit - 1)
+    def paginate_user_groups(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[UserGroup]:
+        page = paginate_keyset(
+            self.session, select(UserGroupModel), [UserGroupModel.user_id, UserGroupModel.group_id], cursor, limit
         )
-
-        last_user_group = self.get_user_group_by_position(last_page_offset)
-
-        return user_groups, total, first_user_group, last_user_group
-
-    def select_user_groups(self, cursor: tuple[int,int] | None, limit: int) -> list[UserGroup]:
-        statement = select(UserGroupModel).order_by(UserGroupModel.user_id, UserGroupModel.group_id)
-
-        if cursor:
-            statement = statement.where((UserGroupModel.user_id, UserGroupModel.group_id) >= cursor)
-        statement = statement.limit(limit)
-
-        results = self.session.exec(statement).all()
-        return [UserGroup(**user_group.model_dump()) for user_group in results]
+        return page.map(lambda user_group: UserGroup(**user_group.model_dump()))
 
     def count_all_user_groups(self) -> int:
         total = self.session.exec(select(func.count()).select_from(UserGroupModel)).one()
         return total
 
-    def get_user_group_by_position(self, position: int) -> UserGroup | None:
-        statement = select(UserGroupModel).order_by(UserGroupModel.user_id, UserGroupModel.group_id)
-        if position >= 0:
-            statement = select(UserGroupModel).order_by(UserGroupModel.user_id.asc(), UserGroupModel.group_id.asc()).offset(position).limit(1)
-        else:
-            statement = select(UserGroupModel).order_by(UserGroupModel.user_id.desc(), UserGroupModel.group_id.desc()).offset(abs(position) - 1).limit(1)
-
-        result = self.session.exec(statement).first()
-        return UserGroup(**result.model_dump()) if result else None
-
     def select_user_group_by_id(self, user_id: int, group_id: int) -> UserGroup:
         statement = select(UserGroupModel).where(
             UserGroupModel.user_id == user_id,
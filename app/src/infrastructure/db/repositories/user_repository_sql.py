@@ -2,6 +2,8 @@ import datetime
 from sqlmodel import Session, select
 from sqlalchemy import func
 from app.src.domain.entities.user import User
+from app.src.common.pagination import KeysetCursor, KeysetPage
+from app.src.infrastructure.db.pagination import paginate_keyset
 from app.src.infrastructure.db.models.user_model import UserModel
 from app.src.domain.interface_repositories.user_repository import UserRepository
 from app.src.common.exception import NotFoundError
@@ -156,18 +158,10 @@ class SQLUserRepository(UserRepository):
             deleted_at=user_model.deleted_at,
         )        
     
-    def paginate_users(self, cursor: int | None, limit: int):
-        statement = select(UserModel)
-        if cursor is not None:
-            statement = statement.where(UserModel.id >= cursor)
-        statement = statement.order_by(UserModel.id).limit(limit)
-        results = self.session.exec(statement).all()
-        total = self.session.exec(select(func.count()).select_from(UserModel)).one()
-        total = total[0] if isinstance(total, tuple) else total
-        first_user = results[0] if results else None
-        last_user = results[-1] if results else None
-        users = [
-            User(
+    def paginate_users(self, cursor: KeysetCursor | None, limit: int) -> KeysetPage[User]:
+        page = paginate_keyset(self.session, select(UserModel), [UserModel.id], cursor, limit)
+        return page.map(
+            lambda user: User(
                 id=user.id,
                 email=user.email,
                 password=user.password,
@@ -183,6 +177,7 @@ class SQLUserRepository(UserRepository):
                 updated_at=user.updated_at,
                 deleted_at=user.deleted_at,
             )
-            for user in results
-        ]
-        return users, total, first_user, last_user
\ No newline at end of file
+        )
+
+    def count_all_users(self) -> int:
+        return self.session.exec(select(func.count()).select_from(UserModel)).one()
\ No newline at end of file
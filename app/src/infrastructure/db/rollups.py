@@ -0,0 +1,342 @@
+"""
+Agrégats pré-calculés (rollups) des tables de capteurs de la base enregistrée.
+
+Pour chaque table et chaque résolution (5 min, 1 h, 1 jour), une table `<table>_<résolution>`
+contient min / max / moyenne / nombre de mesures par balise (source_address) et par intervalle.
+Les rollups PostgreSQL contiennent aussi un sketch de quantiles (common/quantile_sketch.py) :
+bins et compteurs dans sketch_bins / sketch_counts.
+
+Deux modes de maintenance :
+- TimescaleDB : continuous aggregates rafraîchis par une policy Timescale, en agrégation temps réel
+  (materialized_only = false) pour les mesures pas encore matérialisées
+- PostgreSQL : tables classiques rafraîchies de façon incrémentale avec un watermark
+  (python -m app.src.infrastructure.db.rollups refresh, à planifier) ; les mesures postérieures
+  au watermark sont agrégées à la lecture (iter_rollup)
+"""
+import argparse
+import logging
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.src.common.interval_index import TagWindow, merge_tag_windows
+from app.src.common.quantile_sketch import sketch_bin_sql
+from app.src.infrastructure.db.models.sensor_model import SensorHumidityModel, SensorPressureModel, SensorTemperatureModel
+
+logger = logging.getLogger(__name__)
+
+# (suffixe, résolution en minutes), du plus fin au plus grossier
+ROLLUP_RESOLUTIONS: tuple[tuple[str, int], ...] = (("5m", 5), ("1h", 60), ("1d", 1440))
+
+# table brute -> colonne de valeur
+ROLLUP_SOURCES: dict[str, str] = {
+    SensorTemperatureModel.__tablename__: "temperature",
+    SensorHumidityModel.__tablename__: "humidity",
+    SensorPressureModel.__tablename__: "atmospheric_pressure",
+}
+
+WATERMARK_TABLE = "sensor_rollup_watermark"
+
+# Nombre d'intervalles déjà agrégés recalculés à chaque rafraîchissement (mesures arrivées en retard)
+LATE_BUCKETS = 2
+
+# Mesures brutes postérieures au watermark d'un rollup PostgreSQL, agrégées comme par refresh_rollups
+_RAW_TAIL_QUERY = """
+    UNION ALL
+    SELECT bucket, source_address, min(min_value), max(max_value),
+           sum(value_sum) / sum(value_count), sum(value_count) {sketch_arrays}
+    FROM (
+        SELECT to_timestamp(floor(extract(epoch FROM t.time) / :width) * :width) AS bucket,
+               t.source_address, {sketch_bin} AS sketch_bin,
+               min(t.{column})::float8 AS min_value, max(t.{column})::float8 AS max_value,
+               sum(t.{column}::float8) AS value_sum, count(t.{column})::integer AS value_count
+        FROM w
+        JOIN {table} AS t ON t.source_address = w.source_address AND t.time >= w.start_at AND t.time < w.end_at
+        WHERE t.{column} IS NOT NULL
+          AND t.time >= coalesce(
+              (SELECT watermark FROM {watermark_table} WHERE rollup = :rollup), '-infinity'::timestamptz
+          )
+          {since}
+        GROUP BY 1, 2, 3
+    ) AS binned
+    GROUP BY bucket, source_address
+"""
+
+
+# Dernier intervalle de chaque période avant :since (lecture de la clé primaire (source_address, bucket))
+_ANCHOR_QUERY = """
+    UNION ALL
+    SELECT a.bucket, a.source_address, a.min_value, a.max_value, a.avg_value, a.value_count {sketch_columns}
+    FROM unnest(CAST(:anchor_sources AS text[]), CAST(:anchor_starts AS timestamptz[]),
+                CAST(:anchor_ends AS timestamptz[])) AS aw(source_address, start_at, end_at)
+    CROSS JOIN LATERAL (
+        SELECT * FROM {rollup} AS r
+        WHERE r.source_address = aw.source_address
+          AND r.bucket >= aw.start_at AND r.bucket < least(aw.end_at, :since)
+        ORDER BY r.bucket DESC LIMIT 1
+    ) AS a
+"""
+
+
+def rollup_name(table: str, suffix: str) -> str:
+    return f"{table}_{suffix}"
+
+
+def select_rollup(interval_minutes: int) -> tuple[str, int] | None:
+    """
+    Rollup le plus grossier compatible avec l'intervalle de lissage (résolution qui divise l'intervalle).
+    """
+    compatible = [(suffix, minutes) for suffix, minutes in ROLLUP_RESOLUTIONS if interval_minutes % minutes == 0]
+    return compatible[-1] if compatible else None
+
+
+def iter_rollup(
+    session: Session,
+    table: str,
+    suffix: str,
+    windows: list[TagWindow],
+    since: datetime | None = None,
+    with_sketches: bool = False,
+    anchors: list[TagWindow] | None = None,
+) -> Iterator[tuple]:
+    """
+    Parcourt (bucket, source_address, min, max, moyenne, nombre) par ordre chronologique,
+    pour les intervalles commençant dans une période d'affectation de leur balise.
+    Avec with_sketches, chaque ligne se termine par les bins et compteurs du sketch (rollups PostgreSQL seulement).
+    Rollup PostgreSQL : les intervalles postérieurs au watermark sont agrégés depuis les mesures brutes.
+    anchors (avec since) : ajoute le dernier intervalle de chacune de ces périodes antérieur à since, pour interpoler
+    les points suivants ; les mesures brutes postérieures au watermark sont alors lues depuis le début des périodes.
+    """
+    merged_windows = merge_tag_windows(windows)
+    rollup = rollup_name(table, suffix)
+    raw_tail = ""
+    if session.execute(text("SELECT to_regclass(:table) IS NOT NULL"), {"table": WATERMARK_TABLE}).scalar():
+        column = ROLLUP_SOURCES[table]
+        raw_tail = _RAW_TAIL_QUERY.format(
+            table=table,
+            column=column,
+            watermark_table=WATERMARK_TABLE,
+            sketch_bin=sketch_bin_sql(f"t.{column}") if with_sketches else "0",
+            sketch_arrays=(
+                ", array_agg(sketch_bin ORDER BY sketch_bin), array_agg(value_count ORDER BY sketch_bin)"
+                if with_sketches else ""
+            ),
+            since=(
+                "AND t.time >= :since" if since and anchors is None
+                else "AND t.time >= :anchor_floor" if since else ""
+            ),
+        )
+    anchor_query = ""
+    if since and anchors is not None:
+        anchor_query = _ANCHOR_QUERY.format(
+            rollup=rollup,
+            sketch_columns=", a.sketch_bins, a.sketch_counts" if with_sketches else "",
+        )
+
+    statement = f"""
+        WITH w AS (
+            SELECT * FROM unnest(CAST(:sources AS text[]), CAST(:starts AS timestamptz[]), CAST(:ends AS timestamptz[]))
+                AS w(source_address, start_at, end_at)
+        )
+        SELECT r.bucket, r.source_address, r.min_value, r.max_value, r.avg_value, r.value_count
+               {", r.sketch_bins, r.sketch_counts" if with_sketches else ""}
+        FROM w
+        JOIN {rollup} AS r
+          ON r.source_address = w.source_address AND r.bucket >= w.start_at AND r.bucket < w.end_at
+        {"WHERE r.bucket >= :since" if since else ""}
+        {raw_tail}
+        {anchor_query}
+        ORDER BY bucket
+    """
+    result = session.execute(
+        text(statement),
+        {
+            "sources": [window.source_address for window in merged_windows],
+            "starts": [window.bounds[0] for window in merged_windows],
+            "ends": [window.bounds[1] for window in merged_windows],
+            "anchor_sources": [window.source_address for window in anchors or []],
+            "anchor_starts": [window.bounds[0] for window in anchors or []],
+            "anchor_ends": [window.bounds[1] for window in anchors or []],
+            "anchor_floor": min((window.bounds[0] for window in anchors or []), default=since),
+            "since": since,
+            "rollup": rollup,
+            "width": dict(ROLLUP_RESOLUTIONS)[suffix] * 60,
+        },
+        execution_options={"yield_per": 10_000},
+    )
+    for row in result:
+        yield tuple(row)
+
+
+def rollup_has_sketches(session: Session, table: str, suffix: str) -> bool:
+    """
+    Les continuous aggregates TimescaleDB n'ont pas de sketch (agrégation imbriquée impossible).
+    """
+    return session.execute(
+        text("""
+            SELECT EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = :rollup AND column_name = 'sketch_bins'
+            )
+        """),
+        {"rollup": rollup_name(table, suffix)}
+    ).scalar()
+
+
+def create_rollups(session: Session, timescale: bool = False) -> None:
+    """
+    Crée les rollups (idempotent).
+    Un rollup PostgreSQL créé avant l'ajout des sketches reçoit les colonnes et sera recalculé entièrement
+    au prochain rafraîchissement.
+    """
+    if not timescale:
+        session.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+                rollup text PRIMARY KEY,
+                watermark timestamptz NOT NULL
+            )
+        """))
+
+    for table, column in ROLLUP_SOURCES.items():
+        for suffix, minutes in ROLLUP_RESOLUTIONS:
+            rollup = rollup_name(table, suffix)
+            if timescale:
+                session.execute(text(f"""
+                    CREATE MATERIALIZED VIEW IF NOT EXISTS {rollup}
+                    WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+                    SELECT time_bucket(INTERVAL '{minutes} minutes', time) AS bucket,
+                           source_address,
+                           min({column})::float8 AS min_value,
+                           max({column})::float8 AS max_value,
+                           avg({column})::float8 AS avg_value,
+                           count({column}) AS value_count
+                    FROM {table}
+                    WHERE {column} IS NOT NULL
+                    GROUP BY bucket, source_address
+                    WITH NO DATA
+                """))
+                # Agrégation temps réel, aussi pour un continuous aggregate créé sans
+                session.execute(text(f"ALTER MATERIALIZED VIEW {rollup} SET (timescaledb.materialized_only = false)"))
+                session.execute(text(f"""
+                    SELECT add_continuous_aggregate_policy(
+                        '{rollup}',
+                        start_offset => INTERVAL '{minutes * (LATE_BUCKETS + 1)} minutes',
+                        end_offset => INTERVAL '{minutes} minutes',
+                        schedule_interval => INTERVAL '{minutes} minutes',
+                        if_not_exists => true
+                    )
+                """))
+            else:
+                exists = session.execute(text("SELECT to_regclass(:rollup) IS NOT NULL"), {"rollup": rollup}).scalar()
+                if exists and not rollup_has_sketches(session, table, suffix):
+                    session.execute(text(f"""
+                        ALTER TABLE {rollup}
+                            ADD COLUMN sketch_bins integer[],
+                            ADD COLUMN sketch_counts integer[]
+                    """))
+                    session.execute(text(f"DELETE FROM {WATERMARK_TABLE} WHERE rollup = :rollup"), {"rollup": rollup})
+
+                session.execute(text(f"""
+                    CREATE TABLE IF NOT EXISTS {rollup} (
+                        bucket timestamptz NOT NULL,
+                        source_address text NOT NULL,
+                        min_value float8,
+                        max_value float8,
+                        avg_value float8,
+                        value_count bigint NOT NULL,
+                        sketch_bins integer[],
+                        sketch_counts integer[],
+                        PRIMARY KEY (source_address, bucket)
+                    )
+                """))
+                session.execute(text(f"CREATE INDEX IF NOT EXISTS {rollup}_bucket_idx ON {rollup} (bucket)"))
+
+    session.commit()
+
+
+def refresh_rollups(session: Session, now: datetime | None = None) -> dict[str, datetime]:
+    """
+    Rafraîchissement incrémental des rollups PostgreSQL (mode sans Timescale).
+
+    Seuls les intervalles terminés depuis le watermark (moins LATE_BUCKETS intervalles) sont recalculés
+    depuis les données brutes puis écrits en upsert. Retourne les nouveaux watermarks.
+    """
+    now = now or datetime.now(UTC)
+    watermarks = {}
+
+    for table, column in ROLLUP_SOURCES.items():
+        for suffix, minutes in ROLLUP_RESOLUTIONS:
+            rollup = rollup_name(table, suffix)
+            width = minutes * 60
+            until = datetime.fromtimestamp(int(now.timestamp()) // width * width, tz=UTC)
+
+            watermark = session.execute(
+                text(f"SELECT watermark FROM {WATERMARK_TABLE} WHERE rollup = :rollup"),
+                {"rollup": rollup}
+            ).scalar()
+            since = watermark - timedelta(minutes=minutes * LATE_BUCKETS) if watermark else None
+
+            session.execute(
+                text(f"""
+                    INSERT INTO {rollup} (bucket, source_address, min_value, max_value, avg_value, value_count,
+                                          sketch_bins, sketch_counts)
+                    SELECT bucket, source_address, min(min_value), max(max_value),
+                           sum(value_sum) / sum(value_count), sum(value_count),
+                           array_agg(sketch_bin ORDER BY sketch_bin), array_agg(value_count ORDER BY sketch_bin)
+                    FROM (
+                        SELECT to_timestamp(floor(extract(epoch FROM time) / :width) * :width) AS bucket,
+                               source_address, {sketch_bin_sql(column)} AS sketch_bin,
+                               min({column}) AS min_value, max({column}) AS max_value,
+                               sum({column}::float8) AS value_sum, count({column})::integer AS value_count
+                        FROM {table}
+                        WHERE {column} IS NOT NULL AND source_address IS NOT NULL
+                          AND time < :until {"AND time >= :since" if since else ""}
+                        GROUP BY 1, 2, 3
+                    ) AS binned
+                    GROUP BY bucket, source_address
+                    ON CONFLICT (source_address, bucket) DO UPDATE SET
+                        min_value = EXCLUDED.min_value,
+                        max_value = EXCLUDED.max_value,
+                        avg_value = EXCLUDED.avg_value,
+                        value_count = EXCLUDED.value_count,
+                        sketch_bins = EXCLUDED.sketch_bins,
+                        sketch_counts = EXCLUDED.sketch_counts
+                """),
+                {"width": width, "until": until, "since": since}
+            )
+            session.execute(
+                text(f"""
+                    INSERT INTO {WATERMARK_TABLE} (rollup, watermark) VALUES (:rollup, :until)
+                    ON CONFLICT (rollup) DO UPDATE SET watermark = EXCLUDED.watermark
+                """),
+                {"rollup": rollup, "until": until}
+            )
+            session.commit()
+            watermarks[rollup] = until
+
+    return watermarks
+
+
+if __name__ == "__main__":
+    from app.src.common.logging import setup_logging
+    from app.src.infrastructure.db.session import engine_recorded
+
+    setup_logging()
+
+    parser = argparse.ArgumentParser(description="Gestion des rollups de la base enregistrée")
+    parser.add_argument("command", choices=["create", "refresh"])
+    parser.add_argument("--timescale", action="store_true", help="Utiliser les continuous aggregates TimescaleDB")
+    args = parser.parse_args()
+
+    # Connexion dédiée sans statement_timeout : un rafraîchissement peut durer plus longtemps qu'une requête d'API
+    with engine_recorded.connect() as rollup_connection:
+        rollup_connection.exec_driver_sql("SET statement_timeout = 0")
+        rollup_connection.commit()
+        with Session(rollup_connection) as rollup_session:
+            if args.command == "create":
+                create_rollups(rollup_session, timescale=args.timescale)
+            else:
+                for name, value in refresh_rollups(rollup_session).items():
+                    logger.info(f"{name} rafraîchi jusqu'à {value.isoformat()}")
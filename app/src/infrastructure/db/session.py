@@ -1,10 +1,104 @@
-from collections.abc import Generator
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.src.infrastructure.db.pool import REQUEST_FAN_OUT, async_warm_up, engine_options, pool_stats, warm_up
 from app.src.presentation.core.config import settings
 
-engine_main = create_engine(settings.database_url, echo=True)
-engine_recorded = create_engine(settings.database_recorded_url, echo=True)
+logger = logging.getLogger(__name__)
+
+# Taille des pools : budget de connexions divisé par workers et moteurs (infrastructure/db/pool.py)
+engine_main = create_engine(settings.database_url, **engine_options("psycopg2"))
+engine_recorded = create_engine(settings.database_recorded_url, **engine_options("psycopg2", REQUEST_FAN_OUT))
+
+# Moteurs asyncpg, utilisés par les routes data et sensor
+async_engine_main = create_async_engine(settings.database_async_url, **engine_options("asyncpg"))
+async_engine_recorded = create_async_engine(
+    settings.database_recorded_async_url, **engine_options("asyncpg", REQUEST_FAN_OUT)
+)
+
+# Lectures sur le réplica : sans réplica configuré, ce sont les moteurs du primaire
+if settings.replica_enabled:
+    engine_main_replica = create_engine(settings.database_replica_url, **engine_options("psycopg2"))
+    engine_recorded_replica = create_engine(
+        settings.database_recorded_replica_url, **engine_options("psycopg2", REQUEST_FAN_OUT)
+    )
+    async_engine_main_replica = create_async_engine(settings.database_replica_async_url, **engine_options("asyncpg"))
+    async_engine_recorded_replica = create_async_engine(
+        settings.database_recorded_replica_async_url, **engine_options("asyncpg", REQUEST_FAN_OUT)
+    )
+else:
+    engine_main_replica = engine_main
+    engine_recorded_replica = engine_recorded
+    async_engine_main_replica = async_engine_main
+    async_engine_recorded_replica = async_engine_recorded
+
+
+def _engines() -> dict[str, Engine]:
+    engines = {"main": engine_main, "recorded": engine_recorded}
+    if settings.replica_enabled:
+        engines.update({"main_replica": engine_main_replica, "recorded_replica": engine_recorded_replica})
+    return engines
+
+
+def _async_engines() -> dict[str, AsyncEngine]:
+    engines = {"async_main": async_engine_main, "async_recorded": async_engine_recorded}
+    if settings.replica_enabled:
+        engines.update({
+            "async_main_replica": async_engine_main_replica,
+            "async_recorded_replica": async_engine_recorded_replica,
+        })
+    return engines
+
+
+def reset_engines_after_fork() -> None:
+    """
+    Appelé dans chaque worker juste après le fork (gunicorn preload_app) : les moteurs sont créés à l'import
+    dans le processus maître, le worker repart de pools vides. close=False laisse au maître ses propres
+    connexions, les fermer depuis le worker couperait des sockets partagées.
+    """
+    for engine in _engines().values():
+        engine.dispose(close=False)
+    for async_engine in _async_engines().values():
+        async_engine.sync_engine.dispose(close=False)
+
+
+async def warm_up_engines(count: int) -> None:
+    """Ouvre les premières connexions de chaque pool avant que le worker ne reçoive des requêtes"""
+    if count <= 0:
+        return
+
+    for name, engine in _engines().items():
+        try:
+            opened = await asyncio.to_thread(warm_up, engine, count)
+            logger.info(f"Pool {name} warmed up with {opened} connections")
+        except Exception as e:
+            # La base peut être indisponible au démarrage : pool_pre_ping reconnectera à la demande
+            logger.warning(f"Warm-up of pool {name} failed: {e}")
+
+    for name, async_engine in _async_engines().items():
+        try:
+            opened = await async_warm_up(async_engine, count)
+            logger.info(f"Pool {name} warmed up with {opened} connections")
+        except Exception as e:
+            logger.warning(f"Warm-up of pool {name} failed: {e}")
+
+
+async def dispose_engines() -> None:
+    """Ferme les connexions du worker à l'arrêt"""
+    for engine in _engines().values():
+        engine.dispose()
+    for async_engine in _async_engines().values():
+        await async_engine.dispose()
+
+
+def engines_pool_stats() -> dict[str, dict]:
+    return pool_stats({**_engines(), **_async_engines()})
+
 
 def get_session() -> Generator[Session, None, None]:
     with Session(engine_main) as session:
@@ -12,4 +106,26 @@ def get_session() -> Generator[Session, None, None]:
 
 def get_session_recorded() -> Generator[Session, None, None]:
     with Session(engine_recorded) as session:
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(async_engine_main) as session:
+        yield session
+
+async def get_async_session_recorded() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(async_engine_recorded) as session:
+        yield session
+
+
+# Sessions de lecture : le réplica, sauf si la requête doit voir ses propres écritures (presentation/api/read_routing.py)
+def read_session(replica: bool) -> Session:
+    return Session(engine_main_replica if replica else engine_main)
+
+def read_session_recorded(replica: bool) -> Session:
+    return Session(engine_recorded_replica if replica else engine_recorded)
+
+def async_read_session(replica: bool) -> AsyncSession:
+    return AsyncSession(async_engine_main_replica if replica else async_engine_main)
+
+def async_read_session_recorded(replica: bool) -> AsyncSession:
+    return AsyncSession(async_engine_recorded_replica if replica else async_engine_recorded)
@@ -14,7 +14,7 @@ from app.src.use_cases.building.create_building_use_case import CreateBuildingUs
 from app.src.use_cases.building.get_building_list_use_case import GetBuildingListUseCase
 from app.src.use_cases.building.get_building_by_id_use_case import GetBuildingByIdUseCase
 from app.src.presentation.api.common.generic_model import PaginationMetadataModel
-from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses
+from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses, invalid_cursor
 from app.src.presentation.api.building.building_model import (
     PaginatedListBuildingModelResponse,
     BuildingCreateModelRequest,
@@ -31,6 +31,7 @@ from app.src.presentation.dependencies import (
 from app.src.common.exception import (
     AlreadyExistsError,
     CreationFailedError,
+    DecodedFailedError,
     DeletionFailedError,
     ForeignKeyConstraintError,
     NotFoundError,
@@ -121,7 +122,7 @@ async def create_building(
     summary="Retrieve a list of buildings",
     response_model=PaginatedListBuildingModelResponse,
     response_description="Detailed information of the requested buildings",
-    responses=generate_responses([unexpected_error]),
+    responses=generate_responses([invalid_cursor, unexpected_error]),
     deprecated=False,
 )
 async def read_building_list(
@@ -129,15 +130,17 @@ async def read_building_list(
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     cursor: str | None = Query(None, description="Pagination cursor"),
     limit: int | None = Query(20, ge=1, description="Number of elements return"),
+    with_total: bool = Query(True, description="Count the elements of the collection"),
 ):
     """
     Retrieve a list of buildings
 
-    - **cursor**: Optional cursor for pagination (returns buildings with id >= cursor)
+    - **cursor**: Optional cursor returned in the metadata of a previous chunk (first, last, next or previous)
     - **limit**: Number of buildings to return (default: 20)
+    - **with_total**: If false, skip counting the collection (total and chunk_count are null)
     """
     try:
-        result = use_case.execute(cursor, limit)
+        result = use_case.execute(cursor, limit, with_total=with_total)
 
         building_models = [BuildingModelResponse(**building.to_dict()) for building in result.buildings]
 
@@ -149,12 +152,15 @@ async def read_building_list(
             first_cursor=result.first_cursor,
             last_cursor=result.last_cursor,
             next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
         )
 
         response = PaginatedListBuildingModelResponse(data=building_models, metadata=metadata)
 
         return response
 
+    except DecodedFailedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
@@ -0,0 +1,100 @@
+"""
+Décodage des lots de lignes envoyés en corps de requête, au fil de la réception.
+
+Formats (Content-Type) :
+- application/x-ndjson : un objet JSON par ligne
+- text/csv : ligne d'en-tête avec les noms de colonnes, puis une ligne par mesure (pas de retour à la ligne
+  dans les valeurs)
+Le corps peut être compressé (Content-Encoding: gzip). Les lignes vides sont ignorées.
+"""
+import csv
+import json
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from typing import Any
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+BATCH_MEDIA_TYPES = (NDJSON_MEDIA_TYPE, CSV_MEDIA_TYPE)
+
+_MAX_DECOMPRESSED_CHUNK = 65_536
+
+DecodedRow = tuple[int, dict[str, Any] | ValueError]
+
+
+async def _decompress(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    # Morceaux décompressés bornés : un gzip de mesures est compressé ~20 fois, et décoder de très gros morceaux
+    # d'un coup crée assez d'objets pour multiplier les passages du ramasse-miettes
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        while chunk:
+            yield decompressor.decompress(chunk, _MAX_DECOMPRESSED_CHUNK)
+            chunk = decompressor.unconsumed_tail
+    yield decompressor.flush()
+    if not decompressor.eof or decompressor.unused_data:
+        raise zlib.error("Truncated gzip body or data after the gzip stream")
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes], gzipped: bool) -> AsyncIterator[list[bytes]]:
+    """Lignes complètes de chaque morceau reçu"""
+    pending = b""
+    async for chunk in _decompress(chunks) if gzipped else chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        if lines:
+            yield lines
+    if pending:
+        yield [pending]
+
+
+def _decode_ndjson(lines: list[bytes], first_line: int) -> Iterator[DecodedRow]:
+    # Chaque ligne est décodée seule : un json.loads du morceau entier accepterait des objets répartis
+    # sur plusieurs lignes et attribuerait les mesures aux mauvais numéros de ligne
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, ValueError(f"invalid JSON: {e}")
+            continue
+        yield line_number, row if isinstance(row, dict) else ValueError("expected a JSON object")
+
+
+def _decode_csv(lines: list[bytes], first_line: int, header: list[str]) -> Iterator[DecodedRow]:
+    reader = csv.reader(line.decode("utf-8", errors="replace").rstrip("\r") for line in lines)
+    for line_number, values in enumerate(reader, first_line):
+        if not values:
+            continue
+        if len(values) != len(header):
+            yield line_number, ValueError(f"expected {len(header)} fields, got {len(values)}")
+            continue
+        yield line_number, dict(zip(header, values, strict=True))
+
+
+async def iter_batch_rows(
+    chunks: AsyncIterable[bytes],
+    media_type: str,
+    gzipped: bool = False
+) -> AsyncIterator[list[DecodedRow]]:
+    """
+    (numéro de ligne, ligne) par morceau reçu ; une ligne illisible est remplacée par l'erreur de décodage.
+    Lève zlib.error si le corps compressé est invalide.
+    """
+    line_number = 1
+    header: list[str] | None = None
+    async for lines in _iter_lines(chunks, gzipped):
+        first_line = line_number
+        line_number += len(lines)
+        if media_type == NDJSON_MEDIA_TYPE:
+            yield list(_decode_ndjson(lines, first_line))
+            continue
+
+        if header is None:
+            while lines and not lines[0].strip():
+                lines, first_line = lines[1:], first_line + 1
+            if not lines:
+                continue
+            header = next(csv.reader([lines[0].decode("utf-8-sig", errors="replace").rstrip("\r")]))
+            lines, first_line = lines[1:], first_line + 1
+        yield list(_decode_csv(lines, first_line, header))
@@ -0,0 +1,133 @@
+"""
+Format binaire colonnaire des séries temporelles, négocié avec `Accept: application/vnd.h2optimize.columnar`.
+
+Disposition (little-endian) :
+    4 octets    magic b"H2TS"
+    uint32      taille N de l'en-tête
+    N octets    en-tête JSON (UTF-8)
+    ...         blocs des colonnes, chacun aligné sur 8 octets
+
+L'en-tête reprend la réponse JSON habituelle, chaque colonne packée étant remplacée par un descripteur :
+    {"offset": o, "count": n, "dtype": "<f4"}               valeurs (NaN pour null)
+    {"offset": o, "count": n, "dtype": "<i4", "base": b}    timestamps epoch ms : base + cumsum(deltas)
+`offset` est relatif au début des blocs (8 + N). Les deltas sont en int32, ou int64 si un écart dépasse int32.
+
+Lecture avec numpy : voir `decode_columnar`.
+"""
+import json
+import struct
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.h2optimize.columnar"
+MAGIC = b"H2TS"
+
+_INT32 = np.iinfo(np.int32)
+
+
+class _ColumnWriter:
+    def __init__(self):
+        self.blocks: list[bytes] = []
+        self.size = 0
+
+    def _append(self, array: np.ndarray) -> int:
+        offset = self.size
+        block = array.tobytes()
+        padding = -len(block) % 8
+        self.blocks.append(block + b"\0" * padding)
+        self.size += len(block) + padding
+        return offset
+
+    def values(self, values: list, dtype: str) -> dict[str, Any]:
+        array = np.asarray([np.nan if value is None else value for value in values], dtype=dtype)
+        return {"offset": self._append(array), "count": int(array.size), "dtype": dtype}
+
+    def timestamps(self, timestamps_ms: list[int]) -> dict[str, Any]:
+        array = np.asarray(timestamps_ms, dtype=np.int64)
+        base = int(array[0]) if array.size else 0
+        deltas = np.diff(array, prepend=base)
+        fits_int32 = deltas.size == 0 or (deltas.min() >= _INT32.min and deltas.max() <= _INT32.max)
+        dtype = "<i4" if fits_int32 else "<i8"
+        return {"offset": self._append(deltas.astype(dtype)), "count": int(deltas.size), "dtype": dtype, "base": base}
+
+    def pack(self, header: dict[str, Any]) -> bytes:
+        encoded_header = json.dumps(header, separators=(",", ":"), default=str).encode()
+        return MAGIC + struct.pack("<I", len(encoded_header)) + encoded_header + b"".join(self.blocks)
+
+
+def encode_rooms_sensor_data(rooms: list[dict[str, Any]], total_rooms: int) -> bytes:
+    """
+    Réponse de /data/rooms : chaque série [[timestamp_ms, valeur]] devient {"timestamps": ..., "values": ...}.
+    """
+    writer = _ColumnWriter()
+    rooms_header = []
+    for room in rooms:
+        room_header = dict(room)
+        for sensor_type in ["temperature", "humidity", "pressure"]:
+            if sensor_type not in room:
+                continue
+
+            points = room[sensor_type].get("data", [])
+            room_header[sensor_type] = {
+                **room[sensor_type],
+                "data": {
+                    "timestamps": writer.timestamps([point[0] for point in points]),
+                    "values": writer.values([point[1] for point in points], "<f4"),
+                }
+            }
+        rooms_header.append(room_header)
+
+    return writer.pack({"data": rooms_header, "total_rooms": total_rooms})
+
+
+def encode_rows(rows: list[dict[str, Any]]) -> bytes:
+    """
+    Lignes brutes d'une table de capteurs, colonne par colonne :
+    dates -> timestamps, float -> <f4, int -> <i8 (<f8 si null), autres -> liste JSON dans l'en-tête.
+    """
+    writer = _ColumnWriter()
+    columns = {}
+    for name in rows[0] if rows else []:
+        values = [row[name] for row in rows]
+        present = [value for value in values if value is not None]
+        sample = present[0] if present else None
+
+        if isinstance(sample, datetime) and len(present) == len(values):
+            columns[name] = writer.timestamps([int(value.timestamp() * 1000) for value in values])
+        elif isinstance(sample, float):
+            columns[name] = writer.values(values, "<f4")
+        elif isinstance(sample, int) and not isinstance(sample, bool):
+            columns[name] = writer.values(values, "<i8" if len(present) == len(values) else "<f8")
+        else:
+            columns[name] = {"values": values}
+
+    return writer.pack({"count": len(rows), "columns": columns})
+
+
+def decode_columnar(payload: bytes) -> dict[str, Any]:
+    """
+    Relit une réponse colonnaire : les descripteurs sont remplacés par des tableaux numpy
+    (timestamps en epoch ms int64).
+    """
+    if payload[:4] != MAGIC:
+        raise ValueError("Not a columnar payload")
+
+    (header_size,) = struct.unpack_from("<I", payload, 4)
+    header = json.loads(payload[8:8 + header_size])
+    body = memoryview(payload)[8 + header_size:]
+
+    def resolve(node):
+        if isinstance(node, dict) and "offset" in node and "dtype" in node:
+            array = np.frombuffer(body, dtype=node["dtype"], count=node["count"], offset=node["offset"])
+            if "base" in node:
+                return node["base"] + np.cumsum(array, dtype=np.int64)
+            return array
+        if isinstance(node, dict):
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(header)
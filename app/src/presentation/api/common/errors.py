@@ -22,3 +22,8 @@ def generate_responses(errors: list[OpenApiErrorResponseConfig]) -> dict[int, di
         }
 
     return responses
+
+
+invalid_cursor = OpenApiErrorResponseConfig(
+    code=400, description="Invalid cursor", detail="Failed to decode pagination cursor"
+)
@@ -2,13 +2,14 @@ from pydantic import BaseModel, Field
 
 
 class PaginationMetadataModel(BaseModel):
-    total: int = Field(..., ge=0, description="Total number of elements in the collection")
+    total: int | None = Field(..., ge=0, description="Total number of elements in the collection, if counted")
     chunk_size: int = Field(..., ge=0, description="Number of elements returned in the current chunk")
-    chunk_count: int = Field(..., ge=0, description="Total number of chunks available")
+    chunk_count: int | None = Field(..., ge=0, description="Total number of chunks available, if counted")
     current_cursor: str | None = Field(None, description="Cursor of the current chunk")
     first_cursor: str | None = Field(None, description="Cursor of the first chunk")
     last_cursor: str | None = Field(None, description="Cursor of the last chunk")
     next_cursor: str | None = Field(None, description="Cursor to fetch the next chunk, if any")
+    prev_cursor: str | None = Field(None, description="Cursor to fetch the previous chunk, if any")
 
 class OffsetBasePaginationMetadataModel(BaseModel):
     total: int = Field(..., ge=0, description="Total number of elements in the collection")
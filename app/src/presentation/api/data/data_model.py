@@ -20,15 +20,26 @@ class RoomTagModel(BaseModel):
     updated_at: str | None = Field(None, description="Date de mise à jour de la relation")
 
 
+class QuantilesModel(BaseModel):
+    p5: float | None = Field(None, description="5e centile")
+    p50: float | None = Field(None, description="Médiane")
+    p95: float | None = Field(None, description="95e centile")
+
+
 class SensorDataStatsModel(BaseModel):
     min: float | None = Field(None, description="Valeur minimale")
     max: float | None = Field(None, description="Valeur maximale")
     average: float | None = Field(None, description="Valeur moyenne")
-    nombre_values: int = Field(0, description="Nombre de valeurs")
+    nombre_values: int | None = Field(0, description="Nombre de valeurs (null avec with_stats=false)")
     data: list[list[float]] = Field(
         default_factory=list, 
         description="Données au format [[timestamp_ms, valeur]]"
     )
+    quantiles: QuantilesModel | None = Field(None, description="Quantiles sur la période (avec quantiles=true)")
+    quantile_data: list[list[float]] | None = Field(
+        None,
+        description="Quantiles par intervalle au format [[timestamp_ms, p5, p50, p95]] (avec quantiles=true)"
+    )
 
 
 class RoomSensorDataModel(BaseModel):
@@ -59,6 +70,26 @@ class SingleRoomSensorDataResponseModel(BaseModel):
     data: RoomSensorDataModel = Field(..., description="Données de la piece avec capteurs")
 
 
+class LatestValueModel(BaseModel):
+    value: float = Field(..., description="Moyenne des dernières mesures des balises de la pièce")
+    time: str = Field(..., description="Date de la mesure la plus récente")
+
+
+class RoomLatestValuesModel(BaseModel):
+    id: int = Field(..., description="ID de la piece")
+    name: str = Field(..., description="Nom de la piece")
+    floor: int | None = Field(None, description="Étage de la piece")
+    building_id: int = Field(..., description="ID du bâtiment")
+    temperature: LatestValueModel | None = Field(None, description="Température courante")
+    humidity: LatestValueModel | None = Field(None, description="Humidité courante")
+    pressure: LatestValueModel | None = Field(None, description="Pression atmosphérique courante")
+
+
+class RoomsLatestValuesResponseModel(BaseModel):
+    data: list[RoomLatestValuesModel] = Field(..., description="Valeurs courantes par piece")
+    total_rooms: int = Field(..., description="Nombre total de pieces retournées")
+
+
 class SensorDataQueryParams(BaseModel):
     room_ids: list[int] | None = Field(
         None, 
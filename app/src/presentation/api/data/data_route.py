@@ -1,25 +1,30 @@
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 
 from app.src.domain.entities.role import Role
 from app.src.domain.entities.user import User
-from app.src.presentation.api.data.data_model import RoomSensorDataModel, RoomTagModel, RoomsSensorDataResponseModel, SensorDataStatsModel, SingleRoomSensorDataResponseModel, TagInfoModel
+from app.src.presentation.api.data.data_model import RoomLatestValuesModel, RoomSensorDataModel, RoomTagModel, RoomsLatestValuesResponseModel, RoomsSensorDataResponseModel, SensorDataStatsModel, SingleRoomSensorDataResponseModel, TagInfoModel
+from app.src.presentation.api.common.columnar import COLUMNAR_MEDIA_TYPE, encode_rooms_sensor_data
 from app.src.presentation.api.secure_ressources import secure_ressources
 from app.src.presentation.core.open_api_tags import OpenApiTags
 from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses
 
 from app.src.presentation.dependencies import (
-    get_rooms_sensor_data_use_case,
-    get_single_room_sensor_data_use_case
+    get_rooms_latest_values_async_use_case,
+    get_rooms_sensor_data_async_use_case,
+    get_single_room_sensor_data_async_use_case
 )
 
 
 from app.src.common.exception import NotFoundError
-from app.src.use_cases.data.get_rooms_sensor_data_use_case import GetRoomsSensorDataUseCase
-from app.src.use_cases.data.get_single_room_sensor_use_case import GetSingleRoomSensorDataUseCase
+from app.src.use_cases.data.get_rooms_latest_values_async_use_case import GetRoomsLatestValuesAsyncUseCase
+from app.src.use_cases.data.get_rooms_sensor_data_async_use_case import GetRoomsSensorDataAsyncUseCase
+from app.src.use_cases.data.get_single_room_sensor_async_use_case import GetSingleRoomSensorDataAsyncUseCase
 
 room_not_found = OpenApiErrorResponseConfig(
     code=404, 
@@ -37,6 +42,18 @@ unexpected_error = OpenApiErrorResponseConfig(
     detail="Internal server error"
 )
 
+# Réponse en streaming : une pièce (RoomSensorDataModel) par ligne
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ndjson_response = {
+    200: {
+        "description": (
+            f"Avec `Accept: {NDJSON_MEDIA_TYPE}` : une pièce par ligne, envoyée dès qu'elle est calculée. "
+            f"Avec `Accept: {COLUMNAR_MEDIA_TYPE}` : séries en colonnes binaires (voir api/common/columnar.py)"
+        ),
+        "content": {NDJSON_MEDIA_TYPE: {}, COLUMNAR_MEDIA_TYPE: {}},
+    }
+}
+
 logger = logging.getLogger(__name__)
 
 data_router = APIRouter(
@@ -50,11 +67,12 @@ data_router = APIRouter(
     summary="Récupérer les données de capteurs pour plusieurs pièces",
     response_model=RoomsSensorDataResponseModel,
     response_description="Données agrégées et lissées des capteurs pour les pièces",
-    responses=generate_responses([invalid_params, unexpected_error]),
+    responses={**ndjson_response, **generate_responses([invalid_params, unexpected_error])},
     deprecated=False,
 )
 async def get_rooms_sensor_data(
-    use_case: Annotated[GetRoomsSensorDataUseCase, Depends(get_rooms_sensor_data_use_case)],
+    request: Request,
+    use_case: Annotated[GetRoomsSensorDataAsyncUseCase, Depends(get_rooms_sensor_data_async_use_case)],
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     room_ids: list[int] | None = Query(
         None,
@@ -70,6 +88,24 @@ async def get_rooms_sensor_data(
         le=1440,
         description="Intervalle de lissage en minutes (1-1440, défaut: 30)"
     ),
+    since: datetime | None = Query(
+        None,
+        description="Timestamp du dernier point déjà reçu (ISO ou epoch ms) : seuls les points suivants sont renvoyés"
+    ),
+    max_points: int | None = Query(
+        None,
+        ge=3,
+        le=100_000,
+        description="Nombre maximum de points par série (sous-échantillonnage LTTB, pics conservés)"
+    ),
+    quantiles: bool = Query(
+        False,
+        description="Ajouter les quantiles p5 / p50 / p95 sur la période et par intervalle de lissage"
+    ),
+    with_stats: bool = Query(
+        True,
+        description="Avec since : si false, statistiques et quantiles sur la période ne sont pas recalculés (null)"
+    ),
 ):
     """
     Récupère les données de capteurs agrégées et lissées pour plusieurs rooms.
@@ -86,52 +122,57 @@ async def get_rooms_sensor_data(
     - **room_ids**: IDs des rooms (optionnel, toutes si omis)
     - **first_value_date**: Date de début
     - **smooth_interval_minutes**: Lissage en minutes (1-1440)
+    - **since**: Dernier point reçu (mode incrémental, statistiques mises à jour)
+    - **max_points**: Nombre maximum de points par série (LTTB)
+    - **quantiles**: Quantiles p5 / p50 / p95 (sketch, ±1 %), intervalles alignés sur l'epoch
+    - **with_stats**: Si false avec since, seuls les nouveaux points sont lus : les statistiques de la période
+      (min, max, moyenne, nombre, quantiles) portent sur toute la période et imposent de la relire
+
+    **Streaming:**
+    - Avec `Accept: application/x-ndjson`, une pièce par ligne (triées par id), sans enveloppe `data` / `total_rooms`
+
+    **Format binaire:**
+    - Avec `Accept: application/vnd.h2optimize.columnar`, séries packées (timestamps int delta, valeurs float32)
     
     **Exemple URL:**
     `/room/sensor-data/rooms?room_ids=1&room_ids=2&first_value_date=2024-01-01T00:00:00&smooth_interval_minutes=60`
     """
     try:
-        result = use_case.execute(
+        accept = request.headers.get("accept", "")
+        if NDJSON_MEDIA_TYPE in accept:
+            rooms = use_case.stream(
+                room_ids=room_ids,
+                first_value_date=first_value_date,
+                smooth_interval_minutes=smooth_interval_minutes,
+                since=since,
+                max_points=max_points,
+                quantiles=quantiles,
+                with_stats=with_stats
+            )
+            return StreamingResponse(
+                _iter_ndjson(rooms),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers={"Vary": "Accept"}
+            )
+
+        result = await use_case.execute(
             room_ids=room_ids,
             first_value_date=first_value_date,
-            smooth_interval_minutes=smooth_interval_minutes
+            smooth_interval_minutes=smooth_interval_minutes,
+            since=since,
+            max_points=max_points,
+            quantiles=quantiles,
+            with_stats=with_stats
         )
 
-        rooms_data = []
-        for room_data in result.rooms_data:
-            tags_models = []
-            for tag_data in room_data.get("tags", []):
-                tag_model = RoomTagModel(
-                    id=tag_data["id"],
-                    tag=TagInfoModel(**tag_data["tag"]),
-                    start_at=tag_data["start_at"],
-                    end_at=tag_data["end_at"],
-                    created_at=tag_data["created_at"],
-                    updated_at=tag_data["updated_at"]
-                )
-                tags_models.append(tag_model)
-
-            sensor_data = {}
-            for sensor_type in ["temperature", "humidity", "pressure"]:
-                if sensor_type in room_data:
-                    sensor_data[sensor_type] = SensorDataStatsModel(**room_data[sensor_type])
-
-            room_model = RoomSensorDataModel(
-                id=room_data["id"],
-                name=room_data["name"],
-                description=room_data["description"],
-                floor=room_data["floor"],
-                building_id=room_data["building_id"],
-                area=room_data["area"],
-                capacity=room_data["capacity"],
-                start_at=room_data["start_at"],
-                end_at=room_data["end_at"],
-                created_at=room_data["created_at"],
-                updated_at=room_data["updated_at"],
-                tags=tags_models,
-                **sensor_data
+        if COLUMNAR_MEDIA_TYPE in accept:
+            return Response(
+                content=encode_rooms_sensor_data(result.rooms_data, result.total_rooms),
+                media_type=COLUMNAR_MEDIA_TYPE,
+                headers={"Vary": "Accept"}
             )
-            rooms_data.append(room_model)
+
+        rooms_data = [_build_room_model(room_data) for room_data in result.rooms_data]
 
         return RoomsSensorDataResponseModel(
             data=rooms_data,
@@ -154,6 +195,46 @@ async def get_rooms_sensor_data(
         ) from e
 
 
+@data_router.get(
+    "/rooms/latest",
+    summary="Récupérer la valeur courante des capteurs par pièce",
+    response_model=RoomsLatestValuesResponseModel,
+    response_description="Dernière valeur de chaque type de capteur pour les pièces",
+    responses=generate_responses([unexpected_error]),
+    deprecated=False,
+)
+async def get_rooms_latest_values(
+    use_case: Annotated[GetRoomsLatestValuesAsyncUseCase, Depends(get_rooms_latest_values_async_use_case)],
+    user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
+    room_ids: list[int] | None = Query(
+        None,
+        description="Liste des IDs des pièces (ex: room_ids=1&room_ids=2). Si vide, toutes les pièces."
+    ),
+    building_id: int | None = Query(None, ge=1, description="ID du bâtiment (optionnel)"),
+):
+    """
+    Valeur courante de température, humidité et pression par pièce, pour les tableaux de bord.
+
+    - Seules les balises actuellement affectées à la pièce sont prises en compte
+    - **value** : moyenne des dernières mesures des balises, **time** : date de la plus récente
+    - Pas d'historique : une seule requête (lecture d'index) par balise et par type de capteur
+    """
+    try:
+        rooms = await use_case.execute(room_ids=room_ids, building_id=building_id)
+
+        return RoomsLatestValuesResponseModel(
+            data=[RoomLatestValuesModel(**room) for room in rooms],
+            total_rooms=len(rooms)
+        )
+
+    except Exception as e:
+        logger.error(f"Erreur inattendue dans get_rooms_latest_values: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erreur interne du serveur"
+        ) from e
+
+
 @data_router.get(
     "/room/{room_id}",
     summary="Récupérer les données de capteurs pour une pièce",
@@ -163,7 +244,7 @@ async def get_rooms_sensor_data(
     deprecated=False,
 )
 async def get_single_room_sensor_data(
-    use_case: Annotated[GetSingleRoomSensorDataUseCase, Depends(get_single_room_sensor_data_use_case)],
+    use_case: Annotated[GetSingleRoomSensorDataAsyncUseCase, Depends(get_single_room_sensor_data_async_use_case)],
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     room_id: int = Path(..., ge=1, description="ID de la pièce (entier positif)"),
     first_value_date: datetime | None = Query(
@@ -176,6 +257,24 @@ async def get_single_room_sensor_data(
         le=1440,
         description="Intervalle de lissage en minutes (1-1440, défaut: 30)"
     ),
+    since: datetime | None = Query(
+        None,
+        description="Timestamp du dernier point déjà reçu (ISO ou epoch ms) : seuls les points suivants sont renvoyés"
+    ),
+    max_points: int | None = Query(
+        None,
+        ge=3,
+        le=100_000,
+        description="Nombre maximum de points par série (sous-échantillonnage LTTB, pics conservés)"
+    ),
+    quantiles: bool = Query(
+        False,
+        description="Ajouter les quantiles p5 / p50 / p95 sur la période et par intervalle de lissage"
+    ),
+    with_stats: bool = Query(
+        True,
+        description="Avec since : si false, statistiques et quantiles sur la période ne sont pas recalculés (null)"
+    ),
 ):
     """
     Récupère les données de capteurs agrégées et lissées pour une pièce spécifique.
@@ -184,47 +283,25 @@ async def get_single_room_sensor_data(
     - **room_id**: ID de la pièce (obligatoire, ≥ 1)
     - **first_value_date**: Date de début
     - **smooth_interval_minutes**: Lissage en minutes (1-1440)
+    - **since**: Dernier point reçu (mode incrémental, statistiques mises à jour)
+    - **max_points**: Nombre maximum de points par série (LTTB)
+    - **quantiles**: Quantiles p5 / p50 / p95 (sketch, ±1 %), intervalles alignés sur l'epoch
+    - **with_stats**: Si false avec since, seuls les nouveaux points sont lus : les statistiques de la période
+      (min, max, moyenne, nombre, quantiles) portent sur toute la période et imposent de la relire
     """
     try:
 
-        result = use_case.execute(
+        result = await use_case.execute(
             room_id=room_id,
             first_value_date=first_value_date,
-            smooth_interval_minutes=smooth_interval_minutes
+            smooth_interval_minutes=smooth_interval_minutes,
+            since=since,
+            max_points=max_points,
+            quantiles=quantiles,
+            with_stats=with_stats
         )
 
-        tags_models = []
-        for tag_data in result.get("tags", []):
-            tag_model = RoomTagModel(
-                id=tag_data["id"],
-                tag=TagInfoModel(**tag_data["tag"]),
-                start_at=tag_data["start_at"],
-                end_at=tag_data["end_at"],
-                created_at=tag_data["created_at"],
-                updated_at=tag_data["updated_at"]
-            )
-            tags_models.append(tag_model)
-
-        sensor_data = {}
-        for sensor_type in ["temperature", "humidity", "pressure"]:
-            if sensor_type in result:
-                sensor_data[sensor_type] = SensorDataStatsModel(**result[sensor_type])
-
-        room_model = RoomSensorDataModel(
-            id=result["id"],
-            name=result["name"],
-            description=result["description"],
-            floor=result["floor"],
-            building_id=result["building_id"],
-            area=result["area"],
-            capacity=result["capacity"],
-            start_at=result["start_at"],
-            end_at=result["end_at"],
-            created_at=result["created_at"],
-            updated_at=result["updated_at"],
-            tags=tags_models,
-            **sensor_data
-        )
+        room_model = _build_room_model(result)
 
         return SingleRoomSensorDataResponseModel(data=room_model)
 
@@ -247,4 +324,49 @@ async def get_single_room_sensor_data(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Erreur interne du serveur"
-        ) from e
\ No newline at end of file
+        ) from e
+
+
+async def _iter_ndjson(rooms: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    try:
+        async for room_data in rooms:
+            yield _build_room_model(room_data).model_dump_json() + "\n"
+    except Exception as e:
+        # Statut déjà envoyé : la réponse est interrompue
+        logger.error(f"Erreur pendant le streaming de get_rooms_sensor_data: {e}")
+        raise
+
+
+def _build_room_model(room_data: dict[str, Any]) -> RoomSensorDataModel:
+    tags_models = []
+    for tag_data in room_data.get("tags", []):
+        tag_model = RoomTagModel(
+            id=tag_data["id"],
+            tag=TagInfoModel(**tag_data["tag"]),
+            start_at=tag_data["start_at"],
+            end_at=tag_data["end_at"],
+            created_at=tag_data["created_at"],
+            updated_at=tag_data["updated_at"]
+        )
+        tags_models.append(tag_model)
+
+    sensor_data = {}
+    for sensor_type in ["temperature", "humidity", "pressure"]:
+        if sensor_type in room_data:
+            sensor_data[sensor_type] = SensorDataStatsModel(**room_data[sensor_type])
+
+    return RoomSensorDataModel(
+        id=room_data["id"],
+        name=room_data["name"],
+        description=room_data["description"],
+        floor=room_data["floor"],
+        building_id=room_data["building_id"],
+        area=room_data["area"],
+        capacity=room_data["capacity"],
+        start_at=room_data["start_at"],
+        end_at=room_data["end_at"],
+        created_at=room_data["created_at"],
+        updated_at=room_data["updated_at"],
+        tags=tags_models,
+        **sensor_data
+    )
@@ -14,7 +14,7 @@ from app.src.use_cases.event_room.create_event_room_use_case import CreateEventR
 from app.src.use_cases.event_room.get_event_room_list_use_case import GetEventRoomListUseCase
 from app.src.use_cases.event_room.get_event_room_by_id_use_case import GetEventRoomByIdUseCase
 from app.src.presentation.api.common.generic_model import PaginationMetadataModel
-from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses
+from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses, invalid_cursor
 from app.src.presentation.api.event_room.event_room_model import (
     PaginatedListEventRoomModelResponse,
     EventRoomCreateModelRequest,
@@ -31,6 +31,7 @@ from app.src.presentation.dependencies import (
 from app.src.common.exception import (
     AlreadyExistsError,
     CreationFailedError,
+    DecodedFailedError,
     DeletionFailedError,
     ForeignKeyConstraintError,
     NotFoundError,
@@ -110,7 +111,7 @@ async def create_event_room(
     summary="Retrieve a list of event_rooms",
     response_model=PaginatedListEventRoomModelResponse,
     response_description="Detailed information of the requested event_rooms",
-    responses=generate_responses([unexpected_error]),
+    responses=generate_responses([invalid_cursor, unexpected_error]),
     deprecated=False,
 )
 async def read_event_room_list(
@@ -118,15 +119,17 @@ async def read_event_room_list(
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     cursor: str | None = Query(None, description="Pagination cursor"),
     limit: int | None = Query(20, ge=1, description="Number of elements return"),
+    with_total: bool = Query(True, description="Count the elements of the collection"),
 ):
     """
     Retrieve a list of event_rooms
 
-    - **cursor**: Optional cursor for pagination (returns event_rooms with id >= cursor)
+    - **cursor**: Optional cursor returned in the metadata of a previous chunk (first, last, next or previous)
     - **limit**: Number of event_rooms to return (default: 20)
+    - **with_total**: If false, skip counting the collection (total and chunk_count are null)
     """
     try:
-        result = use_case.execute(cursor, limit)
+        result = use_case.execute(cursor, limit, with_total=with_total)
 
         event_room_models = [EventRoomModelResponse(**event_room.to_dict()) for event_room in result.event_rooms]
 
@@ -138,12 +141,15 @@ async def read_event_room_list(
             first_cursor=result.first_cursor,
             last_cursor=result.last_cursor,
             next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
         )
 
         response = PaginatedListEventRoomModelResponse(data=event_room_models, metadata=metadata)
 
         return response
 
+    except DecodedFailedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
@@ -17,7 +17,7 @@ from app.src.use_cases.map.create_map_use_case import CreateMapUseCase
 from app.src.use_cases.map.get_map_list_use_case import GetMapListUseCase
 from app.src.use_cases.map.get_map_by_id_use_case import GetMapByIdUseCase
 from app.src.presentation.api.common.generic_model import PaginationMetadataModel
-from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses
+from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses, invalid_cursor
 from app.src.presentation.api.map.map_model import (PaginatedListMapModelResponse, MapModelResponse, MapUpdateModelRequest)
 from app.src.presentation.dependencies import (
     create_map_use_case,
@@ -29,6 +29,7 @@ from app.src.presentation.dependencies import (
 from app.src.common.exception import (
     AlreadyExistsError,
     CreationFailedError,
+    DecodedFailedError,
     DeletionFailedError,
     ForeignKeyConstraintError,
     NotFoundError,
@@ -126,7 +127,7 @@ async def create_map(
     summary="Retrieve a list of maps",
     response_model=PaginatedListMapModelResponse,
     response_description="Detailed information of the requested maps",
-    responses=generate_responses([unexpected_error]),
+    responses=generate_responses([invalid_cursor, unexpected_error]),
     deprecated=False,
 )
 async def read_map_list(
@@ -134,15 +135,17 @@ async def read_map_list(
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     cursor: str | None = Query(None, description="Pagination cursor"),
     limit: int | None = Query(20, ge=1, description="Number of elements return"),
+    with_total: bool = Query(True, description="Count the elements of the collection"),
 ):
     """
     Retrieve a list of maps
 
-    - **cursor**: Optional cursor for pagination (returns maps with id >= cursor)
+    - **cursor**: Optional cursor returned in the metadata of a previous chunk (first, last, next or previous)
     - **limit**: Number of maps to return (default: 20)
+    - **with_total**: If false, skip counting the collection (total and chunk_count are null)
     """
     try:
-        result = use_case.execute(cursor, limit)
+        result = use_case.execute(cursor, limit, with_total=with_total)
 
         map_models = [MapModelResponse(**map.to_dict()) for map in result.maps]
 
@@ -154,12 +157,15 @@ async def read_map_list(
             first_cursor=result.first_cursor,
             last_cursor=result.last_cursor,
             next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
         )
 
         response = PaginatedListMapModelResponse(data=map_models, metadata=metadata)
 
         return response
 
+    except DecodedFailedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
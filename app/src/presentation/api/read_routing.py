@@ -0,0 +1,49 @@
+import time
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.src.presentation.core.config import settings
+
+# Cookie posé après une écriture : jusqu'à cette date (timestamp), les lectures du client restent sur le primaire
+PRIMARY_UNTIL_COOKIE = "db_primary_until"
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def reads_from_replica(request: Request) -> bool:
+    """
+    Les sessions de lecture vont sur le réplica pour les requêtes GET, sauf pendant la fenêtre
+    read-your-writes qui suit une écriture du même client : le réplica peut ne pas encore l'avoir reçue.
+    """
+    if not settings.replica_enabled or request.method not in READ_METHODS:
+        return False
+
+    cookie = request.cookies.get(PRIMARY_UNTIL_COOKIE)
+    if cookie is None:
+        return True
+    try:
+        primary_until = float(cookie)
+    except ValueError:
+        # Cookie illisible : le client a pu écrire récemment, on reste sur le primaire
+        return False
+    return primary_until <= time.time()
+
+
+def mark_recent_write(response: Response) -> None:
+    window = settings.DB_READ_YOUR_WRITES_SECONDS
+    response.set_cookie(
+        PRIMARY_UNTIL_COOKIE,
+        f"{time.time() + window:.3f}",
+        max_age=window,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+async def read_your_writes_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    response = await call_next(request)
+    if settings.replica_enabled and request.method not in READ_METHODS and response.status_code < 400:
+        mark_recent_write(response)
+    return response
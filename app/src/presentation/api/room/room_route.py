@@ -10,7 +10,7 @@ from app.src.presentation.api.common.generic_model import OffsetBasePaginationMe
 from app.src.presentation.api.secure_ressources import secure_ressources
 from app.src.presentation.core.open_api_tags import OpenApiTags
 from app.src.use_cases.room.create_room_use_case import CreateRoomUseCase
-from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses
+from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses, invalid_cursor
 from app.src.presentation.api.room.room_model import (
     PaginatedListRoomModelResponse,
     PaginatedListRoomWithTagModelResponse,
@@ -29,10 +29,11 @@ from app.src.presentation.dependencies import (
 )
 from app.src.common.exception import (
     CreationFailedError,
+    DecodedFailedError,
     DeletionFailedError,
     ForeignKeyConstraintError,
     NotFoundError,
-    UpdateFailedError
+    UpdateFailedError,
 )
 from app.src.use_cases.room.delete_room_use_case import DeleteRoomUseCase
 from app.src.use_cases.room.get_room_by_id_use_case import GetRoomByIdUseCase
@@ -172,7 +173,7 @@ async def read_room_list(
     summary="Retrieve a list of rooms",
     response_model=PaginatedListRoomWithTagModelResponse,
     response_description="Detailed information of the requested rooms with is tags",
-    responses=generate_responses([unexpected_error]),
+    responses=generate_responses([invalid_cursor, unexpected_error]),
     deprecated=False,
 )
 async def read_tag_list(
@@ -180,15 +181,17 @@ async def read_tag_list(
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     cursor: str | None = Query(None, description="Pagination cursor"),
     limit: int | None = Query(20, ge=1, description="Number of elements return"),
+    with_total: bool = Query(True, description="Count the elements of the collection"),
 ):
     """
     Retrieve a list of rooms
 
-    - **cursor**: Optional cursor for pagination (returns tags with id >= cursor)
+    - **cursor**: Optional cursor returned in the metadata of a previous chunk (first, last, next or previous)
     - **limit**: Number of tags to return (default: 20)
+    - **with_total**: If false, skip counting the collection (total and chunk_count are null)
     """
     try:
-        result = use_case.execute(cursor, limit)
+        result = use_case.execute(cursor, limit, with_total=with_total)
 
         metadata = PaginationMetadataModel(
             total=result.total,
@@ -198,11 +201,14 @@ async def read_tag_list(
             first_cursor=result.first_cursor,
             last_cursor=result.last_cursor,
             next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
         )
 
         room_models = [RoomWithTagModelResponse(**room.to_dict()) for room in result.rooms]
         return PaginatedListRoomWithTagModelResponse(data=room_models, metadata=metadata)
 
+    except DecodedFailedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
@@ -15,7 +15,7 @@ from app.src.use_cases.room_tag.update_room_tag_use_case import UpdateRoomTagUse
 from app.src.use_cases.room_tag.create_room_tag_use_case import CreateRoomTagUseCase
 from app.src.use_cases.room_tag.get_room_tag_list_use_case import GetRoomTagListUseCase
 from app.src.use_cases.room_tag.get_room_tag_by_id_use_case import GetRoomTagByIdUseCase
-from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses
+from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses, invalid_cursor
 from app.src.presentation.api.room_tag.room_tag_model import PaginatedListRoomTagModelResponse, RoomTagCreateModelRequest, RoomTagModelResponse, RoomTagUpdateModelRequest
 from app.src.presentation.dependencies import (
     create_room_tag_use_case,
@@ -28,6 +28,7 @@ from app.src.common.exception import (
     AlreadyExistsError,
     CheckConstraintError,
     CreationFailedError,
+    DecodedFailedError,
     DeletionFailedError,
     ForeignKeyConstraintError,
     NotFoundError,
@@ -111,7 +112,7 @@ async def create_room_tag(
     summary="Retrieve a list of links between room and tag",
     response_model=PaginatedListRoomTagModelResponse,
     response_description="Detailed information of the requested links",
-    responses=generate_responses([unexpected_error]),
+    responses=generate_responses([invalid_cursor, unexpected_error]),
     deprecated=False,
 )
 async def read_room_tag_list(
@@ -119,17 +120,19 @@ async def read_room_tag_list(
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     cursor: str | None = Query(None, description="Pagination cursor"),
     limit: int | None = Query(20, ge=1, description="Number of elements return"),
+    with_total: bool = Query(True, description="Count the elements of the collection"),
     active_only: bool = Query(False, description="Return only currently active links"),
 ):
     """
     Retrieve a list of links between room and tag
 
-    - **cursor**: Optional cursor for pagination (returns tags with id >= cursor)
+    - **cursor**: Optional cursor returned in the metadata of a previous chunk (first, last, next or previous)
     - **limit**: Number of tags to return (default: 20)
+    - **with_total**: If false, skip counting the collection (total and chunk_count are null)
     - **active_only**: If true, return only links valid at the current time
     """
     try:
-        result = use_case.execute(cursor, limit, active_only=active_only)
+        result = use_case.execute(cursor, limit, active_only=active_only, with_total=with_total)
 
         room_tag_models = [RoomTagModelResponse(**room_tag.to_dict()) for room_tag in result.room_tag]
 
@@ -141,11 +144,14 @@ async def read_room_tag_list(
             first_cursor=result.first_cursor,
             last_cursor=result.last_cursor,
             next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
         )
 
         response = PaginatedListRoomTagModelResponse(data=room_tag_models, metadata=metadata)
         return response
 
+    except DecodedFailedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
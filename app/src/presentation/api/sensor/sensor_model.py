@@ -56,3 +56,21 @@ class PaginatedSensorsModel(BaseModel):
     count: int
     offset: int
     limit: int
+
+
+class SensorPageModel(BaseModel):
+    data: list[dict]
+    total: int = Field(..., ge=0, description="Number of rows in the table (estimated unless exact_total)")
+    limit: int
+    next_cursor: str | None = Field(None, description="Cursor to fetch the next page, if any")
+
+
+class RowErrorModel(BaseModel):
+    line: int = Field(..., description="Line number in the (decompressed) batch")
+    error: str
+
+
+class BatchIngestionReportModel(BaseModel):
+    inserted: int = Field(..., ge=0, description="Rows written to the table")
+    rejected: int = Field(..., ge=0, description="Invalid rows, not written")
+    errors: list[RowErrorModel] = Field(..., description="First errors of the batch, with their line number")
@@ -1,16 +1,34 @@
 import logging
+import zlib
+from dataclasses import asdict
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from fastapi.responses import Response
 
+from app.src.common.exception import DecodedFailedError, NotFoundError
+from app.src.common.pagination import KeysetCursor
+from app.src.domain.entities.role import Role
+from app.src.domain.entities.user import User
 from app.src.presentation.core.open_api_tags import OpenApiTags
+from app.src.presentation.api.secure_ressources import secure_ressources
+from app.src.presentation.api.sensor.sensor_model import BatchIngestionReportModel, SensorPageModel
+from app.src.presentation.api.common.batch import BATCH_MEDIA_TYPES, iter_batch_rows
+from app.src.presentation.api.common.columnar import COLUMNAR_MEDIA_TYPE, encode_rows
 from app.src.presentation.api.common.errors import (
     OpenApiErrorResponseConfig,
     generate_responses,
 )
-from app.src.presentation.dependencies import get_sensor_repo
-from app.src.infrastructure.db.repositories.sensor_repository_sql import SQLSensorRepository
+from app.src.presentation.dependencies import (
+    cursor_codec,
+    get_async_sensor_repo,
+    get_ingest_sensor_batch_async_use_case,
+    get_sensor_measurements_async_use_case,
+)
+from app.src.infrastructure.db.repositories.sensor_repository_async import AsyncSQLSensorRepository
+from app.src.use_cases.sensor.get_sensor_measurements_async_use_case import GetSensorMeasurementsAsyncUseCase
+from app.src.use_cases.sensor.ingest_sensor_batch_async_use_case import IngestSensorBatchAsyncUseCase
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +38,18 @@ sensor_router = APIRouter(prefix="/sensors", tags=[OpenApiTags.sensor])
 not_found_error = OpenApiErrorResponseConfig(
     code=404, description="Sensor not found", detail="Sensor with this ID was not found"
 )
+filter_not_found_error = OpenApiErrorResponseConfig(
+    code=404, description="Tag or room not found", detail="Room with ID '1' not found"
+)
+invalid_cursor_error = OpenApiErrorResponseConfig(
+    code=400, description="Invalid cursor", detail="Failed to decode Sensor pagination cursor"
+)
+invalid_body_error = OpenApiErrorResponseConfig(
+    code=400, description="Invalid compressed body", detail="Invalid gzip body"
+)
+unsupported_media_error = OpenApiErrorResponseConfig(
+    code=415, description="Unsupported batch format", detail=f"Content-Type must be one of {BATCH_MEDIA_TYPES}"
+)
 unexpected_error = OpenApiErrorResponseConfig(
     code=500, description="Unexpected error", detail="Internal server error"
 )
@@ -30,53 +60,137 @@ unexpected_error = OpenApiErrorResponseConfig(
     summary="Get the latest measurement for a given sensor type",
     responses=generate_responses([not_found_error, unexpected_error]),
 )
-def get_latest_sensor(
+async def get_latest_sensor(
     kind: str = Path(..., description="Sensor kind (temperature, humidity, motion, etc.)"),
-    repo: Annotated[SQLSensorRepository, Depends(get_sensor_repo)] = None,
+    repo: Annotated[AsyncSQLSensorRepository, Depends(get_async_sensor_repo)] = None,
 ):
     try:
-        row = repo.get_latest()
+        row = await repo.get_latest()
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No data found")
         return row.model_dump()
     except Exception as e:
         logger.error(f"Unexpected error while fetching latest {kind}: {e}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
 
 
 @sensor_router.get(
     "/{kind}",
     summary="List recent measurements for a given sensor type",
-    responses=generate_responses([unexpected_error]),
+    responses=generate_responses([filter_not_found_error, unexpected_error]),
 )
-def list_sensors(
+async def list_sensors(
     kind: str = Path(...),
     limit: int = Query(100, ge=1, le=1000),
-    repo: Annotated[SQLSensorRepository, Depends(get_sensor_repo)] = None,
+    source_address: str | None = Query(None, description="Only measurements of this tag address"),
+    tag_id: int | None = Query(None, ge=1, description="Only measurements of this tag"),
+    room_id: int | None = Query(None, ge=1, description="Only measurements of the room's tags while assigned"),
+    use_case: Annotated[GetSensorMeasurementsAsyncUseCase, Depends(get_sensor_measurements_async_use_case)] = None,
 ):
     try:
-        rows = repo.get_all(limit=limit)
-        return [r.model_dump() for r in rows]
+        return await use_case.execute(limit, source_address=source_address, tag_id=tag_id, room_id=room_id)
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Unexpected error while fetching list for {kind}: {e}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
+
+
+@sensor_router.get(
+    "/{kind}/page",
+    summary="Page through all measurements of a given sensor type",
+    response_model=SensorPageModel,
+    responses=generate_responses([invalid_cursor_error, unexpected_error]),
+)
+async def page_sensors(
+    kind: str = Path(...),
+    cursor: str | None = Query(None, description="Cursor returned by the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    exact_total: bool = Query(False, description="Count every row instead of using the table statistics"),
+    repo: Annotated[AsyncSQLSensorRepository, Depends(get_async_sensor_repo)] = None,
+):
+    """
+    Measurements ordered by time. Pass `next_cursor` back as `cursor` for the next page.
+    """
+    try:
+        decoded_cursor = cursor_codec.decode(cursor, "Sensor pagination cursor")
+        rows, total, next_key = await repo.paginate(decoded_cursor, limit, exact_total)
+        next_cursor = cursor_codec.encode(KeysetCursor("next", next_key)) if next_key else None
+        return SensorPageModel(data=rows, total=total, limit=limit, next_cursor=next_cursor)
+    except DecodedFailedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Unexpected error while paginating {kind}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
 
 
 @sensor_router.get(
     "/{kind}/range",
     summary="Get sensor data in a time range",
-    responses=generate_responses([unexpected_error]),
+    responses={
+        200: {
+            "description": f"With `Accept: {COLUMNAR_MEDIA_TYPE}`: packed columns (see api/common/columnar.py)",
+            "content": {COLUMNAR_MEDIA_TYPE: {}},
+        },
+        **generate_responses([filter_not_found_error, unexpected_error]),
+    },
 )
-def range_sensors(
+async def range_sensors(
+    request: Request,
     kind: str = Path(...),
     start: datetime = Query(..., description="Start datetime (ISO8601)"),
     end: datetime = Query(..., description="End datetime (ISO8601)"),
     limit: int | None = Query(None, ge=1, le=10000),
-    repo: Annotated[SQLSensorRepository, Depends(get_sensor_repo)] = None,
+    source_address: str | None = Query(None, description="Only measurements of this tag address"),
+    tag_id: int | None = Query(None, ge=1, description="Only measurements of this tag"),
+    room_id: int | None = Query(None, ge=1, description="Only measurements of the room's tags while assigned"),
+    use_case: Annotated[GetSensorMeasurementsAsyncUseCase, Depends(get_sensor_measurements_async_use_case)] = None,
 ):
     try:
-        rows = repo.get_range(start, end, limit=limit)
-        return [r.model_dump() for r in rows]
+        rows = await use_case.execute(
+            limit, start, end, source_address=source_address, tag_id=tag_id, room_id=room_id
+        )
+        if COLUMNAR_MEDIA_TYPE in request.headers.get("accept", ""):
+            return Response(content=encode_rows(rows), media_type=COLUMNAR_MEDIA_TYPE, headers={"Vary": "Accept"})
+        return rows
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Unexpected error while fetching range for {kind}: {e}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
+
+
+@sensor_router.post(
+    "/{kind}/batch",
+    summary="Insert a batch of measurements for a given sensor type",
+    response_model=BatchIngestionReportModel,
+    responses=generate_responses([invalid_body_error, unsupported_media_error, unexpected_error]),
+)
+async def ingest_sensor_batch(
+    request: Request,
+    use_case: Annotated[IngestSensorBatchAsyncUseCase, Depends(get_ingest_sensor_batch_async_use_case)],
+    user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
+    kind: str = Path(...),
+):
+    """
+    Body: NDJSON (`application/x-ndjson`, one object per line) or CSV (`text/csv`, header line with column names),
+    optionally gzip compressed (`Content-Encoding: gzip`). Columns are those of the sensor table; `time` is required.
+
+    Invalid rows are skipped and reported with their line number; valid rows are inserted in a single transaction.
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type not in BATCH_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Content-Type must be one of {BATCH_MEDIA_TYPES}"
+        )
+    gzipped = request.headers.get("content-encoding", "").strip().lower() == "gzip"
+
+    try:
+        report = await use_case.execute(iter_batch_rows(request.stream(), media_type, gzipped))
+        return BatchIngestionReportModel(**asdict(report))
+    except zlib.error as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid gzip body") from e
+    except Exception as e:
+        logger.error(f"Unexpected error while ingesting {kind}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
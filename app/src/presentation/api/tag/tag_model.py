@@ -85,6 +85,11 @@ class TagModelResponse(TagBaseModel):
     updated_at: datetime | None
     rooms: list[LinkRoomTag] | None = None 
 
+class UnregisteredSourceModelResponse(BaseModel):
+    source_address: str = Field(..., title="Source address", description="Source address found in the recorded database")
+    sensor_kinds: list[str] = Field(..., title="Sensor kinds", description="Sensor tables containing this address")
+    last_seen_at: datetime | None = Field(default=None, title="Last seen", description="Time of the latest measurement")
+
 class PaginatedListTagModelResponse(BaseModel):
     data: list[TagModelResponse]
     metadata: PaginationMetadataModel
@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from datetime import datetime
 import logging
 from typing import Annotated
@@ -15,8 +16,9 @@ from app.src.use_cases.tag.update_tag_use_case import UpdateTagUseCase
 from app.src.use_cases.tag.create_tag_use_case import CreateTagUseCase
 from app.src.use_cases.tag.get_tag_list_use_case import GetTagListUseCase
 from app.src.use_cases.tag.get_tag_by_id_use_case import GetTagByIdUseCase
+from app.src.use_cases.tag.discover_unregistered_tags_use_case import DiscoverUnregisteredTagsUseCase
 from app.src.presentation.api.common.generic_model import PaginationMetadataModel
-from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses
+from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses, invalid_cursor
 from app.src.presentation.api.tag.tag_model import (
     PaginatedListTagModelResponse,
     TagCreateModelRequest,
@@ -24,11 +26,13 @@ from app.src.presentation.api.tag.tag_model import (
     TagModelResponse,
     TagUpdateModelRequest,
     TagUpdateWithRoomLinkModelRequest,
+    UnregisteredSourceModelResponse,
 )
 from app.src.presentation.dependencies import (
     create_tag_use_case,
     create_tag_with_room_link_use_case,
     delete_tag_use_case,
+    discover_unregistered_tags_use_case,
     get_tag_by_id_use_case,
     get_tag_list_use_case,
     update_tag_use_case,
@@ -38,6 +42,7 @@ from app.src.common.exception import (
     AlreadyExistsError,
     CheckConstraintError,
     CreationFailedError,
+    DecodedFailedError,
     DeletionFailedError,
     ForeignKeyConstraintError,
     NotFoundError,
@@ -164,7 +169,7 @@ async def create_tag_with_room_link(
     summary="Retrieve a list of tags",
     response_model=PaginatedListTagModelResponse,
     response_description="Detailed information of the requested tags",
-    responses=generate_responses([unexpected_error]),
+    responses=generate_responses([invalid_cursor, unexpected_error]),
     deprecated=False,
 )
 async def read_tag_list(
@@ -172,17 +177,19 @@ async def read_tag_list(
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     cursor: str | None = Query(None, description="Pagination cursor"),
     limit: int | None = Query(20, ge=1, description="Number of elements return"),
+    with_total: bool = Query(True, description="Count the elements of the collection"),
     with_rooms: bool = Query(False, description="Include rooms and buildings"),
 ):
     """
     Retrieve a list of tags
 
-    - **cursor**: Optional cursor for pagination (returns tags with id >= cursor)
+    - **cursor**: Optional cursor returned in the metadata of a previous chunk (first, last, next or previous)
     - **limit**: Number of tags to return (default: 20)
+    - **with_total**: If false, skip counting the collection (total and chunk_count are null)
     - **with_rooms**: If true, include related rooms and buildings
     """
     try:
-        result = use_case.execute(cursor, limit, with_rooms=with_rooms)
+        result = use_case.execute(cursor, limit, with_rooms=with_rooms, with_total=with_total)
 
         metadata = PaginationMetadataModel(
             total=result.total,
@@ -192,11 +199,41 @@ async def read_tag_list(
             first_cursor=result.first_cursor,
             last_cursor=result.last_cursor,
             next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
         )
 
         tag_models = [TagModelResponse(**tag.to_dict()) for tag in result.tags]
         return PaginatedListTagModelResponse(data=tag_models, metadata=metadata)
 
+    except DecodedFailedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
+
+
+@tag_router.get(
+    "/discover",
+    summary="Discover source addresses without tag",
+    response_model=list[UnregisteredSourceModelResponse],
+    response_description="Source addresses present in the recorded database but missing from tags",
+    responses=generate_responses([unexpected_error]),
+    deprecated=False,
+)
+async def discover_unregistered_tags(
+    use_case: Annotated[DiscoverUnregisteredTagsUseCase, Depends(discover_unregistered_tags_use_case)],
+    user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
+):
+    """
+    List the source addresses sending measurements that are not registered as tags yet
+
+    - **sensor_kinds**: sensor tables where the address appears
+    - **last_seen_at**: time of its latest measurement
+    """
+    try:
+        sources = use_case.execute()
+        return [UnregisteredSourceModelResponse(**asdict(source)) for source in sources]
+
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
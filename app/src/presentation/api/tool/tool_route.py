@@ -6,6 +6,8 @@ from fastapi.params import Depends
 from app.src.domain.entities.role import Role
 from app.src.domain.entities.user import User
 from app.src.presentation.core.config import settings
+from app.src.infrastructure.db.session import engines_pool_stats
+from app.src.presentation.dependencies import rooms_sensor_data_cache
 from app.src.presentation.core.open_api_tags import OpenApiTags
 from app.src.presentation.api.tool.tool_model import UserModelResponse
 from app.src.presentation.api.secure_ressources import secure_ressources
@@ -40,6 +42,36 @@ async def read_tag_list(
     }
 
 
+@tool_router.get(
+    "/cache",
+    summary="Retrieve the cache statistics",
+    response_description="Hits, misses and size of the /data/rooms result cache",
+    responses=generate_responses([unexpected_error]),
+)
+async def get_cache_stats(
+    user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))]
+):
+    """
+    Retrieve the statistics of the /data/rooms result cache (current worker)
+    """
+    return {"rooms_sensor_data": rooms_sensor_data_cache.stats()}
+
+
+@tool_router.get(
+    "/db-pools",
+    summary="Retrieve the database connection pool statistics",
+    response_description="Size, checked-in and checked-out connections and overflow of each pool",
+    responses=generate_responses([unexpected_error]),
+)
+async def get_db_pool_stats(
+    user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))]
+):
+    """
+    Retrieve the statistics of the database connection pools (current worker)
+    """
+    return engines_pool_stats()
+
+
 @tool_router.get(
     "/version",
     summary="Retrieve the information on the app",
@@ -54,6 +54,8 @@ class UserModel(UserBaseModel):
 
 class PaginatedUsersModel(BaseModel):
     data: list[UserBaseModelResponse]
-    count: int
+    count: int | None
     offset: int
-    limit: int
\ No newline at end of file
+    limit: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
\ No newline at end of file
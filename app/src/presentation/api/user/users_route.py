@@ -12,7 +12,7 @@ from app.src.presentation.api.user.users_model import (
     UserUpdateModel,
     PaginatedUsersModel,
 )
-from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses
+from app.src.presentation.api.common.errors import OpenApiErrorResponseConfig, generate_responses, invalid_cursor
 from app.src.domain.entities.user import User
 from app.src.use_cases.user.create_user_use_case import CreateUserUseCase
 from app.src.use_cases.user.get_user_by_id_use_case import GetUserByIdUseCase
@@ -29,6 +29,7 @@ from app.src.presentation.dependencies import (
 from app.src.common.exception import (
     AlreadyExistsError,
     CreationFailedError,
+    DecodedFailedError,
     DeletionFailedError,
     NotFoundError,
     UpdateFailedError,
@@ -113,7 +114,7 @@ async def create_user(
     summary="Retrieve a list of users",
     response_model=PaginatedUsersModel,
     response_description="Detailed information of the requested users",
-    responses=generate_responses([unexpected_error]),
+    responses=generate_responses([invalid_cursor, unexpected_error]),
     deprecated=False,
 )
 async def read_user_list(
@@ -121,19 +122,27 @@ async def read_user_list(
     user: Annotated[User, Depends(secure_ressources([Role.staff, Role.technician]))],
     cursor: str | None = Query(None, description="Pagination cursor"),
     limit: int | None = Query(20, ge=1, description="Number of elements to return"),
+    with_total: bool = Query(True, description="Count the elements of the collection"),
 ):
     """
     Retrieve a list of users.
+
+    - **cursor**: Optional cursor returned by a previous chunk (next_cursor or prev_cursor)
+    - **with_total**: If false, skip counting the users (count is null)
     """
     try:
-        result = use_case.execute(cursor, limit)
+        result = use_case.execute(cursor, limit, with_total=with_total)
         user_models = [UserBaseModelResponse(**user.to_dict()) for user in result.users]
         return PaginatedUsersModel(
             data=user_models,
             count=result.total,
             offset=0,
-            limit=limit
+            limit=limit,
+            next_cursor=result.next_cursor,
+            prev_cursor=result.prev_cursor,
         )
+    except DecodedFailedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error") from e
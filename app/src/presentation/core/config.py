@@ -1,7 +1,8 @@
+import multiprocessing
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import EmailStr, HttpUrl, PostgresDsn, computed_field
+from pydantic import EmailStr, Field, HttpUrl, PostgresDsn, computed_field
 
 
 class Settings(BaseSettings):
@@ -66,6 +67,57 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "Changeme!1"
     POSTGRES_DB: str = "app"
     POSTGRES_DB_RECORDED: str = "recorded"
+    # Réplica en streaming pour les lectures (GET), mêmes bases et utilisateur que le primaire (vide : tout sur le primaire)
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    # Après une écriture, le client lit sur le primaire pendant cette durée (retard de réplication)
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+
+    # Connexions ouvertes au plus par l'application sur le serveur PostgreSQL, tous workers et moteurs
+    # confondus (infrastructure/db/pool.py) : à garder sous max_connections
+    DB_CONNECTION_BUDGET: int = 80
+    # Part des connexions de chaque pool ouvertes seulement en cas de pic (max_overflow)
+    DB_POOL_OVERFLOW_RATIO: float = Field(0.5, ge=0, le=1)
+    DB_POOL_TIMEOUT_SECONDS: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Connexions ouvertes par pool au démarrage de chaque worker, avant les premières requêtes (0 pour désactiver)
+    DB_POOL_WARMUP_CONNECTIONS: int = Field(2, ge=0)
+    # statement_timeout de chaque connexion (0 pour désactiver)
+    DB_STATEMENT_TIMEOUT_MS: int = 30_000
+    # Log de chaque requête SQL, jamais en production
+    DB_ECHO: bool = True
+    # Nombre de workers gunicorn (défaut : 2 x CPU + 1, limité par DB_CONNECTION_BUDGET, infrastructure/db/pool.py)
+    WEB_CONCURRENCY: int | None = None
+
+    @property
+    def worker_count(self) -> int:
+        if self.WEB_CONCURRENCY:
+            return self.WEB_CONCURRENCY
+        # Tests : un seul processus, taille des pools indépendante du nombre de CPU de la machine
+        return 1 if self.ENVIRONMENT == "testing" else multiprocessing.cpu_count() * 2 + 1
+
+    @property
+    def database_echo(self) -> bool:
+        return self.DB_ECHO and self.ENVIRONMENT != "production"
+
+    # DATA
+    # python : lissage en Python (défaut)
+    # timescale : agrégation dans la base avec time_bucket_gapfill (extension TimescaleDB requise)
+    # sql : agrégation dans la base avec generate_series (PostgreSQL sans Timescale)
+    DATA_AGGREGATION_MODE: Literal["python", "timescale", "sql"] = "python"
+    # Lecture des rollups 5m / 1h / 1d (infrastructure/db/rollups.py) quand l'intervalle de lissage le permet
+    DATA_ROLLUPS_ENABLED: bool = False
+    # Cache des résultats de /data/rooms (0 pour désactiver), vidé à chaque modification des tags / liens pièce-tag
+    DATA_CACHE_TTL_SECONDS: int = 60
+    DATA_CACHE_MAX_ENTRIES: int = 256
+    # Threads partagés par le processus pour le lissage des routes /data (1 : executor par défaut de la boucle)
+    DATA_FETCH_WORKERS: int = 3
+
+    # PAGINATION
+    # Durée de conservation des totaux (count) des listes paginées (0 pour compter à chaque chunk)
+    PAGINATION_TOTAL_CACHE_TTL_SECONDS: int = 30
+    PAGINATION_TOTAL_CACHE_MAX_ENTRIES: int = 64
 
     @computed_field
     @property
@@ -75,31 +127,70 @@ class Settings(BaseSettings):
             return f"{self.POSTGRES_DB}_test"
         return self.POSTGRES_DB
 
-    @computed_field
     @property
-    def database_url(self) -> str:
+    def replica_enabled(self) -> bool:
+        return bool(self.POSTGRES_REPLICA_HOST)
+
+    def _postgres_url(self, host: str, port: int, path: str) -> str:
         return str(
             PostgresDsn.build(
                 scheme="postgresql+psycopg2",
                 username=self.POSTGRES_USER,
                 password=self.POSTGRES_PASSWORD,
-                host=self.POSTGRES_HOST,
-                port=self.POSTGRES_PORT,
-                path=self.postgres_db, 
+                host=host,
+                port=port,
+                path=path,
         ))
+
+    @computed_field
+    @property
+    def database_url(self) -> str:
+        return self._postgres_url(self.POSTGRES_HOST, self.POSTGRES_PORT, self.postgres_db)
     
     @computed_field
     @property
     def database_recorded_url(self) -> str:
-        return str(
-            PostgresDsn.build(
-                scheme="postgresql+psycopg2",
-                username=self.POSTGRES_USER,
-                password=self.POSTGRES_PASSWORD,
-                host=self.POSTGRES_HOST,
-                port=self.POSTGRES_PORT,
-                path=self.POSTGRES_DB_RECORDED,
-        ))
+        return self._postgres_url(self.POSTGRES_HOST, self.POSTGRES_PORT, self.POSTGRES_DB_RECORDED)
+
+    @computed_field
+    @property
+    def database_replica_url(self) -> str | None:
+        if not self.replica_enabled:
+            return None
+        return self._postgres_url(self.POSTGRES_REPLICA_HOST, self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT, self.postgres_db)
+
+    @computed_field
+    @property
+    def database_recorded_replica_url(self) -> str | None:
+        if not self.replica_enabled:
+            return None
+        return self._postgres_url(
+            self.POSTGRES_REPLICA_HOST, self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT, self.POSTGRES_DB_RECORDED
+        )
+
+    @computed_field
+    @property
+    def database_async_url(self) -> str:
+        return self.database_url.replace("postgresql+psycopg2", "postgresql+asyncpg", 1)
+
+    @computed_field
+    @property
+    def database_recorded_async_url(self) -> str:
+        return self.database_recorded_url.replace("postgresql+psycopg2", "postgresql+asyncpg", 1)
+
+    @computed_field
+    @property
+    def database_replica_async_url(self) -> str | None:
+        if not self.replica_enabled:
+            return None
+        return self.database_replica_url.replace("postgresql+psycopg2", "postgresql+asyncpg", 1)
+
+    @computed_field
+    @property
+    def database_recorded_replica_async_url(self) -> str | None:
+        if not self.replica_enabled:
+            return None
+        return self.database_recorded_replica_url.replace("postgresql+psycopg2", "postgresql+asyncpg", 1)
 
 
 settings = Settings()
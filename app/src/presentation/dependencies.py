@@ -1,9 +1,13 @@
 
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Type
-from app.src.domain.interface_repositories.data_repository import DataRepository
+from app.src.common.cache import ResultCache
+from app.src.common.pagination import CursorCodec
+from app.src.domain.interface_repositories.data_repository import AsyncDataRepository
 from app.src.domain.interface_repositories.room_tag_repository import RoomTagRepository
 from app.src.domain.interface_repositories.user_repository import UserRepository
-from app.src.infrastructure.db.repositories.data_repository_sql import SQLDataRepository
+from app.src.infrastructure.db.repositories.data_repository_async import AsyncSQLDataRepository
 from app.src.infrastructure.db.repositories.room_tag_repository_sql import SQLRoomTagRepository
 from app.src.infrastructure.db.repositories.user_repository_sql import SQLUserRepository
 from app.src.use_cases.authentication.get_current_user_use_case import GetCurrentUserUseCase
@@ -11,10 +15,23 @@ from app.src.use_cases.authentication.verify_user_use_case import VerifyUserUseC
 from app.src.use_cases.view.get_events_by_date import GetEventsByDateUseCase
 from fastapi import Depends, HTTPException, status
 from sqlmodel import Session, SQLModel
-
-from app.src.infrastructure.db.session import get_session
-from app.src.use_cases.data.get_rooms_sensor_data_use_case import GetRoomsSensorDataUseCase
-from app.src.use_cases.data.get_single_room_sensor_use_case import GetSingleRoomSensorDataUseCase
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.src.infrastructure.db.session import (
+    async_read_session,
+    async_read_session_recorded,
+    get_session,
+    read_session,
+    read_session_recorded,
+)
+from app.src.presentation.api.read_routing import reads_from_replica
+from app.src.presentation.core.config import settings
+from app.src.use_cases.data.get_rooms_sensor_data_async_use_case import GetRoomsSensorDataAsyncUseCase
+from app.src.use_cases.data.get_single_room_sensor_async_use_case import GetSingleRoomSensorDataAsyncUseCase
+from app.src.use_cases.data.get_rooms_latest_values_async_use_case import GetRoomsLatestValuesAsyncUseCase
+from app.src.use_cases.tag.discover_unregistered_tags_use_case import DiscoverUnregisteredTagsUseCase
+from app.src.use_cases.sensor.get_sensor_measurements_async_use_case import GetSensorMeasurementsAsyncUseCase
+from app.src.use_cases.sensor.ingest_sensor_batch_async_use_case import IngestSensorBatchAsyncUseCase
 from app.src.use_cases.room.get_room_with_tag_list_use_case import GetRoomWithTagListUseCase
 from app.src.use_cases.room_tag.create_room_tag_use_case import CreateRoomTagUseCase
 from app.src.use_cases.room_tag.delete_room_tag_use_case import DeleteRoomTagUseCase
@@ -93,8 +110,8 @@ from app.src.use_cases.user_group.get_user_group_by_id_use_case import GetUserGr
 from app.src.domain.interface_repositories.user_group_repository import UserGroupRepository
 from app.src.infrastructure.db.repositories.user_group_repository_sql import SQLUserGroupRepository
 
-from app.src.infrastructure.db.session import get_session_recorded
 from app.src.infrastructure.db.repositories.sensor_repository_sql import SQLSensorRepository
+from app.src.infrastructure.db.repositories.sensor_repository_async import AsyncSQLSensorRepository
 from app.src.infrastructure.db.models.sensor_model import (
     SensorButtonModel,
     SensorHumidityModel,
@@ -113,6 +130,44 @@ from app.src.use_cases.view.get_planning_by_user_id_use_case import GetEventsFor
 
 get_session_dep = Depends(get_session)
 
+# Sessions des use cases de lecture : réplica pour les GET, primaire pour les écritures
+# et pendant la fenêtre read-your-writes (api/read_routing.py)
+replica_dep = Depends(reads_from_replica)
+
+def get_read_session(replica: bool = replica_dep) -> Generator[Session, None, None]:
+    with read_session(replica) as session:
+        yield session
+
+def get_read_session_recorded(replica: bool = replica_dep) -> Generator[Session, None, None]:
+    with read_session_recorded(replica) as session:
+        yield session
+
+async def get_async_read_session(replica: bool = replica_dep) -> AsyncGenerator[AsyncSession, None]:
+    async with async_read_session(replica) as session:
+        yield session
+
+async def get_async_read_session_recorded(replica: bool = replica_dep) -> AsyncGenerator[AsyncSession, None]:
+    async with async_read_session_recorded(replica) as session:
+        yield session
+
+get_read_session_dep = Depends(get_read_session)
+
+# Cache des agrégats de /data/rooms, partagé par les requêtes du processus
+rooms_sensor_data_cache = ResultCache(settings.DATA_CACHE_TTL_SECONDS, settings.DATA_CACHE_MAX_ENTRIES)
+
+# Curseurs des listes paginées, signés avec la clé de l'application
+cursor_codec = CursorCodec(settings.SECRET_KEY)
+
+# Totaux des listes paginées, partagés par les requêtes du processus
+pagination_total_cache = ResultCache(settings.PAGINATION_TOTAL_CACHE_TTL_SECONDS, settings.PAGINATION_TOTAL_CACHE_MAX_ENTRIES)
+
+# Threads partagés par les requêtes du processus : calcul du lissage hors de la boucle d'événements
+# (executor par défaut de la boucle si None)
+data_fetch_executor = (
+    ThreadPoolExecutor(max_workers=settings.DATA_FETCH_WORKERS, thread_name_prefix="data-fetch")
+    if settings.DATA_FETCH_WORKERS > 1 else None
+)
+
 def user_repository(session: Session = get_session_dep) -> UserRepository:
     return SQLUserRepository(session)
 
@@ -132,28 +187,33 @@ def tag_repository(session: Session = get_session_dep) -> TagRepository:
 
 tag_repo_dep = Depends(tag_repository)
 
-def get_tag_by_id_use_case(tag_repository: TagRepository = tag_repo_dep) -> GetTagByIdUseCase:
+def tag_read_repository(session: Session = get_read_session_dep) -> TagRepository:
+    return SQLTagRepository(session)
+
+tag_read_repo_dep = Depends(tag_read_repository)
+
+def get_tag_by_id_use_case(tag_repository: TagRepository = tag_read_repo_dep) -> GetTagByIdUseCase:
     return GetTagByIdUseCase(tag_repository)
 
 
-def get_tag_list_use_case(tag_repository: TagRepository = tag_repo_dep) -> GetTagListUseCase:
-    return GetTagListUseCase(tag_repository)
+def get_tag_list_use_case(tag_repository: TagRepository = tag_read_repo_dep) -> GetTagListUseCase:
+    return GetTagListUseCase(tag_repository, cursor_codec, pagination_total_cache)
 
 
 def create_tag_use_case(tag_repository: TagRepository = tag_repo_dep) -> CreateTagUseCase:
     return CreateTagUseCase(tag_repository)
 
 def create_tag_with_room_link_use_case(tag_repository: TagRepository = tag_repo_dep) -> CreateTagWithRoomLinkUseCase:
-    return CreateTagWithRoomLinkUseCase(tag_repository)
+    return CreateTagWithRoomLinkUseCase(tag_repository, rooms_sensor_data_cache)
 
 
 
 def update_tag_use_case(tag_repository: TagRepository = tag_repo_dep) -> UpdateTagUseCase:
-    return UpdateTagUseCase(tag_repository)
+    return UpdateTagUseCase(tag_repository, rooms_sensor_data_cache)
 
 
 def delete_tag_use_case(tag_repository: TagRepository = tag_repo_dep) -> DeleteTagUseCase:
-    return DeleteTagUseCase(tag_repository)
+    return DeleteTagUseCase(tag_repository, rooms_sensor_data_cache)
 
 
 # Map 
@@ -163,13 +223,18 @@ def map_repository(session: Session = get_session_dep) -> MapRepository:
 
 map_repo_dep = Depends(map_repository)
 
+def map_read_repository(session: Session = get_read_session_dep) -> MapRepository:
+    return SQLMapRepository(session)
+
+map_read_repo_dep = Depends(map_read_repository)
 
-def get_map_by_id_use_case(map_repository: MapRepository = map_repo_dep) -> GetMapByIdUseCase:
+
+def get_map_by_id_use_case(map_repository: MapRepository = map_read_repo_dep) -> GetMapByIdUseCase:
     return GetMapByIdUseCase(map_repository)
 
 
-def get_map_list_use_case(map_repository: MapRepository = map_repo_dep) -> GetMapListUseCase:
-    return GetMapListUseCase(map_repository)
+def get_map_list_use_case(map_repository: MapRepository = map_read_repo_dep) -> GetMapListUseCase:
+    return GetMapListUseCase(map_repository, cursor_codec, pagination_total_cache)
 
 
 def create_map_use_case(map_repository: MapRepository = map_repo_dep) -> CreateMapUseCase:
@@ -188,13 +253,18 @@ def event_repository(session: Session = get_session_dep) -> EventRepository:
 
 event_repo_dep = Depends(event_repository)
 
+def event_read_repository(session: Session = get_read_session_dep) -> EventRepository:
+    return SQLEventRepository(session)
+
+event_read_repo_dep = Depends(event_read_repository)
 
-def get_event_by_id_use_case(event_repository: EventRepository = event_repo_dep) -> GetEventByIdUseCase:
+
+def get_event_by_id_use_case(event_repository: EventRepository = event_read_repo_dep) -> GetEventByIdUseCase:
     return GetEventByIdUseCase(event_repository)
 
 
-def get_event_list_use_case(event_repository: EventRepository = event_repo_dep) -> GetEventListUseCase:
-    return GetEventListUseCase(event_repository)
+def get_event_list_use_case(event_repository: EventRepository = event_read_repo_dep) -> GetEventListUseCase:
+    return GetEventListUseCase(event_repository, cursor_codec, pagination_total_cache)
 
 
 def create_event_use_case(event_repository: EventRepository = event_repo_dep) -> CreateEventUseCase:
@@ -216,13 +286,18 @@ def user_repository(session: Session = get_session_dep) -> UserRepository:
 
 user_repo_dep = Depends(user_repository)
 
+def user_read_repository(session: Session = get_read_session_dep) -> UserRepository:
+    return SQLUserRepository(session)
+
+user_read_repo_dep = Depends(user_read_repository)
 
-def get_user_by_id_use_case(user_repository: UserRepository = user_repo_dep) -> GetUserByIdUseCase:
+
+def get_user_by_id_use_case(user_repository: UserRepository = user_read_repo_dep) -> GetUserByIdUseCase:
     return GetUserByIdUseCase(user_repository)
 
 
-def get_user_list_use_case(user_repository: UserRepository = user_repo_dep) -> GetUserListUseCase:
-    return GetUserListUseCase(user_repository)
+def get_user_list_use_case(user_repository: UserRepository = user_read_repo_dep) -> GetUserListUseCase:
+    return GetUserListUseCase(user_repository, cursor_codec, pagination_total_cache)
 
 
 def create_user_use_case(user_repository: UserRepository = user_repo_dep) -> CreateUserUseCase:
@@ -244,17 +319,22 @@ def room_repository(session: Session = get_session_dep) -> RoomRepository:
 
 room_repo_dep = Depends(room_repository)
 
+def room_read_repository(session: Session = get_read_session_dep) -> RoomRepository:
+    return SQLRoomRepository(session)
+
+room_read_repo_dep = Depends(room_read_repository)
 
-def get_room_by_id_use_case(room_repository: RoomRepository = room_repo_dep) -> GetRoomByIdUseCase:
+
+def get_room_by_id_use_case(room_repository: RoomRepository = room_read_repo_dep) -> GetRoomByIdUseCase:
     return GetRoomByIdUseCase(room_repository)
 
 
-def get_room_list_use_case(room_repository: RoomRepository = room_repo_dep) -> GetRoomListUseCase:
+def get_room_list_use_case(room_repository: RoomRepository = room_read_repo_dep) -> GetRoomListUseCase:
     return GetRoomListUseCase(room_repository)
 
 
-def get_room_with_tag_list_use_case(room_repository: RoomRepository = room_repo_dep) -> GetRoomWithTagListUseCase:
-    return GetRoomWithTagListUseCase(room_repository)
+def get_room_with_tag_list_use_case(room_repository: RoomRepository = room_read_repo_dep) -> GetRoomWithTagListUseCase:
+    return GetRoomWithTagListUseCase(room_repository, cursor_codec, pagination_total_cache)
 
 
 def create_room_use_case(room_repository: RoomRepository = room_repo_dep) -> CreateRoomUseCase:
@@ -276,13 +356,18 @@ def event_room_repository(session: Session = get_session_dep) -> EventRoomReposi
 
 event_room_repo_dep = Depends(event_room_repository)
 
+def event_room_read_repository(session: Session = get_read_session_dep) -> EventRoomRepository:
+    return SQLEventRoomRepository(session)
+
+event_room_read_repo_dep = Depends(event_room_read_repository)
+
 
-def get_event_room_by_id_use_case(event_room_repository: EventRoomRepository = event_room_repo_dep) -> GetEventRoomByIdUseCase:
+def get_event_room_by_id_use_case(event_room_repository: EventRoomRepository = event_room_read_repo_dep) -> GetEventRoomByIdUseCase:
     return GetEventRoomByIdUseCase(event_room_repository)
 
 
-def get_event_room_list_use_case(event_room_repository: EventRoomRepository = event_room_repo_dep) -> GetEventRoomListUseCase:
-    return GetEventRoomListUseCase(event_room_repository)
+def get_event_room_list_use_case(event_room_repository: EventRoomRepository = event_room_read_repo_dep) -> GetEventRoomListUseCase:
+    return GetEventRoomListUseCase(event_room_repository, cursor_codec, pagination_total_cache)
 
 
 def create_event_room_use_case(event_room_repository: EventRoomRepository = event_room_repo_dep) -> CreateEventRoomUseCase:
@@ -304,11 +389,16 @@ def building_repository(session: Session = get_session_dep) -> BuildingRepositor
 
 building_repo_dep = Depends(building_repository)
 
-def get_building_by_id_use_case(building_repository: BuildingRepository = building_repo_dep) -> GetBuildingByIdUseCase:
+def building_read_repository(session: Session = get_read_session_dep) -> BuildingRepository:
+    return SQLBuildingRepository(session)
+
+building_read_repo_dep = Depends(building_read_repository)
+
+def get_building_by_id_use_case(building_repository: BuildingRepository = building_read_repo_dep) -> GetBuildingByIdUseCase:
     return GetBuildingByIdUseCase(building_repository)
 
-def get_building_list_use_case(building_repository: BuildingRepository = building_repo_dep) -> GetBuildingListUseCase:
-    return GetBuildingListUseCase(building_repository)
+def get_building_list_use_case(building_repository: BuildingRepository = building_read_repo_dep) -> GetBuildingListUseCase:
+    return GetBuildingListUseCase(building_repository, cursor_codec, pagination_total_cache)
 
 def create_building_use_case(building_repository: BuildingRepository = building_repo_dep) -> CreateBuildingUseCase:
     return CreateBuildingUseCase(building_repository)
@@ -326,11 +416,16 @@ def group_repository(session: Session = get_session_dep) -> GroupRepository:
 
 group_repo_dep = Depends(group_repository)
 
-def get_group_by_id_use_case(group_repository: GroupRepository = group_repo_dep) -> GetGroupByIdUseCase:
+def group_read_repository(session: Session = get_read_session_dep) -> GroupRepository:
+    return SQLGroupRepository(session)
+
+group_read_repo_dep = Depends(group_read_repository)
+
+def get_group_by_id_use_case(group_repository: GroupRepository = group_read_repo_dep) -> GetGroupByIdUseCase:
     return GetGroupByIdUseCase(group_repository)
 
-def get_group_list_use_case(group_repository: GroupRepository = group_repo_dep) -> GetGroupListUseCase:
-    return GetGroupListUseCase(group_repository)
+def get_group_list_use_case(group_repository: GroupRepository = group_read_repo_dep) -> GetGroupListUseCase:
+    return GetGroupListUseCase(group_repository, cursor_codec, pagination_total_cache)
 
 def create_group_use_case(group_repository: GroupRepository = group_repo_dep) -> CreateGroupUseCase:
     return CreateGroupUseCase(group_repository)
@@ -349,11 +444,16 @@ def user_group_repository(session: Session = get_session_dep) -> UserGroupReposi
 
 user_group_repo_dep = Depends(user_group_repository)
 
-def get_user_group_by_id_use_case(user_group_repository: UserGroupRepository = user_group_repo_dep) -> GetUserGroupByIdUseCase:
+def user_group_read_repository(session: Session = get_read_session_dep) -> UserGroupRepository:
+    return SQLUserGroupRepository(session)
+
+user_group_read_repo_dep = Depends(user_group_read_repository)
+
+def get_user_group_by_id_use_case(user_group_repository: UserGroupRepository = user_group_read_repo_dep) -> GetUserGroupByIdUseCase:
     return GetUserGroupByIdUseCase(user_group_repository)
 
-def get_user_group_list_use_case(user_group_repository: UserGroupRepository = user_group_repo_dep) -> GetUserGroupListUseCase:
-    return GetUserGroupListUseCase(user_group_repository)
+def get_user_group_list_use_case(user_group_repository: UserGroupRepository = user_group_read_repo_dep) -> GetUserGroupListUseCase:
+    return GetUserGroupListUseCase(user_group_repository, cursor_codec, pagination_total_cache)
 
 def create_user_group_use_case(user_group_repository: UserGroupRepository = user_group_repo_dep) -> CreateUserGroupUseCase:
     return CreateUserGroupUseCase(user_group_repository)
@@ -371,28 +471,33 @@ def room_tag_repository(session: Session = get_session_dep) -> RoomTagRepository
 
 room_tag_repo_dep = Depends(room_tag_repository)
 
-def get_room_tag_by_id_use_case(room_tag_repository: RoomTagRepository = room_tag_repo_dep) -> GetRoomTagByIdUseCase:
+def room_tag_read_repository(session: Session = get_read_session_dep) -> RoomTagRepository:
+    return SQLRoomTagRepository(session)
+
+room_tag_read_repo_dep = Depends(room_tag_read_repository)
+
+def get_room_tag_by_id_use_case(room_tag_repository: RoomTagRepository = room_tag_read_repo_dep) -> GetRoomTagByIdUseCase:
     return GetRoomTagByIdUseCase(room_tag_repository)
 
 
-def get_room_tag_list_use_case(room_tag_repository: RoomTagRepository = room_tag_repo_dep) -> GetRoomTagListUseCase:
-    return GetRoomTagListUseCase(room_tag_repository)
+def get_room_tag_list_use_case(room_tag_repository: RoomTagRepository = room_tag_read_repo_dep) -> GetRoomTagListUseCase:
+    return GetRoomTagListUseCase(room_tag_repository, cursor_codec, pagination_total_cache)
 
 
 def create_room_tag_use_case(room_tag_repository: RoomTagRepository = room_tag_repo_dep) -> CreateRoomTagUseCase:
-    return CreateRoomTagUseCase(room_tag_repository)
+    return CreateRoomTagUseCase(room_tag_repository, rooms_sensor_data_cache)
 
 
 def update_room_tag_use_case(room_tag_repository: RoomTagRepository = room_tag_repo_dep) -> UpdateRoomTagUseCase:
-    return UpdateRoomTagUseCase(room_tag_repository)
+    return UpdateRoomTagUseCase(room_tag_repository, rooms_sensor_data_cache)
 
 
 def delete_room_tag_use_case(room_tag_repository: RoomTagRepository = room_tag_repo_dep) -> DeleteRoomTagUseCase:
-    return DeleteRoomTagUseCase(room_tag_repository)
+    return DeleteRoomTagUseCase(room_tag_repository, rooms_sensor_data_cache)
 
 
 def update_tag_with_room_link_use_case(tag_repository: TagRepository = tag_repo_dep, room_tag_repository: RoomTagRepository = room_tag_repo_dep) -> UpdateTagWithRoomLinkUseCase:
-    return UpdateTagWithRoomLinkUseCase(tag_repository, room_tag_repository)
+    return UpdateTagWithRoomLinkUseCase(tag_repository, room_tag_repository, rooms_sensor_data_cache)
 
 
 
@@ -419,7 +524,7 @@ SENSOR_MODEL_MAP: dict[str, tuple[Type[SQLModel], str]] = {
 
 def get_sensor_repo(
     kind: str,
-    session: Session = Depends(get_session_recorded),
+    session: Session = Depends(get_read_session_recorded),
 ) -> SQLSensorRepository:
     entry = SENSOR_MODEL_MAP.get(kind)
     if not entry:
@@ -432,40 +537,77 @@ def get_sensor_repo(
     return SQLSensorRepository(session, model, ts_attr)
 
 
-# data
-get_session_record_dep = Depends(get_session_recorded)
+def get_async_sensor_repo(
+    kind: str,
+    # Lectures et ingestion : la session reste sur le primaire pour les POST (reads_from_replica)
+    session: AsyncSession = Depends(get_async_read_session_recorded),
+) -> AsyncSQLSensorRepository:
+    entry = SENSOR_MODEL_MAP.get(kind)
+    if not entry:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown sensor kind '{kind}'.",
+        )
+
+    model, ts_attr = entry
+    return AsyncSQLSensorRepository(session, model, ts_attr)
+
+
+def discover_unregistered_tags_use_case(
+    tag_repository: TagRepository = tag_read_repo_dep,
+    session: Session = Depends(get_read_session_recorded),
+) -> DiscoverUnregisteredTagsUseCase:
+    # Une table par type (les alias "sensor_xxx" désignent les mêmes tables)
+    sensor_repositories = {
+        kind: SQLSensorRepository(session, model, ts_attr)
+        for kind, (model, ts_attr) in SENSOR_MODEL_MAP.items()
+        if not kind.startswith("sensor_")
+    }
+    return DiscoverUnregisteredTagsUseCase(tag_repository, sensor_repositories)
 
-def data_repository(session: Session = get_session_dep, session_recorded : Session = get_session_record_dep) -> DataRepository:
-    return SQLDataRepository(session, session_recorded )
 
-data_repo_dep = Depends(data_repository)
+# data (asyncpg)
+def async_data_repository(
+    session: AsyncSession = Depends(get_async_read_session),
+    session_recorded: AsyncSession = Depends(get_async_read_session_recorded)
+) -> AsyncDataRepository:
+    return AsyncSQLDataRepository(
+        session,
+        session_recorded,
+        settings.DATA_AGGREGATION_MODE,
+        settings.DATA_ROLLUPS_ENABLED,
+        data_fetch_executor
+    )
 
-def get_rooms_sensor_data_use_case(data_repository: DataRepository = data_repo_dep, room_repository: RoomRepository = room_repo_dep) -> GetRoomsSensorDataUseCase:
-    return GetRoomsSensorDataUseCase(data_repository, room_repository)
+async_data_repo_dep = Depends(async_data_repository)
 
+def get_rooms_sensor_data_async_use_case(data_repository: AsyncDataRepository = async_data_repo_dep) -> GetRoomsSensorDataAsyncUseCase:
+    return GetRoomsSensorDataAsyncUseCase(data_repository, rooms_sensor_data_cache)
 
-def get_single_room_sensor_data_use_case(data_repository: DataRepository = data_repo_dep, room_repository: RoomRepository = room_repo_dep) -> GetSingleRoomSensorDataUseCase:
-    return GetSingleRoomSensorDataUseCase(data_repository)
 
+def get_single_room_sensor_data_async_use_case(data_repository: AsyncDataRepository = async_data_repo_dep) -> GetSingleRoomSensorDataAsyncUseCase:
+    return GetSingleRoomSensorDataAsyncUseCase(data_repository, rooms_sensor_data_cache)
 
-# data
-get_session_record_dep = Depends(get_session_recorded)
 
-def data_repository(session: Session = get_session_dep, session_recorded : Session = get_session_record_dep) -> DataRepository:
-    return SQLDataRepository(session, session_recorded )
+def get_rooms_latest_values_async_use_case(data_repository: AsyncDataRepository = async_data_repo_dep) -> GetRoomsLatestValuesAsyncUseCase:
+    return GetRoomsLatestValuesAsyncUseCase(data_repository)
 
-data_repo_dep = Depends(data_repository)
 
-def get_rooms_sensor_data_use_case(data_repository: DataRepository = data_repo_dep, room_repository: RoomRepository = room_repo_dep) -> GetRoomsSensorDataUseCase:
-    return GetRoomsSensorDataUseCase(data_repository, room_repository)
+def get_sensor_measurements_async_use_case(
+    data_repository: AsyncDataRepository = async_data_repo_dep,
+    sensor_repository: AsyncSQLSensorRepository = Depends(get_async_sensor_repo)
+) -> GetSensorMeasurementsAsyncUseCase:
+    return GetSensorMeasurementsAsyncUseCase(data_repository, sensor_repository)
 
 
-def get_single_room_sensor_data_use_case(data_repository: DataRepository = data_repo_dep, room_repository: RoomRepository = room_repo_dep) -> GetSingleRoomSensorDataUseCase:
-    return GetSingleRoomSensorDataUseCase(data_repository)
+def get_ingest_sensor_batch_async_use_case(
+    sensor_repository: AsyncSQLSensorRepository = Depends(get_async_sensor_repo)
+) -> IngestSensorBatchAsyncUseCase:
+    return IngestSensorBatchAsyncUseCase(sensor_repository)
 
 # view
 
-def get_group_repository(session: Session = get_session_dep) -> GroupUserRepository:
+def get_group_repository(session: Session = get_read_session_dep) -> GroupUserRepository:
     return GroupUserRepository(session)
 
 def get_users_in_group_use_case(
@@ -473,7 +615,7 @@ def get_users_in_group_use_case(
 ) -> GetUsersInGroupUseCase:
     return GetUsersInGroupUseCase(repository)
 
-def get_user_event_repository(session: Session = get_session_dep) -> UserEventRepository:
+def get_user_event_repository(session: Session = get_read_session_dep) -> UserEventRepository:
     return UserEventRepository(session)
 
 def get_user_events_use_case(
@@ -481,7 +623,7 @@ def get_user_events_use_case(
 ) -> GetEventsForUserUseCase:
     return GetEventsForUserUseCase(repository)
 
-def get_events_by_date_repository(session: Session = get_session_dep) -> EventsByDateRepository:
+def get_events_by_date_repository(session: Session = get_read_session_dep) -> EventsByDateRepository:
     return EventsByDateRepository(session)
 
 def get_events_by_date_use_case(
@@ -1,9 +1,13 @@
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 
 from app.src.common.logging import setup_logging
+from app.src.infrastructure.db.session import dispose_engines, warm_up_engines
+from app.src.presentation.api.read_routing import read_your_writes_middleware
 from app.src.presentation.api.router import router
 from app.src.presentation.core.config import settings
 from app.src.presentation.core.open_api_tags import OpenApiTags
@@ -11,7 +15,17 @@ from app.src.presentation.core.open_api_tags import OpenApiTags
 setup_logging()
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Exécuté dans chaque worker, après le fork : les pools ont été recréés par post_fork (gunicorn.conf.py)
+    await warm_up_engines(settings.DB_POOL_WARMUP_CONNECTIONS)
+    yield
+    await dispose_engines()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     root_path=settings.API_PREFIX,
     debug=settings.is_debug,
     redoc_url=None,
@@ -100,6 +114,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.middleware("http")(read_your_writes_middleware)
+
 app.include_router(router, prefix=settings.API_V1_STR)
 
 app.mount("/static", StaticFiles(directory="app/src/presentation/static"), name="static")
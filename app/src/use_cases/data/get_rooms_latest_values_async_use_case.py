@@ -0,0 +1,39 @@
+import logging
+from typing import Any
+
+from app.src.domain.interface_repositories.data_repository import AsyncDataRepository
+
+logger = logging.getLogger(__name__)
+
+_SENSOR_TYPES = ("temperature", "humidity", "pressure")
+
+
+class GetRoomsLatestValuesAsyncUseCase:
+    """
+    Valeurs courantes par pièce (tableaux de bord) : pas d'historique, pas de cache.
+    """
+
+    def __init__(self, data_repository: AsyncDataRepository):
+        self.data_repository = data_repository
+
+    async def execute(
+        self,
+        room_ids: list[int] | None = None,
+        building_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        try:
+            rooms = await self.data_repository.get_rooms_latest_values(room_ids=room_ids, building_id=building_id)
+            return [format_latest_values(room) for room in rooms]
+
+        except Exception as e:
+            logger.error(f"Error GetRoomsLatestValues: {e}")
+            raise
+
+
+def format_latest_values(room: dict[str, Any]) -> dict[str, Any]:
+    formatted = {key: room.get(key) for key in ("id", "name", "floor", "building_id")}
+    for sensor_type in _SENSOR_TYPES:
+        if sensor_type in room:
+            latest = room[sensor_type]
+            formatted[sensor_type] = {"value": latest["value"], "time": latest["time"].isoformat()}
+    return formatted
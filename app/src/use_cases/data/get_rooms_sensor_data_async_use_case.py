@@ -0,0 +1,183 @@
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from app.src.common.cache import ResultCache
+from app.src.common.time_series import downsample_points
+from app.src.domain.interface_repositories.data_repository import AsyncDataRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GetRoomSensorDataResult:
+    rooms_data: list[dict[str, Any]]
+    total_rooms: int
+
+
+class GetRoomsSensorDataAsyncUseCase:
+    """
+    Les ids inconnus sont ignorés par la requête des pièces (pas de lecture préalable de chaque pièce).
+    """
+
+    def __init__(self, data_repository: AsyncDataRepository, cache: ResultCache | None = None):
+        self.data_repository = data_repository
+        self.cache = cache
+
+    async def execute(
+        self,
+        room_ids: list[int] | None = None,
+        first_value_date: datetime | None = None,
+        smooth_interval_minutes: int = 30,
+        since: datetime | None = None,
+        max_points: int | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> GetRoomSensorDataResult:
+        try:
+            smooth_interval_minutes = validate_smooth_interval(smooth_interval_minutes)
+
+            cache_key = rooms_cache_key(
+                room_ids, first_value_date, smooth_interval_minutes, since, max_points, quantiles, with_stats
+            )
+            if self.cache:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            rooms_data = await self.data_repository.get_rooms_with_sensor_data(
+                room_ids=room_ids,
+                first_value_date=first_value_date,
+                smooth_interval_minutes=smooth_interval_minutes,
+                since=since,
+                quantiles=quantiles,
+                with_stats=with_stats
+            )
+
+            processed_rooms = [format_room_data(room_data, max_points) for room_data in rooms_data]
+            processed_rooms.sort(key=lambda x: x["id"])
+            self._warn_missing_rooms(room_ids, processed_rooms)
+
+            result = GetRoomSensorDataResult(
+                rooms_data=processed_rooms,
+                total_rooms=len(processed_rooms)
+            )
+            if self.cache:
+                self.cache.set(cache_key, result)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error GetRoomsSensorData: {e}")
+            raise
+
+    def stream(
+        self,
+        room_ids: list[int] | None = None,
+        first_value_date: datetime | None = None,
+        smooth_interval_minutes: int = 30,
+        since: datetime | None = None,
+        max_points: int | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Même résultat que execute, pièce par pièce (triées par id).
+        """
+        rooms_data = self.data_repository.iter_rooms_with_sensor_data(
+            room_ids=room_ids,
+            first_value_date=first_value_date,
+            smooth_interval_minutes=validate_smooth_interval(smooth_interval_minutes),
+            since=since,
+            quantiles=quantiles,
+            with_stats=with_stats
+        )
+        return (format_room_data(room_data, max_points) async for room_data in rooms_data)
+
+    def _warn_missing_rooms(self, room_ids: list[int] | None, rooms: list[dict[str, Any]]) -> None:
+        for room_id in sorted(set(room_ids or []) - {room["id"] for room in rooms}):
+            logger.warning(f"Room {room_id} not found")
+
+
+def validate_smooth_interval(smooth_interval_minutes: int) -> int:
+    if smooth_interval_minutes <= 0:
+        return 30
+    if smooth_interval_minutes > 1440:  # Max 24h
+        return 1440
+    return smooth_interval_minutes
+
+
+def rooms_cache_key(
+    room_ids: list[int] | None,
+    first_value_date: datetime | None,
+    smooth_interval_minutes: int,
+    since: datetime | None,
+    max_points: int | None,
+    quantiles: bool = False,
+    with_stats: bool = True
+) -> tuple:
+    return (
+        tuple(sorted(set(room_ids))) if room_ids else None,
+        first_value_date.isoformat() if first_value_date else None,
+        smooth_interval_minutes,
+        since.isoformat() if since else None,
+        max_points,
+        quantiles,
+        with_stats
+    )
+
+
+def format_room_data(room_data: dict[str, Any], max_points: int | None = None) -> dict[str, Any]:
+    formatted = {
+        "id": room_data.get("id"),
+        "name": room_data.get("name"),
+        "description": room_data.get("description"),
+        "floor": room_data.get("floor"),
+        "building_id": room_data.get("building_id"),
+        "area": room_data.get("area"),
+        "capacity": room_data.get("capacity"),
+        "start_at": room_data.get("start_at").isoformat() if room_data.get("start_at") else None,
+        "end_at": room_data.get("end_at").isoformat() if room_data.get("end_at") else None,
+        "created_at": room_data.get("created_at").isoformat() if room_data.get("created_at") else None,
+        "updated_at": room_data.get("updated_at").isoformat() if room_data.get("updated_at") else None,
+        "tags": []
+    }
+
+    for tag_info in room_data.get("tags", []):
+        formatted_tag = {
+            "id": tag_info["id"],
+            "tag": {
+                "id": tag_info["tag"].id,
+                "name": tag_info["tag"].name,
+                "source_address": tag_info["tag"].source_address,
+                "description": tag_info["tag"].description,
+                "created_at": tag_info["tag"].created_at.isoformat() if tag_info["tag"].created_at else None,
+                "updated_at": tag_info["tag"].updated_at.isoformat() if tag_info["tag"].updated_at else None
+            },
+            "start_at": tag_info["start_at"].isoformat() if tag_info["start_at"] else None,
+            "end_at": tag_info["end_at"].isoformat() if tag_info["end_at"] else None,
+            "created_at": tag_info["created_at"].isoformat() if tag_info["created_at"] else None,
+            "updated_at": tag_info["updated_at"].isoformat() if tag_info["updated_at"] else None
+        }
+        formatted["tags"].append(formatted_tag)
+
+    sensor_types = ["temperature", "humidity", "pressure"]
+    for sensor_type in sensor_types:
+        if sensor_type in room_data:
+            sensor_data = room_data[sensor_type]
+            data = sensor_data.get("data", [])
+            formatted[sensor_type] = {
+                "min": sensor_data.get("min"),
+                "max": sensor_data.get("max"),
+                "average": sensor_data.get("average"),
+                # Absent avec with_stats=false (mode incrémental, statistiques déjà reçues)
+                "nombre_values": sensor_data.get("nombre_values", 0 if "min" in sensor_data else None),
+                "data": downsample_points(data, max_points) if max_points else data
+            }
+            if "quantile_data" in sensor_data:
+                formatted[sensor_type]["quantiles"] = sensor_data.get("quantiles")
+                formatted[sensor_type]["quantile_data"] = sensor_data["quantile_data"]
+
+    return formatted
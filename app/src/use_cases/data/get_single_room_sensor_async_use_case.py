@@ -0,0 +1,48 @@
+import logging
+from datetime import datetime
+from typing import Any
+
+from app.src.common.cache import ResultCache
+from app.src.common.exception import NotFoundError
+from app.src.domain.interface_repositories.data_repository import AsyncDataRepository
+from app.src.use_cases.data.get_rooms_sensor_data_async_use_case import GetRoomsSensorDataAsyncUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class GetSingleRoomSensorDataAsyncUseCase:
+    def __init__(self, data_repository: AsyncDataRepository, cache: ResultCache | None = None):
+        self.data_repository = data_repository
+        self.cache = cache
+
+    async def execute(
+        self,
+        room_id: int,
+        first_value_date: datetime | None = None,
+        smooth_interval_minutes: int = 30,
+        since: datetime | None = None,
+        max_points: int | None = None,
+        quantiles: bool = False,
+        with_stats: bool = True
+    ) -> dict[str, Any]:
+        try:
+            result = await GetRoomsSensorDataAsyncUseCase(self.data_repository, self.cache).execute(
+                room_ids=[room_id],
+                first_value_date=first_value_date,
+                smooth_interval_minutes=smooth_interval_minutes,
+                since=since,
+                max_points=max_points,
+                quantiles=quantiles,
+                with_stats=with_stats
+            )
+
+            if not result.rooms_data:
+                raise NotFoundError("Room", room_id)
+
+            return result.rooms_data[0]
+
+        except NotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Error get rooms data {room_id}: {e}")
+            raise
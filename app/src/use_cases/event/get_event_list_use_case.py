@@ -1,9 +1,9 @@
 import logging
-import math
 from dataclasses import dataclass
 
+from app.src.common.cache import ResultCache
+from app.src.common.pagination import CursorCodec, chunk_count, count_total
 from app.src.domain.entities.event import Event
-from app.src.common.utils import decode, encode
 from app.src.domain.interface_repositories.event_repository import EventRepository
 
 logger = logging.getLogger(__name__)
@@ -11,46 +11,35 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PaginatedEvent:
     events: list[Event]
-    total: int| None
-    chunk_size: int| None
+    total: int | None
+    chunk_size: int | None
     chunk_count: int | None
     current_cursor: str | None
     first_cursor: str | None
     last_cursor: str | None
     next_cursor: str | None
+    prev_cursor: str | None
 
 
 class GetEventListUseCase:
-    def __init__(self, event_repository: EventRepository):
+    def __init__(self, event_repository: EventRepository, cursor_codec: CursorCodec, total_cache: ResultCache | None = None):
         self.event_repository = event_repository
+        self.cursor_codec = cursor_codec
+        self.total_cache = total_cache
 
-    def execute(self, cursor: str | None, limit: int | None = None) -> PaginatedEvent:
+    def execute(
+        self, cursor: str | None, limit: int | None = None, with_total: bool = True
+    ) -> PaginatedEvent:
         limit = limit or 20
 
-        decoded_cursor = None
-        if cursor:
-            decoded_cursor = decode(cursor, "Event pagination cursor")
-            decoded_cursor = decoded_cursor.get("id") if decoded_cursor else None
-
-        events, total, first_event, last_event = self.event_repository.paginate_events(decoded_cursor, (limit + 1))
-
-        next_event = None
-        if len(events) == (limit + 1):
-            next_event = events.pop(-1)
-
-        chunk_count = math.ceil(total / limit) if limit else 1
-
-        first_cursor = {"id": first_event.id} if first_event else None
-        last_cursor = {"id": last_event.id} if last_event else None
-        next_cursor = {"id": next_event.id} if next_event else None
+        decoded_cursor = self.cursor_codec.decode(cursor, "Event pagination cursor")
+        page = self.event_repository.paginate_events(decoded_cursor, limit)
+        total = count_total(self.total_cache, "event", self.event_repository.count_all_events) if with_total else None
 
         return PaginatedEvent(
-            events=events,
+            events=page.items,
             total=total,
-            chunk_size=len(events),
-            chunk_count=chunk_count,
-            current_cursor=encode({"id": decoded_cursor}) if decoded_cursor else encode(first_cursor) if first_cursor else None,
-            first_cursor=encode(first_cursor) if first_cursor else None,
-            last_cursor=encode(last_cursor) if last_cursor else None,
-            next_cursor=encode(next_cursor) if next_cursor else None,
+            chunk_size=len(page.items),
+            chunk_count=chunk_count(total, limit),
+            **self.cursor_codec.page_cursors(page, cursor),
         )
@@ -1,9 +1,9 @@
 import logging
-import math
 from dataclasses import dataclass
 
+from app.src.common.cache import ResultCache
+from app.src.common.pagination import CursorCodec, chunk_count, count_total
 from app.src.domain.entities.event_room import EventRoom
-from app.src.common.utils import decode, encode
 from app.src.domain.interface_repositories.event_room_repository import EventRoomRepository
 
 logger = logging.getLogger(__name__)
@@ -11,46 +11,35 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PaginatedEventRoom:
     event_rooms: list[EventRoom]
-    total: int| None
-    chunk_size: int| None
+    total: int | None
+    chunk_size: int | None
     chunk_count: int | None
     current_cursor: str | None
     first_cursor: str | None
     last_cursor: str | None
     next_cursor: str | None
+    prev_cursor: str | None
 
 
 class GetEventRoomListUseCase:
-    def __init__(self, event_room_repository: EventRoomRepository):
+    def __init__(self, event_room_repository: EventRoomRepository, cursor_codec: CursorCodec, total_cache: ResultCache | None = None):
         self.event_room_repository = event_room_repository
+        self.cursor_codec = cursor_codec
+        self.total_cache = total_cache
 
-    def execute(self, cursor: str | None, limit: int | None = None) -> PaginatedEventRoom:
+    def execute(
+        self, cursor: str | None, limit: int | None = None, with_total: bool = True
+    ) -> PaginatedEventRoom:
         limit = limit or 20
 
-        decoded_cursor = None
-        if cursor:
-            decoded_cursor = decode(cursor, "EventRoom pagination cursor")
-            decoded_cursor = decoded_cursor.get("id") if decoded_cursor else None
-
-        event_rooms, total, first_event_room, last_event_room = self.event_room_repository.paginate_event_rooms(decoded_cursor, (limit + 1))
-
-        next_event_room = None
-        if len(event_rooms) == (limit + 1):
-            next_event_room = event_rooms.pop(-1)
-
-        chunk_count = math.ceil(total / limit) if limit else 1
-
-        first_cursor = {"id": first_event_room.id} if first_event_room else None
-        last_cursor = {"id": last_event_room.id} if last_event_room else None
-        next_cursor = {"id": next_event_room.id} if next_event_room else None
+        decoded_cursor = self.cursor_codec.decode(cursor, "EventRoom pagination cursor")
+        page = self.event_room_repository.paginate_event_rooms(decoded_cursor, limit)
+        total = count_total(self.total_cache, "event_room", self.event_room_repository.count_all_event_rooms) if with_total else None
 
         return PaginatedEventRoom(
-            event_rooms=event_rooms,
+            event_rooms=page.items,
             total=total,
-            chunk_size=len(event_rooms),
-            chunk_count=chunk_count,
-            current_cursor=encode({"id": decoded_cursor}) if decoded_cursor else encode(first_cursor) if first_cursor else None,
-            first_cursor=encode(first_cursor) if first_cursor else None,
-            last_cursor=encode(last_cursor) if last_cursor else None,
-            next_cursor=encode(next_cursor) if next_cursor else None,
+            chunk_size=len(page.items),
+            chunk_count=chunk_count(total, limit),
+            **self.cursor_codec.page_cursors(page, cursor),
         )
@@ -1,9 +1,9 @@
 import logging
-import math
 from dataclasses import dataclass
 
+from app.src.common.cache import ResultCache
+from app.src.common.pagination import CursorCodec, chunk_count, count_total
 from app.src.domain.entities.group import Group
-from app.src.common.utils import decode, encode
 from app.src.domain.interface_repositories.group_repository import GroupRepository
 
 logger = logging.getLogger(__name__)
@@ -11,46 +11,35 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PaginatedGroup:
     groups: list[Group]
-    total: int| None
-    chunk_size: int| None
+    total: int | None
+    chunk_size: int | None
     chunk_count: int | None
     current_cursor: str | None
     first_cursor: str | None
     last_cursor: str | None
     next_cursor: str | None
+    prev_cursor: str | None
 
 
 class GetGroupListUseCase:
-    def __init__(self, group_repository: GroupRepository):
+    def __init__(self, group_repository: GroupRepository, cursor_codec: CursorCodec, total_cache: ResultCache | None = None):
         self.group_repository = group_repository
+        self.cursor_codec = cursor_codec
+        self.total_cache = total_cache
 
-    def execute(self, cursor: str | None, limit: int | None = None) -> PaginatedGroup:
+    def execute(
+        self, cursor: str | None, limit: int | None = None, with_total: bool = True
+    ) -> PaginatedGroup:
         limit = limit or 20
 
-        decoded_cursor = None
-        if cursor:
-            decoded_cursor = decode(cursor, "Group pagination cursor")
-            decoded_cursor = decoded_cursor.get("id") if decoded_cursor else None
-
-        groups, total, first_group, last_group = self.group_repository.paginate_groups(decoded_cursor, (limit + 1))
-
-        next_group = None
-        if len(groups) == (limit + 1):
-            next_group = groups.pop(-1)
-
-        chunk_count = math.ceil(total / limit) if limit else 1
-
-        first_cursor = {"id": first_group.id} if first_group else None
-        last_cursor = {"id": last_group.id} if last_group else None
-        next_cursor = {"id": next_group.id} if next_group else None
+        decoded_cursor = self.cursor_codec.decode(cursor, "Group pagination cursor")
+        page = self.group_repository.paginate_groups(decoded_cursor, limit)
+        total = count_total(self.total_cache, "group", self.group_repository.count_all_groups) if with_total else None
 
         return PaginatedGroup(
-            groups=groups,
+            groups=page.items,
             total=total,
-            chunk_size=len(groups),
-            chunk_count=chunk_count,
-            current_cursor=encode({"id": decoded_cursor}) if decoded_cursor else encode(first_cursor) if first_cursor else None,
-            first_cursor=encode(first_cursor) if first_cursor else None,
-            last_cursor=encode(last_cursor) if last_cursor else None,
-            next_cursor=encode(next_cursor) if next_cursor else None,
+            chunk_size=len(page.items),
+            chunk_count=chunk_count(total, limit),
+            **self.cursor_codec.page_cursors(page, cursor),
         )
@@ -1,9 +1,9 @@
 import logging
-import math
 from dataclasses import dataclass
 
+from app.src.common.cache import ResultCache
+from app.src.common.pagination import CursorCodec, chunk_count, count_total
 from app.src.domain.entities.map import Map
-from app.src.common.utils import decode, encode
 from app.src.domain.interface_repositories.map_repository import MapRepository
 
 logger = logging.getLogger(__name__)
@@ -11,46 +11,35 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PaginatedMap:
     maps: list[Map]
-    total: int| None
-    chunk_size: int| None
+    total: int | None
+    chunk_size: int | None
     chunk_count: int | None
     current_cursor: str | None
     first_cursor: str | None
     last_cursor: str | None
     next_cursor: str | None
+    prev_cursor: str | None
 
 
 class GetMapListUseCase:
-    def __init__(self, map_repository: MapRepository):
+    def __init__(self, map_repository: MapRepository, cursor_codec: CursorCodec, total_cache: ResultCache | None = None):
         self.map_repository = map_repository
+        self.cursor_codec = cursor_codec
+        self.total_cache = total_cache
 
-    def execute(self, cursor: str | None, limit: int | None = None) -> PaginatedMap:
+    def execute(
+        self, cursor: str | None, limit: int | None = None, with_total: bool = True
+    ) -> PaginatedMap:
         limit = limit or 20
 
-        decoded_cursor = None
-        if cursor:
-            decoded_cursor = decode(cursor, "Map pagination cursor")
-            decoded_cursor = decoded_cursor.get("id") if decoded_cursor else None
-
-        maps, total, first_map, last_map = self.map_repository.paginate_maps(decoded_cursor, (limit + 1))
-
-        next_map = None
-        if len(maps) == (limit + 1):
-            next_map = maps.pop(-1)
-
-        chunk_count = math.ceil(total / limit) if limit else 1
-
-        first_cursor = {"id": first_map.id} if first_map else None
-        last_cursor = {"id": last_map.id} if last_map else None
-        next_cursor = {"id": next_map.id} if next_map else None
+        decoded_cursor = self.cursor_codec.decode(cursor, "Map pagination cursor")
+        page = self.map_repository.paginate_maps(decoded_cursor, limit)
+        total = count_total(self.total_cache, "map", self.map_repository.count_all_maps) if with_total else None
 
         return PaginatedMap(
-            maps=maps,
+            maps=page.items,
             total=total,
-            chunk_size=len(maps),
-            chunk_count=chunk_count,
-            current_cursor=encode({"id": decoded_cursor}) if decoded_cursor else encode(first_cursor) if first_cursor else None,
-            first_cursor=encode(first_cursor) if first_cursor else None,
-            last_cursor=encode(last_cursor) if last_cursor else None,
-            next_cursor=encode(next_cursor) if next_cursor else None,
+            chunk_size=len(page.items),
+            chunk_count=chunk_count(total, limit),
+            **self.cursor_codec.page_cursors(page, cursor),
         )
@@ -1,9 +1,9 @@
 import logging
-import math
 from dataclasses import dataclass
 
+from app.src.common.cache import ResultCache
+from app.src.common.pagination import CursorCodec, chunk_count, count_total
 from app.src.domain.entities.room import Room
-from app.src.common.utils import decode, encode
 from app.src.domain.interface_repositories.room_repository import RoomRepository
 
 logger = logging.getLogger(__name__)
@@ -11,44 +11,33 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PaginatedRoom:
     rooms: list[Room]
-    total: int| None
-    chunk_size: int| None
+    total: int | None
+    chunk_size: int | None
     chunk_count: int | None
     current_cursor: str | None
     first_cursor: str | None
     last_cursor: str | None
     next_cursor: str | None
+    prev_cursor: str | None
 
 
 class GetRoomWithTagListUseCase:
-    def __init__(self, room_repository: RoomRepository):
+    def __init__(self, room_repository: RoomRepository, cursor_codec: CursorCodec, total_cache: ResultCache | None = None):
         self.room_repository = room_repository
+        self.cursor_codec = cursor_codec
+        self.total_cache = total_cache
 
-    def execute(self, cursor: str | None, limit: int | None = None) -> PaginatedRoom:
-        decoded_cursor = None
-        if cursor:
-            decoded_cursor = decode(cursor, "Room pagination cursor")
-            decoded_cursor = decoded_cursor.get("id") if decoded_cursor else None
-
-        rooms, total, first_room, last_room = self.room_repository.paginate_rooms_with_tags(decoded_cursor, (limit + 1))
-
-        next_room = None
-        if len(rooms) == (limit + 1):
-            next_room = rooms.pop(-1)
-
-        chunk_count = math.ceil(total / limit) if limit else 1
-
-        first_cursor = {"id": first_room.id} if first_room else None
-        last_cursor = {"id": last_room.id} if last_room else None
-        next_cursor = {"id": next_room.id} if next_room else None
+    def execute(
+        self, cursor: str | None, limit: int | None = None, with_total: bool = True
+    ) -> PaginatedRoom:
+        decoded_cursor = self.cursor_codec.decode(cursor, "Room pagination cursor")
+        page = self.room_repository.paginate_rooms_with_tags(decoded_cursor, limit)
+        total = count_total(self.total_cache, "room", self.room_repository.count_all_rooms) if with_total else None
 
         return PaginatedRoom(
-            rooms=rooms,
+            rooms=page.items,
             total=total,
-            chunk_size=len(rooms),
-            chunk_count=chunk_count,
-            current_cursor=encode({"id": decoded_cursor}) if decoded_cursor else encode(first_cursor) if first_cursor else None,
-            first_cursor=encode(first_cursor) if first_cursor else None,
-            last_cursor=encode(last_cursor) if last_cursor else None,
-            next_cursor=encode(next_cursor) if next_cursor else None,
+            chunk_size=len(page.items),
+            chunk_count=chunk_count(total, limit),
+            **self.cursor_codec.page_cursors(page, cursor),
         )
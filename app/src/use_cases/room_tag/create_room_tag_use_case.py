@@ -1,18 +1,25 @@
 from datetime import datetime
 import logging
 
+from app.src.common.cache import ResultCache
 from app.src.domain.entities.room_tag import RoomTag 
 from app.src.domain.interface_repositories.room_tag_repository import RoomTagRepository
 
 logger = logging.getLogger(__name__)
 
 class CreateRoomTagUseCase:
-    def __init__(self, room_tag_repository: RoomTagRepository):
+    def __init__(self, room_tag_repository: RoomTagRepository, cache: ResultCache | None = None):
         self.room_tag_repository = room_tag_repository
+        self.cache = cache
 
     def execute(self, room_tag: RoomTag) -> RoomTag:
 
         if not room_tag.start_at:
             room_tag.start_at = datetime.now()
 
-        return self.room_tag_repository.create_roomtag(room_tag)
+        result = self.room_tag_repository.create_roomtag(room_tag)
+
+        if self.cache:
+            self.cache.clear()
+
+        return result
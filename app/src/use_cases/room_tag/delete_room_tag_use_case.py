@@ -1,9 +1,16 @@
+from app.src.common.cache import ResultCache
 from app.src.domain.interface_repositories.room_tag_repository import RoomTagRepository
 
 
 class DeleteRoomTagUseCase:
-    def __init__(self, room_tag_repository: RoomTagRepository):
+    def __init__(self, room_tag_repository: RoomTagRepository, cache: ResultCache | None = None):
         self.room_tag_repository = room_tag_repository
+        self.cache = cache
 
     def execute(self, room_tag_id: int) -> bool:
-        return self.room_tag_repository.delete_roomtag(room_tag_id)
+        result = self.room_tag_repository.delete_roomtag(room_tag_id)
+
+        if self.cache:
+            self.cache.clear()
+
+        return result
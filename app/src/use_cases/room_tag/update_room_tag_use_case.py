@@ -1,10 +1,17 @@
+from app.src.common.cache import ResultCache
 from app.src.domain.entities.room_tag import RoomTag 
 from app.src.domain.interface_repositories.room_tag_repository import RoomTagRepository
 
 
 class UpdateRoomTagUseCase:
-    def __init__(self, room_tag_repository: RoomTagRepository):
+    def __init__(self, room_tag_repository: RoomTagRepository, cache: ResultCache | None = None):
         self.room_tag_repository = room_tag_repository
+        self.cache = cache
 
     def execute(self, room_tag_id: int, room_tag_data: dict) -> RoomTag:
-        return self.room_tag_repository.update_roomtag(room_tag_id, room_tag_data)
+        result = self.room_tag_repository.update_roomtag(room_tag_id, room_tag_data)
+
+        if self.cache:
+            self.cache.clear()
+
+        return result
@@ -0,0 +1,57 @@
+import logging
+from datetime import datetime
+from typing import Any
+
+from app.src.common.interval_index import TagWindow
+from app.src.common.utils import as_utc
+from app.src.domain.interface_repositories.data_repository import AsyncDataRepository
+from app.src.domain.interface_repositories.sensor_repository import AsyncSensorRepository
+
+logger = logging.getLogger(__name__)
+
+
+class GetSensorMeasurementsAsyncUseCase:
+    """
+    Mesures brutes d'un type de capteur, filtrées par balise (adresse ou identifiant) ou par pièce.
+    Une pièce est résolue en périodes d'affectation de ses balises : une mesure prise avant ou après
+    l'affectation n'est pas renvoyée.
+    """
+
+    def __init__(self, data_repository: AsyncDataRepository, sensor_repository: AsyncSensorRepository):
+        self.data_repository = data_repository
+        self.sensor_repository = sensor_repository
+
+    async def execute(
+        self,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        source_address: str | None = None,
+        tag_id: int | None = None,
+        room_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        try:
+            # Les périodes d'affectation sont en UTC : une date naïve de la requête ne peut pas leur être comparée
+            start, end = as_utc(start), as_utc(end)
+            windows = await self._windows(source_address, tag_id, room_id)
+            if start is None and end is None:
+                return await self.sensor_repository.get_all(limit, windows)
+            return await self.sensor_repository.get_range(start, end, limit, windows)
+
+        except Exception as e:
+            logger.error(f"Error GetSensorMeasurements: {e}")
+            raise
+
+    async def _windows(
+        self,
+        source_address: str | None,
+        tag_id: int | None,
+        room_id: int | None
+    ) -> list[TagWindow] | None:
+        if tag_id is None and room_id is None:
+            return None if source_address is None else [TagWindow(source_address)]
+
+        windows = await self.data_repository.get_tag_windows(tag_id=tag_id, room_id=room_id)
+        if source_address is not None:
+            windows = [window for window in windows if window.source_address == source_address]
+        return windows
@@ -0,0 +1,161 @@
+import logging
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from app.src.domain.interface_repositories.sensor_repository import AsyncSensorRepository, SensorColumn
+
+logger = logging.getLogger(__name__)
+
+# Lignes validées envoyées par COPY
+_COPY_CHUNK_SIZE = 10_000
+# Erreurs détaillées dans le rapport (les suivantes ne sont que comptées)
+MAX_REPORTED_ERRORS = 100
+# Colonnes INTEGER (int4) des tables de capteurs : une valeur hors bornes ferait échouer tout le COPY
+_INT4_MIN, _INT4_MAX = -(2**31), 2**31 - 1
+
+
+@dataclass
+class RowError:
+    line: int
+    error: str
+
+
+@dataclass
+class BatchIngestionReport:
+    inserted: int = 0
+    rejected: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+
+def _parse_time(value: Any) -> datetime:
+    if isinstance(value, str):
+        parsed = datetime.fromisoformat(value)
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value, UTC)
+    raise ValueError(f"invalid datetime {value!r}")
+
+
+def _parse_int(value: Any) -> int:
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f"invalid integer {value!r}")
+    parsed = int(value)
+    if not _INT4_MIN <= parsed <= _INT4_MAX:
+        raise ValueError(f"integer out of range {value!r}")
+    return parsed
+
+
+def _parse_float(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f"invalid number {value!r}")
+    return float(value)
+
+
+def _parse_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"invalid string {value!r}")
+    if "\x00" in value:
+        # Refusé par PostgreSQL dans une colonne texte
+        raise ValueError("string contains a NUL character")
+    return value
+
+
+_PARSERS: dict[type, Callable[[Any], Any]] = {
+    datetime: _parse_time,
+    int: _parse_int,
+    float: _parse_float,
+    str: _parse_str,
+}
+# Types dont toute valeur JSON déjà typée est acceptée par PostgreSQL, sans vérification
+_TRUSTED_TYPES = (float,)
+
+
+class RecordParser:
+    """
+    Ligne reçue (dictionnaire colonne -> valeur JSON ou texte CSV) -> tuple dans l'ordre des colonnes de la table.
+    Une valeur absente, nulle ou vide prend la valeur par défaut du modèle ; une colonne inconnue est une erreur.
+    """
+
+    def __init__(self, columns: list[SensorColumn]):
+        self.names = [column.name for column in columns]
+        self._known = set(self.names)
+        self._columns = [
+            (column.name, column.python_type, _PARSERS[column.python_type], column.default, column.nullable)
+            for column in columns
+        ]
+
+    def __call__(self, row: dict[str, Any]) -> tuple:
+        if not self._known.issuperset(row):
+            raise ValueError(f"unknown columns {sorted(set(row) - self._known)}")
+        values = []
+        for name, python_type, parse, default, nullable in self._columns:
+            value = row.get(name)
+            if value is None or value == "":
+                if not nullable:
+                    raise ValueError(f"missing {name}")
+                values.append(default)
+            elif type(value) is python_type and python_type in _TRUSTED_TYPES:
+                # Valeur JSON déjà du bon type (cas courant) : pas de conversion
+                values.append(value)
+            else:
+                try:
+                    values.append(parse(value))
+                except (TypeError, ValueError, OverflowError, OSError) as e:
+                    raise ValueError(f"{name}: {e}") from e
+        return tuple(values)
+
+
+class IngestSensorBatchAsyncUseCase:
+    """
+    Insertion d'un lot de mesures d'un type de capteur.
+
+    Les lignes sont validées au fil de la lecture du corps de la requête et envoyées par paquets avec COPY,
+    dans une seule transaction. Les lignes invalides sont ignorées et rapportées avec leur numéro de ligne.
+    """
+
+    def __init__(self, sensor_repository: AsyncSensorRepository):
+        self.sensor_repository = sensor_repository
+
+    async def execute(
+        self,
+        rows: AsyncIterable[list[tuple[int, dict[str, Any] | ValueError]]]
+    ) -> BatchIngestionReport:
+        """
+        rows : lignes décodées par paquet, (numéro de ligne, ligne ou erreur de décodage)
+        """
+        report = BatchIngestionReport()
+        parser = RecordParser(self.sensor_repository.record_columns())
+        try:
+            report.inserted = await self.sensor_repository.copy_records(
+                parser.names, self._valid_records(rows, parser, report)
+            )
+            return report
+
+        except Exception as e:
+            logger.error(f"Error IngestSensorBatch: {e}")
+            raise
+
+    @staticmethod
+    async def _valid_records(
+        rows: AsyncIterable[list[tuple[int, dict[str, Any] | ValueError]]],
+        parser: RecordParser,
+        report: BatchIngestionReport
+    ) -> AsyncIterator[list[tuple]]:
+        records = []
+        async for batch in rows:
+            for line, row in batch:
+                if not isinstance(row, ValueError):
+                    try:
+                        records.append(parser(row))
+                        continue
+                    except ValueError as e:
+                        row = e
+                report.rejected += 1
+                if len(report.errors) < MAX_REPORTED_ERRORS:
+                    report.errors.append(RowError(line, str(row)))
+            if len(records) >= _COPY_CHUNK_SIZE:
+                yield records
+                records = []
+        yield records
@@ -1,9 +1,16 @@
+from app.src.common.cache import ResultCache
 from app.src.domain.interface_repositories.tag_repository import TagRepository
 
 
 class DeleteTagUseCase:
-    def __init__(self, tag_repository: TagRepository):
+    def __init__(self, tag_repository: TagRepository, cache: ResultCache | None = None):
         self.tag_repository = tag_repository
+        self.cache = cache
 
     def execute(self, tag_id: int) -> bool:
-        return self.tag_repository.delete_tag(tag_id)
+        result = self.tag_repository.delete_tag(tag_id)
+
+        if self.cache:
+            self.cache.clear()
+
+        return result
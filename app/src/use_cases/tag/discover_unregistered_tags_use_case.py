@@ -0,0 +1,44 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.src.domain.interface_repositories.sensor_repository import SensorRepository
+from app.src.domain.interface_repositories.tag_repository import TagRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UnregisteredSource:
+    source_address: str
+    sensor_kinds: list[str] = field(default_factory=list)
+    last_seen_at: datetime | None = None
+
+
+class DiscoverUnregisteredTagsUseCase:
+    """
+    Adresses sources présentes dans la base enregistrée mais sans balise (tag) : candidates pour create_tag.
+    """
+
+    def __init__(self, tag_repository: TagRepository, sensor_repositories: dict[str, SensorRepository]):
+        self.tag_repository = tag_repository
+        self.sensor_repositories = sensor_repositories
+
+    def execute(self) -> list[UnregisteredSource]:
+        try:
+            registered = self.tag_repository.select_all_source_addresses()
+
+            discovered: dict[str, UnregisteredSource] = {}
+            for kind, sensor_repository in self.sensor_repositories.items():
+                sources = [source for source in sensor_repository.distinct_source_addresses() if source not in registered]
+                for source, last_seen_at in sensor_repository.last_seen(sources).items():
+                    entry = discovered.setdefault(source, UnregisteredSource(source))
+                    entry.sensor_kinds.append(kind)
+                    if entry.last_seen_at is None or last_seen_at > entry.last_seen_at:
+                        entry.last_seen_at = last_seen_at
+
+            return sorted(discovered.values(), key=lambda entry: entry.source_address)
+
+        except Exception as e:
+            logger.error(f"Error DiscoverUnregisteredTags: {e}")
+            raise
@@ -1,9 +1,9 @@
 import logging
-import math
 from dataclasses import dataclass
 
+from app.src.common.cache import ResultCache
+from app.src.common.pagination import CursorCodec, chunk_count, count_total
 from app.src.domain.entities.tag import Tag
-from app.src.common.utils import decode, encode
 from app.src.domain.interface_repositories.tag_repository import TagRepository
 
 logger = logging.getLogger(__name__)
@@ -11,44 +11,33 @@ logger = logging.getLogger(__name__)
 @dataclass
 class PaginatedTag:
     tags: list[Tag]
-    total: int| None
-    chunk_size: int| None
+    total: int | None
+    chunk_size: int | None
     chunk_count: int | None
     current_cursor: str | None
     first_cursor: str | None
     last_cursor: str | None
     next_cursor: str | None
+    prev_cursor: str | None
 
 
 class GetTagListUseCase:
-    def __init__(self, tag_repository: TagRepository):
+    def __init__(self, tag_repository: TagRepository, cursor_codec: CursorCodec, total_cache: ResultCache | None = None):
         self.tag_repository = tag_repository
+        self.cursor_codec = cursor_codec
+        self.total_cache = total_cache
 
-    def execute(self, cursor: str | None, limit: int | None = None, with_rooms: bool = False) -> PaginatedTag:
-        decoded_cursor = None
-        if cursor:
-            decoded_cursor = decode(cursor, "Tag pagination cursor")
-            decoded_cursor = decoded_cursor.get("id") if decoded_cursor else None
-
-        tags, total, first_tag, last_tag = self.tag_repository.paginate_tags(decoded_cursor, (limit + 1), with_rooms=with_rooms)
-
-        next_tag = None
-        if len(tags) == (limit + 1):
-            next_tag = tags.pop(-1)
-
-        chunk_count = math.ceil(total / limit) if limit else 1
-
-        first_cursor = {"id": first_tag.id} if first_tag else None
-        last_cursor = {"id": last_tag.id} if last_tag else None
-        next_cursor = {"id": next_tag.id} if next_tag else None
+    def execute(
+        self, cursor: str | None, limit: int | None = None, with_rooms: bool = False, with_total: bool = True
+    ) -> PaginatedTag:
+        decoded_cursor = self.cursor_codec.decode(cursor, "Tag pagination cursor")
+        page = self.tag_repository.paginate_tags(decoded_cursor, limit, with_rooms=with_rooms)
+        total = count_total(self.total_cache, "tag", self.tag_repository.count_all_tags) if with_total else None
 
         return PaginatedTag(
-            tags=tags,
+            tags=page.items,
             total=total,
-            chunk_size=len(tags),
-            chunk_count=chunk_count,
-            current_cursor=encode({"id": decoded_cursor}) if decoded_cursor else encode(first_cursor) if first_cursor else None,
-            first_cursor=encode(first_cursor) if first_cursor else None,
-            last_cursor=encode(last_cursor) if last_cursor else None,
-            next_cursor=encode(next_cursor) if next_cursor else None,
+            chunk_size=len(page.items),
+            chunk_count=chunk_count(total, limit),
+            **self.cursor_codec.page_cursors(page, cursor),
         )
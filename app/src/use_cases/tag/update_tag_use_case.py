@@ -1,10 +1,17 @@
+from app.src.common.cache import ResultCache
 from app.src.domain.entities.tag import Tag
 from app.src.domain.interface_repositories.tag_repository import TagRepository
 
 
 class UpdateTagUseCase:
-    def __init__(self, tag_repository: TagRepository):
+    def __init__(self, tag_repository: TagRepository, cache: ResultCache | None = None):
         self.tag_repository = tag_repository
+        self.cache = cache
 
     def execute(self, tag_id: int, tag_data: dict) -> Tag:
-        return self.tag_repository.update_tag(tag_id, tag_data)
+        result = self.tag_repository.update_tag(tag_id, tag_data)
+
+        if self.cache:
+            self.cache.clear()
+
+        return result
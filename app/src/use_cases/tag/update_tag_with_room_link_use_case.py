@@ -1,14 +1,21 @@
 from datetime import datetime
 
+from app.src.common.cache import ResultCache
 from app.src.domain.entities.tag import Tag
 from app.src.domain.interface_repositories.tag_repository import TagRepository
 from app.src.domain.interface_repositories.room_tag_repository import RoomTagRepository
 
 
 class UpdateTagWithRoomLinkUseCase:
-    def __init__(self, tag_repository: TagRepository, room_tag_repository: RoomTagRepository):
+    def __init__(
+        self,
+        tag_repository: TagRepository,
+        room_tag_repository: RoomTagRepository,
+        cache: ResultCache | None = None
+    ):
         self.tag_repository = tag_repository
         self.room_tag_repository = room_tag_repository
+        self.cache = cache
 
     def execute(
         self,
@@ -26,4 +33,7 @@ class UpdateTagWithRoomLinkUseCase:
                 start_at = datetime.now()
             self.room_tag_repository.update_roomtag_by_tag_id_room_id(tag_id, room_id, start_at, end_at)
 
+        if self.cache:
+            self.cache.clear()
+
         return self.tag_repository.select_tag_by_id(tag_id, with_rooms=True)
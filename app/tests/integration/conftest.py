@@ -92,6 +92,12 @@ def get_test_session():
         yield session
 
 
+@pytest.fixture
+def db_session():
+    with Session(test_engine) as session:
+        yield session
+
+
 @pytest.fixture(autouse=True)
 def clean_db():
     with Session(test_engine) as session:
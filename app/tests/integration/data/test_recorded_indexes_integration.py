@@ -0,0 +1,25 @@
+from sqlalchemy import text
+from sqlmodel import SQLModel
+
+from app.src.infrastructure.db.models.sensor_model import SensorHumidityModel, SensorTemperatureModel
+from app.src.infrastructure.db.recorded_indexes import create_source_time_indexes, source_time_index_name
+
+
+def test_create_source_time_indexes_is_idempotent(db_session):
+    tables = [SensorTemperatureModel.__table__, SensorHumidityModel.__table__]
+    SQLModel.metadata.create_all(db_session.get_bind(), tables=tables)
+    db_session.commit()
+
+    with db_session.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        created = create_source_time_indexes(connection)
+        created_again = create_source_time_indexes(connection)
+        definitions = connection.execute(
+            text("SELECT indexname, indexdef FROM pg_indexes WHERE indexname = ANY(:names)"),
+            {"names": created}
+        ).all()
+
+    # Seules les tables existantes sont indexées
+    assert sorted(created) == sorted(source_time_index_name(table.name) for table in tables)
+    assert created_again == []
+    assert len(definitions) == len(tables)
+    assert all('(source_address, "time" DESC)' in definition for _, definition in definitions)
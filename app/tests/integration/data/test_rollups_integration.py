@@ -0,0 +1,76 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlmodel import SQLModel
+
+from app.src.common.interval_index import TagWindow
+from app.src.infrastructure.db.models.sensor_model import SensorHumidityModel, SensorPressureModel, SensorTemperatureModel
+from app.src.infrastructure.db.rollups import create_rollups, iter_rollup, refresh_rollups
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def temperatures(db_session):
+    """Mesures toutes les 10 minutes sur 3 h, rollups rafraîchis après la première heure"""
+    # refresh_rollups agrège toutes les tables sources
+    SQLModel.metadata.create_all(
+        db_session.get_bind(),
+        tables=[model.__table__ for model in (SensorTemperatureModel, SensorHumidityModel, SensorPressureModel)]
+    )
+    create_rollups(db_session)
+
+    def add(indexes):
+        for i in indexes:
+            db_session.add(SensorTemperatureModel(
+                time=START + timedelta(minutes=10 * i), source_address="addr_1", temperature=20 + i
+            ))
+        db_session.commit()
+
+    add(range(6))
+    refresh_rollups(db_session, now=START + timedelta(hours=1))
+    add(range(6, 18))
+    return db_session
+
+
+@pytest.mark.parametrize("with_sketches", [False, True])
+def test_iter_rollup_adds_raw_rows_after_watermark(temperatures, with_sketches):
+    rows = list(iter_rollup(
+        temperatures, SensorTemperatureModel.__tablename__, "1h", [TagWindow("addr_1", None, None)],
+        with_sketches=with_sketches
+    ))
+
+    assert [row[0] for row in rows] == [START + timedelta(hours=hour) for hour in range(3)]
+    assert [(row[2], row[3], row[4], row[5]) for row in rows] == [
+        (20.0, 25.0, 22.5, 6), (26.0, 31.0, 28.5, 6), (32.0, 37.0, 34.5, 6)
+    ]
+    if with_sketches:
+        assert all(sum(row[7]) == 6 for row in rows)
+
+
+def test_iter_rollup_raw_rows_after_first_value_date(temperatures):
+    rows = list(iter_rollup(
+        temperatures, SensorTemperatureModel.__tablename__, "5m", [TagWindow("addr_1", None, None)],
+        since=START + timedelta(minutes=50)
+    ))
+
+    assert len(rows) == 13
+    assert rows[0][0] == START + timedelta(minutes=50)
+
+
+def test_iter_rollup_anchors_last_bucket_of_each_window(temperatures):
+    moved = START + timedelta(minutes=30)
+    windows = [TagWindow("addr_1", None, moved), TagWindow("addr_1", moved, None)]
+
+    rows = list(iter_rollup(
+        temperatures, SensorTemperatureModel.__tablename__, "5m", windows,
+        since=START + timedelta(hours=2), anchors=windows
+    ))
+
+    # Dernier intervalle de la période close (rollup), de la période ouverte avant since (mesures brutes), puis la suite
+    buckets = [row[0] for row in rows]
+    assert START + timedelta(minutes=20) in buckets
+    assert START + timedelta(minutes=110) in buckets
+    assert [bucket for bucket in buckets if bucket >= START + timedelta(hours=2)] == [
+        START + timedelta(minutes=minutes) for minutes in range(120, 180, 10)
+    ]
@@ -30,7 +30,7 @@ def tags_created(client, fakes_tag, auth_headers):
     "query_param, expected_status",
     [
         ({"limit": 0}, 422),
-        ({"cursor": "invalid_cursor"}, 500)
+        ({"cursor": "invalid_cursor"}, 400)
     ],
 )
 def test_get_tag_list_invalid_params(client, tags_created, query_param, expected_status, auth_headers):
@@ -0,0 +1,54 @@
+from app.src.common.cache import ResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_and_miss_counters():
+    cache = ResultCache(ttl_seconds=60, max_entries=10)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "max_entries": 10, "ttl_seconds": 60}
+
+
+def test_cache_entry_expires_after_ttl():
+    clock = FakeClock()
+    cache = ResultCache(ttl_seconds=30, max_entries=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 29
+    assert cache.get("a") == 1
+    clock.now = 30
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResultCache(ttl_seconds=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_disabled_and_clear():
+    disabled = ResultCache(ttl_seconds=0, max_entries=10)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
+
+    cache = ResultCache(ttl_seconds=60, max_entries=10)
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
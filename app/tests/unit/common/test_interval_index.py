@@ -0,0 +1,47 @@
+from datetime import UTC, datetime
+
+from app.src.common.interval_index import IntervalIndex, TagWindow, merge_tag_windows, tag_window_index
+
+
+def _at(day: int) -> datetime:
+    return datetime(2025, 1, day, tzinfo=UTC)
+
+
+def test_values_at_half_open_and_unbounded():
+    index = IntervalIndex([
+        ("a", _at(1), _at(5), "room1"),
+        ("a", _at(5), None, "room2"),
+        ("a", _at(3), _at(7), "room3"),
+        ("b", None, None, "room1"),
+    ])
+
+    assert index.values_at("a", _at(1)) == ("room1",)
+    assert index.values_at("a", _at(4)) == ("room1", "room3")
+    assert index.values_at("a", _at(5)) == ("room2", "room3")
+    assert index.values_at("a", _at(9)) == ("room2",)
+    assert index.values_at("a", datetime(2024, 12, 31, tzinfo=UTC)) == ()
+    assert index.values_at("b", _at(20)) == ("room1",)
+    assert index.values_at("c", _at(1)) == ()
+
+
+def test_merge_tag_windows_unions_periods_per_source():
+    windows = [
+        TagWindow("a", _at(1), _at(3)),
+        TagWindow("a", _at(3), _at(4)),
+        TagWindow("a", _at(6), None),
+        TagWindow("b", None, _at(2)),
+    ]
+
+    assert merge_tag_windows(windows) == [
+        TagWindow("a", _at(1), _at(4)),
+        TagWindow("a", _at(6), None),
+        TagWindow("b", None, _at(2)),
+    ]
+
+
+def test_tag_window_index_keys_by_room_and_window():
+    moved = TagWindow("a", _at(1), _at(5))
+    index = tag_window_index({1: [moved, moved], 2: [TagWindow("a", _at(5))]})
+
+    assert index.values_at("a", _at(2)) == ((1, moved),)
+    assert index.values_at("a", _at(5)) == ((2, TagWindow("a", _at(5))),)
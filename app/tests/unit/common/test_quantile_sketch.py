@@ -0,0 +1,73 @@
+import random
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from app.src.common.interval_index import TagWindow
+from app.src.common.quantile_sketch import RELATIVE_ACCURACY, QuantileSketch, RoomQuantiles, bin_value, sketch_bin
+
+
+def test_quantiles_within_relative_accuracy():
+    random.seed(3)
+    values = [random.uniform(-10, 35) for _ in range(5000)]
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.05, 0.5, 0.95):
+        exact = float(np.quantile(values, q, method="lower"))
+        assert abs(sketch.quantile(q) - exact) <= RELATIVE_ACCURACY * abs(exact) + 1e-9
+
+
+def test_merged_sketches_equal_single_sketch():
+    values = [float(v) for v in range(-50, 950)]
+    whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for value in values:
+        whole.add(value)
+        (left if value < 300 else right).add(value)
+
+    merged = QuantileSketch.combine([left, right])
+
+    assert merged.bins == whole.bins
+    assert merged.quantiles() == whole.quantiles()
+
+
+def test_bins_keep_value_order_and_zero():
+    values = [-1000.0, -2.5, -1e-9, 0.0, 1e-9, 0.2, 3.0, 1013.0]
+    bins = [sketch_bin(value) for value in values]
+
+    assert bins == sorted(bins)
+    assert sketch_bin(0.0) == sketch_bin(-1e-9) == 0
+    assert bin_value(0) == 0.0
+    assert abs(bin_value(sketch_bin(-2.5)) + 2.5) <= 2.5 * RELATIVE_ACCURACY
+
+
+def test_empty_sketch_has_no_quantile():
+    assert QuantileSketch().quantiles() == {"p5": None, "p50": None, "p95": None}
+
+
+def test_room_quantiles_per_bucket_and_window():
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    moved = start + timedelta(hours=1)
+    room_windows = {
+        1: [TagWindow("a", None, moved)],
+        2: [TagWindow("a", moved, None), TagWindow("b")],
+    }
+    room_quantiles = RoomQuantiles(room_windows, 30)
+    for minute in range(0, 120, 10):
+        room_quantiles.add("a", start + timedelta(minutes=minute), 20.0)
+        room_quantiles.add("b", start + timedelta(minutes=minute), 10.0)
+
+    results = dict(room_quantiles.results())
+
+    assert [point[0] for point in results[1]["quantile_data"]] == [
+        int((start + timedelta(minutes=m)).timestamp() * 1000) for m in (0, 30)
+    ]
+    assert results[1]["quantiles"]["p50"] == round(bin_value(sketch_bin(20.0)), 2)
+    assert len(results[2]["quantile_data"]) == 4
+    assert results[2]["quantiles"]["p5"] == round(bin_value(sketch_bin(10.0)), 2)
+
+    after = dict(room_quantiles.results(after_us=int((start + timedelta(minutes=70)).timestamp() * 1_000_000)))
+    assert [point[0] for point in after[2]["quantile_data"]] == [
+        int((start + timedelta(minutes=m)).timestamp() * 1000) for m in (60, 90)
+    ]
@@ -0,0 +1,226 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from app.src.common.interval_index import TagWindow
+from app.src.common.time_series import (
+    RunningStats,
+    StreamingSmoother,
+    build_time_grid,
+    continue_time_grid,
+    downsample_points,
+    interpolate_on_grid,
+    lttb_indices,
+    round_half_cent,
+    smooth_and_aggregate,
+    to_data_points,
+    to_epoch_us,
+)
+
+T0 = datetime(2025, 1, 1, 10, 0, tzinfo=UTC)
+
+
+def _us(minutes: float) -> int:
+    return to_epoch_us(T0 + timedelta(minutes=minutes))
+
+
+def test_build_time_grid_aligned_on_interval():
+    grid = build_time_grid(T0 + timedelta(minutes=7), T0 + timedelta(minutes=95), 30)
+    assert grid.tolist() == [_us(30), _us(60), _us(90)]
+
+
+def test_build_time_grid_empty_when_range_too_short():
+    grid = build_time_grid(T0 + timedelta(minutes=7), T0 + timedelta(minutes=20), 30)
+    assert grid.size == 0
+
+
+def test_continue_time_grid_after_last_point():
+    grid = continue_time_grid(_us(30), _us(95), 30)
+    assert grid.tolist() == [_us(60), _us(90)]
+    assert continue_time_grid(_us(90), _us(95), 30).size == 0
+
+
+def test_interpolate_on_grid_exact_between_and_edges():
+    times = np.array([_us(10), _us(20), _us(40)], dtype=np.int64)
+    values = np.array([10.0, 20.0, 30.0])
+    grid = np.array([_us(0), _us(10), _us(15), _us(30), _us(50)], dtype=np.int64)
+
+    result = interpolate_on_grid(times, values, grid)
+
+    assert result.tolist() == [10.0, 10.0, 15.0, 25.0, 30.0]
+
+
+def test_interpolate_on_grid_empty_source_is_nan():
+    grid = np.array([_us(0), _us(10)], dtype=np.int64)
+    result = interpolate_on_grid(np.empty(0, dtype=np.int64), np.empty(0), grid)
+    assert np.isnan(result).all()
+
+
+def test_round_half_cent_matches_python_round():
+    values = np.array([2.675, 0.125, 17.425, 1.005, 3.14159])
+    assert round_half_cent(values).tolist() == [round(v, 2) for v in values.tolist()]
+
+
+def test_smooth_and_aggregate_averages_sources():
+    series = {
+        "a": (np.array([_us(0), _us(60)], dtype=np.int64), np.array([10.0, 20.0])),
+        "b": (np.array([_us(0), _us(60)], dtype=np.int64), np.array([20.0, 30.0])),
+    }
+
+    grid, values = smooth_and_aggregate(series, 30, UTC)
+
+    assert to_data_points(grid, values) == [
+        [int(T0.timestamp() * 1000), 15.0],
+        [int((T0 + timedelta(minutes=30)).timestamp() * 1000), 20.0],
+        [int((T0 + timedelta(minutes=60)).timestamp() * 1000), 25.0],
+    ]
+
+
+def test_smooth_and_aggregate_no_data():
+    grid, values = smooth_and_aggregate({}, 30)
+    assert grid.size == 0
+    assert values.size == 0
+
+
+def test_smooth_and_aggregate_after_matches_full_tail():
+    series = {
+        "a": (np.array([_us(0), _us(50), _us(130)], dtype=np.int64), np.array([10.0, 20.0, 15.0])),
+        "b": (np.array([_us(10), _us(70)], dtype=np.int64), np.array([20.0, 30.0])),
+    }
+    full_grid, full_values = smooth_and_aggregate(series, 30, UTC)
+
+    # Dernière mesure de chaque balise avant 60 min + mesures suivantes
+    tail = {
+        "a": (np.array([_us(50), _us(130)], dtype=np.int64), np.array([20.0, 15.0])),
+        "b": (np.array([_us(10), _us(70)], dtype=np.int64), np.array([20.0, 30.0])),
+    }
+    grid, values = smooth_and_aggregate(tail, 30, after_us=_us(60))
+
+    assert grid.tolist() == full_grid[full_grid > _us(60)].tolist()
+    assert values.tolist() == full_values[full_grid > _us(60)].tolist()
+
+
+def test_lttb_keeps_bounds_and_peaks():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.sin(x / 50)
+    y[437] = 25.0
+
+    indices = lttb_indices(x, y, 50)
+
+    assert indices.size == 50
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert 437 in indices.tolist()
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_downsample_points_only_when_needed():
+    points = [[i * 60_000, float(i % 7)] for i in range(10)]
+
+    assert downsample_points(points, 20) is points
+    reduced = downsample_points(points, 4)
+    assert len(reduced) == 4
+    assert reduced[0] == points[0]
+    assert reduced[-1] == points[-1]
+
+
+def test_running_stats_single_pass_and_combine():
+    values = np.random.default_rng(1).normal(20, 3, 1000)
+    first, second = RunningStats(), RunningStats()
+    for value in values[:300].tolist():
+        first.add(value)
+    for value in values[300:].tolist():
+        second.add(value)
+
+    stats = RunningStats.combine([first, RunningStats(), second])
+
+    assert stats.count == 1000
+    assert (stats.min, stats.max) == (values.min(), values.max())
+    assert np.isclose(stats.mean, values.mean())
+    assert np.isclose(stats.variance, values.var())
+
+
+def _readings(rng, sources: list[str], count: int) -> list[tuple[datetime, str, float]]:
+    offsets = np.sort(rng.integers(0, 3 * 24 * 3600, count))
+    return [
+        (T0 + timedelta(seconds=int(offset)), sources[rng.integers(len(sources))], round(float(rng.normal(20, 2)), 1))
+        for offset in offsets
+    ]
+
+
+def _series(readings, sources):
+    return {
+        source: (
+            np.array([to_epoch_us(time) for time, src, _ in readings if src == source], dtype=np.int64),
+            np.array([value for _, src, value in readings if src == source]),
+        )
+        for source in sources
+    }
+
+
+def test_streaming_smoother_matches_smooth_and_aggregate():
+    readings = _readings(np.random.default_rng(2), ["a", "b", "c"], 2000)
+    room_sources = {1: ["a", "b"], 2: ["c"], 3: ["b", "c", "a"], 4: ["d"]}
+    room_windows = {room_id: [TagWindow(source) for source in sources] for room_id, sources in room_sources.items()}
+
+    for interval in (1, 7, 30, 90):
+        smoother = StreamingSmoother(room_windows, interval)
+        for time, source, value in readings:
+            smoother.add(source, time, value)
+        results = {room_id: (stats, grid, values) for room_id, stats, grid, values in smoother.results()}
+
+        assert set(results) == {1, 2, 3}
+        for room_id, (stats, grid, values) in results.items():
+            series = _series(readings, room_sources[room_id])
+            expected_grid, expected_values = smooth_and_aggregate(series, interval, UTC)
+            assert grid.tolist() == expected_grid.tolist()
+            assert values.tolist() == expected_values.tolist()
+            assert stats.count == sum(times.size for times, _ in series.values())
+
+
+def test_streaming_smoother_after_matches_full_tail():
+    readings = _readings(np.random.default_rng(3), ["a", "b"], 500)
+    full_grid, full_values = smooth_and_aggregate(_series(readings, ["a", "b"]), 30, UTC)
+    after_us = int(full_grid[40])
+
+    # Dernière mesure de chaque balise à after_us ou avant, puis mesures suivantes
+    anchors = {}
+    for reading in readings:
+        if to_epoch_us(reading[0]) <= after_us:
+            anchors[reading[1]] = reading
+    tail = sorted(anchors.values()) + [reading for reading in readings if to_epoch_us(reading[0]) > after_us]
+
+    smoother = StreamingSmoother({1: [TagWindow("a"), TagWindow("b")]}, 30, after_us=after_us)
+    for time, source, value in tail:
+        smoother.add(source, time, value)
+    [(_, _, grid, values)] = smoother.results()
+
+    assert grid.tolist() == full_grid[41:].tolist()
+    assert values.tolist() == full_values[41:].tolist()
+
+
+def test_streaming_smoother_attributes_readings_to_tag_windows():
+    readings = _readings(np.random.default_rng(4), ["a", "b"], 1000)
+    moved_at = readings[500][0]
+    room_windows = {
+        1: [TagWindow("a", end_at=moved_at), TagWindow("b")],
+        2: [TagWindow("a", start_at=moved_at)],
+    }
+
+    smoother = StreamingSmoother(room_windows, 30)
+    for time, source, value in readings:
+        smoother.add(source, time, value)
+    results = {room_id: (stats, grid, values) for room_id, stats, grid, values in smoother.results()}
+
+    before = [reading for reading in readings if reading[0] < moved_at]
+    after = [reading for reading in readings if reading[0] >= moved_at]
+    expected = {
+        1: {**_series(before, ["a"]), "b": _series(readings, ["b"])["b"]},
+        2: _series(after, ["a"]),
+    }
+    for room_id, series in expected.items():
+        stats, grid, values = results[room_id]
+        expected_grid, expected_values = smooth_and_aggregate(series, 30, UTC)
+        assert grid.tolist() == expected_grid.tolist()
+        assert values.tolist() == expected_values.tolist()
+        assert stats.count == sum(times.size for times, _ in series.values())
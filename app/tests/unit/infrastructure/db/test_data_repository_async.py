@@ -0,0 +1,43 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+from app.src.common.interval_index import TagWindow
+from app.src.infrastructure.db.models.sensor_model import SensorTemperatureModel
+from app.src.infrastructure.db.repositories.data_repository_async import AsyncSQLDataRepository
+from app.src.infrastructure.db.repositories.sensor_data_queries import SensorDataQueries
+from app.src.infrastructure.db.repositories.sensor_repository_async import AsyncSQLSensorRepository
+
+
+async def test_smoothing_runs_in_executor(monkeypatch):
+    start = datetime(2025, 3, 1, tzinfo=UTC)
+    chunks = [
+        [(start + timedelta(minutes=i), "a", 20.0 + i) for i in range(0, 60, 10)],
+        [(start + timedelta(minutes=i), "a", 20.0 + i) for i in range(60, 120, 10)],
+    ]
+
+    async def iter_value_chunks(self, *args, **kwargs):
+        for rows in chunks:
+            yield rows
+
+    threads = []
+    add_values = SensorDataQueries.add_values
+
+    def recording_add_values(self, values_pass, rows):
+        threads.append(threading.current_thread().name)
+        return add_values(self, values_pass, rows)
+
+    monkeypatch.setattr(AsyncSQLSensorRepository, "iter_value_chunks", iter_value_chunks)
+    monkeypatch.setattr(SensorDataQueries, "add_values", recording_add_values)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-fetch") as executor:
+        repository = AsyncSQLDataRepository(Mock(), Mock(bind=None), executor=executor)
+        result = await repository._get_sensor_type_data(
+            SensorTemperatureModel, "temperature", {1: [TagWindow("a")]}, None, 30
+        )
+
+    assert len(threads) == len(chunks)
+    assert all(name.startswith("data-fetch") for name in threads)
+    assert result[1]["nombre_values"] == 12
+    assert result[1]["min"] == 20.0 and result[1]["max"] == 130.0
@@ -0,0 +1,69 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+from app.src.common.exception import DecodedFailedError
+from app.src.common.pagination import KeysetCursor
+from app.src.infrastructure.db.models.tag_model import TagModel
+from app.src.infrastructure.db.models.user_group_model import UserGroupModel
+from app.src.infrastructure.db.pagination import paginate_keyset
+
+
+def _session(rows):
+    session = Mock()
+    session.exec.return_value.all.return_value = rows
+    return session
+
+
+def _sql(session) -> str:
+    statement = session.exec.call_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_first_chunk_reads_one_extra_row():
+    session = _session([TagModel(id=i) for i in range(1, 5)])
+
+    page = paginate_keyset(session, select(TagModel), [TagModel.id], None, 3)
+
+    sql = _sql(session)
+    assert "WHERE" not in sql
+    assert sql.endswith("ORDER BY tag.id ASC \n LIMIT 4")
+    assert [tag.id for tag in page.items] == [1, 2, 3]
+    assert (page.has_next, page.has_prev) == (True, False)
+    assert (page.first_key, page.last_key) == ({"id": 1}, {"id": 3})
+
+
+def test_backward_chunk_is_returned_in_ascending_order():
+    # Lecture vers l'arrière depuis id=10 : la base renvoie 9, 8, 7, 6
+    session = _session([TagModel(id=i) for i in (9, 8, 7, 6)])
+
+    page = paginate_keyset(session, select(TagModel), [TagModel.id], KeysetCursor("prev", {"id": "10"}), 3)
+
+    sql = _sql(session)
+    assert "WHERE tag.id < 10" in sql
+    assert "ORDER BY tag.id DESC" in sql
+    assert [tag.id for tag in page.items] == [7, 8, 9]
+    assert (page.has_next, page.has_prev) == (True, True)
+
+
+def test_composite_key_uses_row_comparison():
+    session = _session([UserGroupModel(user_id=2, group_id=5)])
+
+    page = paginate_keyset(
+        session,
+        select(UserGroupModel),
+        [UserGroupModel.user_id, UserGroupModel.group_id],
+        KeysetCursor("next", {"user_id": "2", "group_id": "4"}),
+        3,
+    )
+
+    assert "(user_group.user_id, user_group.group_id) > (2, 4)" in _sql(session)
+    assert (page.has_next, page.has_prev) == (False, True)
+
+
+@pytest.mark.parametrize("key", [{"user_id": "2"}, {"id": "abc"}])
+def test_cursor_keys_must_match(key):
+    with pytest.raises(DecodedFailedError):
+        paginate_keyset(_session([]), select(TagModel), [TagModel.id], KeysetCursor("next", key), 3)
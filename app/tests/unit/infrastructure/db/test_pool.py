@@ -0,0 +1,107 @@
+import multiprocessing
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.src.infrastructure.db import pool, session
+from app.src.infrastructure.db.pool import PoolSettings, pool_settings, warm_up
+
+
+@pytest.mark.parametrize(
+    "budget, workers, expected",
+    [
+        (80, 4, (3, 2)),
+        (80, 9, (1, 1)),
+        (100, 1, (13, 12)),
+        (36, 9, (1, 0)),
+    ],
+)
+def test_pool_settings_split_budget(budget, workers, expected):
+    settings = pool_settings(budget, workers)
+
+    assert (settings.pool_size, settings.max_overflow) == expected
+    assert workers * pool.ENGINES_PER_WORKER * settings.max_connections <= budget
+
+
+@pytest.mark.parametrize("workers", [1, 4, 9])
+def test_pool_settings_fan_out_lower_bound(workers, monkeypatch):
+    monkeypatch.setattr(pool, "logger", Mock())
+    budget = workers * pool.ENGINES_PER_WORKER * pool.REQUEST_FAN_OUT
+
+    assert pool_settings(budget, workers, min_connections=pool.REQUEST_FAN_OUT).max_connections == pool.REQUEST_FAN_OUT
+    pool.logger.warning.assert_not_called()
+
+    assert pool_settings(budget - 1, workers, min_connections=pool.REQUEST_FAN_OUT).max_connections < pool.REQUEST_FAN_OUT
+    assert "DB_CONNECTION_BUDGET" in pool.logger.warning.call_args.args[0]
+
+
+def test_pool_settings_budget_too_small(monkeypatch):
+    monkeypatch.setattr(pool, "logger", Mock())
+
+    assert pool_settings(10, 9) == PoolSettings(pool_size=1, max_overflow=0)
+    assert "au moins 36" in pool.logger.warning.call_args.args[0]
+
+
+@pytest.mark.parametrize(
+    "cpu_count, web_concurrency, expected",
+    [
+        (1, None, 3),
+        (4, None, 5),
+        (16, None, 5),
+        (16, 9, 9),
+    ],
+)
+def test_worker_count_fits_budget(monkeypatch, cpu_count, web_concurrency, expected):
+    monkeypatch.setattr(pool.settings, "ENVIRONMENT", "production")
+    monkeypatch.setattr(pool.settings, "WEB_CONCURRENCY", web_concurrency)
+    monkeypatch.setattr(pool.settings, "DB_CONNECTION_BUDGET", 80)
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: cpu_count)
+
+    assert pool.worker_count() == expected
+
+
+def test_pool_settings_without_overflow():
+    assert pool_settings(80, 2, overflow_ratio=0).max_overflow == 0
+
+
+@pytest.mark.parametrize(
+    "driver, connect_args",
+    [
+        ("psycopg2", {"options": "-c statement_timeout=5000"}),
+        ("asyncpg", {"server_settings": {"statement_timeout": "5000"}}),
+    ],
+)
+def test_engine_options_statement_timeout(monkeypatch, driver, connect_args):
+    monkeypatch.setattr(pool.settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+
+    assert pool.engine_options(driver)["connect_args"] == connect_args
+
+
+def test_engine_options_no_echo_in_production(monkeypatch):
+    monkeypatch.setattr(pool.settings, "DB_ECHO", True)
+    monkeypatch.setattr(pool.settings, "ENVIRONMENT", "production")
+    monkeypatch.setattr(pool.settings, "DB_STATEMENT_TIMEOUT_MS", 0)
+
+    options = pool.engine_options("psycopg2")
+
+    assert options["echo"] is False
+    assert "connect_args" not in options
+
+
+def test_warm_up_keeps_connections_in_pool(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'warm_up.db'}", pool_size=3, max_overflow=2)
+
+    # Au-delà de pool_size, les connexions seraient fermées à leur retour
+    assert warm_up(engine, 5) == 3
+    assert (engine.pool.checkedin(), engine.pool.checkedout()) == (3, 0)
+    engine.dispose()
+
+
+def test_reset_engines_after_fork_replaces_pools():
+    engines = [session.engine_main, session.engine_recorded, session.async_engine_main, session.async_engine_recorded]
+    pools = [engine.pool for engine in engines]
+
+    session.reset_engines_after_fork()
+
+    assert all(engine.pool is not old_pool for engine, old_pool in zip(engines, pools, strict=True))
@@ -0,0 +1,62 @@
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+
+from app.src.infrastructure.db.models.building_model import BuildingModel
+from app.src.infrastructure.db.models.room_model import RoomModel
+from app.src.infrastructure.db.models.room_tag_model import RoomTagModel
+from app.src.infrastructure.db.models.tag_model import TagModel
+from app.src.infrastructure.db.repositories.room_repository_sql import SQLRoomRepository
+from app.src.infrastructure.db.repositories.tag_repository_sql import SQLTagRepository
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def session_and_queries():
+    # Tables sans type propre à PostgreSQL : SQLite en mémoire suffit pour compter les requêtes
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    tables = [model.__table__ for model in (BuildingModel, RoomModel, TagModel, RoomTagModel)]
+    SQLModel.metadata.create_all(engine, tables=tables)
+
+    with Session(engine) as session:
+        for building_id in (1, 2):
+            session.add(BuildingModel(id=building_id, name=f"B{building_id}"))
+        for room_id in range(1, 31):
+            session.add(RoomModel(id=room_id, name=f"R{room_id}", floor=1, building_id=room_id % 2 + 1, start_at=START))
+        for tag_id in range(1, 61):
+            session.add(TagModel(id=tag_id, name=f"T{tag_id}", source_address=f"addr_{tag_id}"))
+            for room_id in (tag_id % 30 + 1, (tag_id + 7) % 30 + 1):
+                session.add(RoomTagModel(tag_id=tag_id, room_id=room_id, start_at=START, created_at=START))
+        session.commit()
+
+    queries = []
+    event.listen(engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+    with Session(engine) as session:
+        yield session, queries
+    engine.dispose()
+
+
+@pytest.mark.parametrize("limit", [5, 50])
+def test_tags_with_rooms_constant_query_count(session_and_queries, limit):
+    session, queries = session_and_queries
+
+    page = SQLTagRepository(session).paginate_tags(None, limit, with_rooms=True)
+
+    assert len(page.items) == limit
+    assert all(len(tag.rooms) == 2 and tag.rooms[0]["room"]["building"] for tag in page.items)
+    assert len(queries) == 2
+
+
+@pytest.mark.parametrize("limit", [5, 25])
+def test_rooms_with_tags_constant_query_count(session_and_queries, limit):
+    session, queries = session_and_queries
+
+    page = SQLRoomRepository(session).paginate_rooms_with_tags(None, limit)
+
+    assert len(page.items) == limit
+    assert all(len(room.tags) == 4 and room.tags[0]["tag"] for room in page.items)
+    assert len(queries) == 2
@@ -0,0 +1,18 @@
+from app.src.infrastructure.db.rollups import rollup_name, select_rollup
+
+
+def test_select_rollup_coarsest_dividing_resolution():
+    assert select_rollup(5) == ("5m", 5)
+    assert select_rollup(30) == ("5m", 5)
+    assert select_rollup(60) == ("1h", 60)
+    assert select_rollup(180) == ("1h", 60)
+    assert select_rollup(2880) == ("1d", 1440)
+
+
+def test_select_rollup_none_when_not_aligned():
+    assert select_rollup(7) is None
+    assert select_rollup(1) is None
+
+
+def test_rollup_name():
+    assert rollup_name("sensor_temperature", "1h") == "sensor_temperature_1h"
@@ -0,0 +1,74 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.src.common.exception import DecodedFailedError
+from app.src.common.interval_index import TagWindow
+from app.src.common.pagination import KeysetCursor
+from app.src.infrastructure.db.models.sensor_model import SensorTemperatureModel
+from app.src.infrastructure.db.repositories.sensor_repository_sql import SQLSensorRepository
+
+
+def test_split_page_next_key_counts_rows_of_last_date():
+    repository = SQLSensorRepository(None, SensorTemperatureModel)
+    time = datetime(2025, 3, 1, 12, tzinfo=UTC)
+    rows = [{"time": time + timedelta(seconds=i // 3), "source_address": f"s{i % 3}"} for i in range(6)]
+
+    page, next_key = repository._split_page(list(rows), 4, None)
+
+    assert page == rows[:4]
+    assert next_key == {"time": rows[3]["time"].isoformat(), "skip": 1}
+    assert repository._split_page(list(rows), 6, None)[1] is None
+
+
+def test_split_page_next_key_inside_a_date_larger_than_the_page():
+    repository = SQLSensorRepository(None, SensorTemperatureModel)
+    time = datetime(2025, 3, 1, 12, tzinfo=UTC)
+    rows = [{"time": time, "source_address": f"s{i}"} for i in range(3)]
+    cursor = KeysetCursor("next", {"time": time.isoformat(), "skip": "2"})
+
+    _, next_key = repository._split_page(rows, 2, cursor)
+
+    assert next_key == {"time": time.isoformat(), "skip": 4}
+
+
+def test_page_statement_skips_rows_already_read_at_cursor_date():
+    repository = SQLSensorRepository(None, SensorTemperatureModel)
+    cursor = KeysetCursor("next", {"time": "2025-03-01T12:00:00+00:00", "skip": "2"})
+
+    sql = str(repository._page_statement(cursor, 10).compile(dialect=postgresql.dialect()))
+
+    assert "ctid" not in sql
+    assert "sensor_temperature.time = " in sql and "sensor_temperature.time > " in sql
+    assert "OFFSET" in sql
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        KeysetCursor("next", {"time": "yesterday", "skip": "0"}),
+        KeysetCursor("next", {"time": "2025-03-01T12:00:00+00:00"}),
+        KeysetCursor("next", {"time": "2025-03-01T12:00:00+00:00", "skip": "-1"}),
+        KeysetCursor("prev", {"time": "2025-03-01T12:00:00+00:00", "skip": "0"}),
+        KeysetCursor("next", {"id": "10"}),
+    ],
+)
+def test_invalid_cursor(cursor):
+    repository = SQLSensorRepository(None, SensorTemperatureModel)
+
+    with pytest.raises(DecodedFailedError):
+        repository._page_statement(cursor, 10)
+
+
+def test_measurements_statement_one_branch_per_window():
+    repository = SQLSensorRepository(None, SensorTemperatureModel)
+    moved = datetime(2025, 3, 1, tzinfo=UTC)
+
+    stmt = repository._measurements_statement(
+        limit=10, windows=[TagWindow("a", None, moved), TagWindow("a", moved, None), TagWindow("b", moved, None)]
+    )
+    sql = str(stmt.compile())
+
+    assert sql.count("UNION ALL") == 1
+    assert repository._measurements_statement(windows=[]) is None
@@ -0,0 +1,59 @@
+import gzip
+import zlib
+
+import pytest
+
+from app.src.presentation.api.common.batch import CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE, iter_batch_rows
+
+
+async def _chunks(body: bytes, size: int = 7):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+async def _rows(body: bytes, media_type: str, gzipped: bool = False, size: int = 7) -> list:
+    return [row async for rows in iter_batch_rows(_chunks(body, size), media_type, gzipped) for row in rows]
+
+
+async def test_ndjson_gzip_with_errors():
+    body = b'{"time": "2025-01-01T00:00:00Z"}\n\n[1]\n{bad\n{"time": 1}'
+
+    rows = await _rows(gzip.compress(body), NDJSON_MEDIA_TYPE, gzipped=True)
+
+    assert [line for line, _ in rows] == [1, 3, 4, 5]
+    assert rows[0][1] == {"time": "2025-01-01T00:00:00Z"}
+    assert isinstance(rows[1][1], ValueError) and isinstance(rows[2][1], ValueError)
+    assert rows[3][1] == {"time": 1}
+
+
+async def test_ndjson_lines_never_merge():
+    # Deux lignes invalides qui formeraient un objet valide si elles étaient décodées ensemble
+    body = b'{"time": "2025-01-01T00:00:00Z",\n"temperature": 1}\n{"time": 2}\n'
+
+    rows = await _rows(body, NDJSON_MEDIA_TYPE)
+
+    assert [(line, isinstance(row, ValueError)) for line, row in rows] == [(1, True), (2, True), (3, False)]
+
+
+async def test_ndjson_objects_split_across_lines_are_rejected():
+    # Autant d'objets que de lignes une fois le morceau décodé d'un bloc, mais aucune ligne n'est un objet seul
+    body = b'{"x":1},{"y":2}\n{"a":[{"b":1}\n{"c":2}]}\n'
+
+    rows = await _rows(body, NDJSON_MEDIA_TYPE, size=len(body))
+
+    assert [line for line, _ in rows] == [1, 2, 3]
+    assert all(isinstance(row, ValueError) for _, row in rows)
+
+
+async def test_csv_header_and_field_count():
+    body = b"\xef\xbb\xbftime,temperature\r\n2025-01-01T00:00:00Z,21.5\r\n2025-01-01T00:01:00Z\r\n"
+
+    rows = await _rows(body, CSV_MEDIA_TYPE)
+
+    assert rows[0] == (2, {"time": "2025-01-01T00:00:00Z", "temperature": "21.5"})
+    assert rows[1][0] == 3 and isinstance(rows[1][1], ValueError)
+
+
+async def test_truncated_gzip():
+    with pytest.raises(zlib.error):
+        await _rows(gzip.compress(b'{"time": 1}\n')[:-6], NDJSON_MEDIA_TYPE, gzipped=True)
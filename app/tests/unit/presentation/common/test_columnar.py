@@ -0,0 +1,48 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from app.src.presentation.api.common.columnar import decode_columnar, encode_rooms_sensor_data, encode_rows
+
+
+def test_rooms_sensor_data_round_trip():
+    points = [[1735689600000, 20.5], [1735691400000, 21.25], [1735693200000, 19.0]]
+    rooms = [{"id": 1, "name": "Room 1", "tags": [], "temperature": {"min": 19.0, "max": 22.0, "data": points}}]
+
+    decoded = decode_columnar(encode_rooms_sensor_data(rooms, 1))
+
+    series = decoded["data"][0]["temperature"]["data"]
+    assert decoded["total_rooms"] == 1
+    assert decoded["data"][0]["name"] == "Room 1"
+    assert decoded["data"][0]["temperature"]["min"] == 19.0
+    assert series["timestamps"].tolist() == [point[0] for point in points]
+    assert series["values"].dtype == np.float32
+    assert series["values"].tolist() == [point[1] for point in points]
+    # La série d'origine n'est pas modifiée (résultats partagés avec le cache)
+    assert rooms[0]["temperature"]["data"] is points
+
+
+def test_timestamps_fall_back_to_int64_deltas():
+    points = [[0, 1.0], [2**40, 2.0]]
+    rooms = [{"id": 1, "temperature": {"data": points}}]
+
+    decoded = decode_columnar(encode_rooms_sensor_data(rooms, 1))
+
+    assert decoded["data"][0]["temperature"]["data"]["timestamps"].tolist() == [0, 2**40]
+
+
+def test_rows_round_trip():
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    rows = [
+        {"time": start + timedelta(seconds=i), "sensor_id": i, "source_address": "a", "temperature": 20.5, "event_id": None}
+        for i in range(3)
+    ]
+    rows[1]["temperature"] = None
+
+    decoded = decode_columnar(encode_rows(rows))["columns"]
+
+    assert decoded["time"].tolist() == [int(row["time"].timestamp() * 1000) for row in rows]
+    assert decoded["sensor_id"].tolist() == [0, 1, 2]
+    assert decoded["source_address"] == {"values": ["a", "a", "a"]}
+    assert np.isnan(decoded["temperature"][1])
+    assert decoded["event_id"] == {"values": [None, None, None]}
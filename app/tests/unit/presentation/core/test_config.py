@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from app.src.presentation.core.config import Settings
 
 
@@ -14,3 +17,13 @@ def test_is_debug_property_prod_debug():
 def test_is_debug_property_prod():
     s = Settings(ENVIRONMENT="production", DEBUG=False)
     assert s.is_debug is False
+
+
+def test_data_aggregation_mode_default_python():
+    s = Settings()
+    assert s.DATA_AGGREGATION_MODE == "python"
+
+
+def test_data_aggregation_mode_rejects_unknown():
+    with pytest.raises(ValidationError):
+        Settings(DATA_AGGREGATION_MODE="spark")
@@ -0,0 +1,135 @@
+import json
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.src.presentation.api.common.columnar import decode_columnar
+from app.src.presentation.main import app
+from app.src.presentation.dependencies import get_rooms_latest_values_async_use_case, get_rooms_sensor_data_async_use_case
+from app.src.use_cases.data.get_rooms_latest_values_async_use_case import GetRoomsLatestValuesAsyncUseCase
+from app.src.use_cases.data.get_rooms_sensor_data_async_use_case import GetRoomSensorDataResult, GetRoomsSensorDataAsyncUseCase
+
+
+def _room_data(room_id: int) -> dict:
+    return {
+        "id": room_id,
+        "name": f"Room {room_id}",
+        "description": None,
+        "floor": 1,
+        "building_id": 1,
+        "area": 20.0,
+        "capacity": 10,
+        "start_at": "2025-01-01T00:00:00",
+        "end_at": None,
+        "created_at": "2025-01-01T00:00:00",
+        "updated_at": "2025-01-01T00:00:00",
+        "tags": [],
+        "temperature": {
+            "min": 19.0,
+            "max": 22.0,
+            "average": 20.5,
+            "nombre_values": 2,
+            "data": [[1735689600000, 20.5]]
+        }
+    }
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+@pytest.fixture
+def mock_use_case():
+    mock = Mock(spec=GetRoomsSensorDataAsyncUseCase)
+    mock.execute = AsyncMock(
+        return_value=GetRoomSensorDataResult(rooms_data=[_room_data(1), _room_data(2)], total_rooms=2)
+    )
+    mock.stream.return_value = _aiter([_room_data(1), _room_data(2)])
+    return mock
+
+
+@pytest.fixture
+def override_dependencies(mock_use_case):
+    app.dependency_overrides[get_rooms_sensor_data_async_use_case] = lambda: mock_use_case
+    yield
+    app.dependency_overrides = {}
+
+
+def test_get_rooms_sensor_data_json(authenticated_client, override_dependencies, mock_use_case):
+    client, _ = authenticated_client
+    response = client.get("/api/v1/data/rooms")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.json()["total_rooms"] == 2
+    mock_use_case.stream.assert_not_called()
+
+
+def test_get_rooms_sensor_data_ndjson(authenticated_client, override_dependencies, mock_use_case):
+    client, _ = authenticated_client
+    response = client.get(
+        "/api/v1/data/rooms",
+        params={"smooth_interval_minutes": 60},
+        headers={"Accept": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    mock_use_case.stream.assert_called_once_with(
+        room_ids=None,
+        first_value_date=None,
+        smooth_interval_minutes=60,
+        since=None,
+        max_points=None,
+        quantiles=False,
+        with_stats=True
+    )
+    mock_use_case.execute.assert_not_called()
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [room["id"] for room in lines] == [1, 2]
+    assert lines[0]["temperature"]["data"] == [[1735689600000, 20.5]]
+
+
+def test_get_rooms_sensor_data_ndjson_invalid_params(authenticated_client, override_dependencies, mock_use_case):
+    client, _ = authenticated_client
+    mock_use_case.stream.side_effect = ValueError("bad")
+
+    response = client.get("/api/v1/data/rooms", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 400
+
+
+def test_get_rooms_sensor_data_columnar(authenticated_client, override_dependencies, mock_use_case):
+    client, _ = authenticated_client
+    response = client.get("/api/v1/data/rooms", headers={"Accept": "application/vnd.h2optimize.columnar"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.h2optimize.columnar"
+
+    decoded = decode_columnar(response.content)
+    assert decoded["total_rooms"] == 2
+    assert decoded["data"][1]["temperature"]["data"]["timestamps"].tolist() == [1735689600000]
+
+
+def test_get_rooms_latest_values(authenticated_client):
+    client, _ = authenticated_client
+    latest_use_case = Mock(spec=GetRoomsLatestValuesAsyncUseCase)
+    latest_use_case.execute = AsyncMock(return_value=[{
+        "id": 1,
+        "name": "Room 1",
+        "floor": 1,
+        "building_id": 2,
+        "temperature": {"value": 21.4, "time": "2025-01-01T10:00:00+00:00"},
+    }])
+    app.dependency_overrides[get_rooms_latest_values_async_use_case] = lambda: latest_use_case
+
+    response = client.get("/api/v1/data/rooms/latest", params={"building_id": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_rooms"] == 1
+    assert body["data"][0]["temperature"] == {"value": 21.4, "time": "2025-01-01T10:00:00+00:00"}
+    assert body["data"][0]["humidity"] is None
+    latest_use_case.execute.assert_awaited_once_with(room_ids=None, building_id=2)
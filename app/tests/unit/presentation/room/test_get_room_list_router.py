@@ -23,6 +23,7 @@ def mock_get_tag_list_use_case(fake_tags):
         first_cursor="id=1",
         last_cursor="id=21",
         next_cursor="id=11",
+        prev_cursor=None,
     )
     return mock
 
@@ -38,7 +39,7 @@ def test_get_tag_list_success(authenticated_client, override_dependencies, mock_
     client, _ = authenticated_client
     response = client.get("/api/v1/tag", params={"limit": 10})
 
-    mock_get_tag_list_use_case.execute.assert_called_once_with(None, 10, with_rooms=False)
+    mock_get_tag_list_use_case.execute.assert_called_once_with(None, 10, with_rooms=False, with_total=True)
     assert response.status_code == 200
 
     json_data = response.json()
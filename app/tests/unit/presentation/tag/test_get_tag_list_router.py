@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock
 
+from app.src.common.exception import DecodedFailedError
 from app.src.presentation.main import app
 from app.src.presentation.dependencies import get_tag_list_use_case
 from app.src.use_cases.tag.get_tag_list_use_case import GetTagListUseCase
@@ -33,6 +34,7 @@ def mock_get_tag_list_use_case(fake_tags):
         first_cursor="id=1",
         last_cursor="id=21",
         next_cursor="id=11",
+        prev_cursor=None,
     )
     return mock
 
@@ -47,7 +49,7 @@ def override_dependencies(mock_get_tag_list_use_case, fake_user):
 
 def test_get_tag_list_success_cursor_is_none_limit(client, override_dependencies, mock_get_tag_list_use_case, fake_tags):
     response = client.get("/api/v1/tag", params={"cursor": None, "limit": 10})
-    mock_get_tag_list_use_case.execute.assert_called_once_with("", 10, with_rooms=False)
+    mock_get_tag_list_use_case.execute.assert_called_once_with("", 10, with_rooms=False, with_total=True)
     assert response.status_code == 200
 
     json_data = response.json()
@@ -75,9 +77,10 @@ def test_get_tag_list_success_no_cursor_limit(client, override_dependencies, moc
         first_cursor="id=1",
         last_cursor="id=21",
         next_cursor="id=21",
+        prev_cursor=None,
     )
     response = client.get("/api/v1/tag", params={"limit": 10})
-    mock_get_tag_list_use_case.execute.assert_called_once_with(None, 10, with_rooms=False)
+    mock_get_tag_list_use_case.execute.assert_called_once_with(None, 10, with_rooms=False, with_total=True)
     assert response.status_code == 200
 
 
@@ -91,9 +94,10 @@ def test_get_tag_list_success_cursor_no_limit(client, override_dependencies, moc
         first_cursor="id=1",
         last_cursor="id=21",
         next_cursor=None,
+        prev_cursor=None,
     )
     response = client.get("/api/v1/tag", params={"cursor": "id=21"})
-    mock_get_tag_list_use_case.execute.assert_called_once_with("id=21", 20, with_rooms=False)
+    mock_get_tag_list_use_case.execute.assert_called_once_with("id=21", 20, with_rooms=False, with_total=True)
     assert response.status_code == 200
 
 
@@ -107,9 +111,10 @@ def test_get_tag_list_success_no_cursor_no_limit(client, override_dependencies,
         first_cursor="id=1",
         last_cursor="id=21",
         next_cursor="id=21",
+        prev_cursor=None,
     )
     response = client.get("/api/v1/tag", params={})
-    mock_get_tag_list_use_case.execute.assert_called_once_with(None, 20, with_rooms=False)
+    mock_get_tag_list_use_case.execute.assert_called_once_with(None, 20, with_rooms=False, with_total=True)
     assert response.status_code == 200
 
 
@@ -118,6 +123,12 @@ def test_get_tag_list_invalid_limit(client, override_dependencies):
     assert response.status_code == 422
 
 
+def test_get_tag_list_invalid_cursor(client, override_dependencies, mock_get_tag_list_use_case):
+    mock_get_tag_list_use_case.execute.side_effect = DecodedFailedError("Tag pagination cursor", "Invalid cursor signature")
+    response = client.get("/api/v1/tag", params={"cursor": "id=21"})
+    assert response.status_code == 400
+
+
 def test_get_tag_list_failed_unexpectedly(client, override_dependencies, mock_get_tag_list_use_case):
     mock_get_tag_list_use_case.execute.side_effect = Exception("Unexpectedly")
     response = client.get("/api/v1/tag")
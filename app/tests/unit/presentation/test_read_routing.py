@@ -0,0 +1,83 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+
+from app.src.infrastructure.db import session as db_session
+from app.src.infrastructure.db.models.tag_model import TagModel
+from app.src.presentation.api.read_routing import PRIMARY_UNTIL_COOKIE
+from app.src.presentation.core.config import settings
+from app.src.presentation.dependencies import delete_tag_use_case
+from app.src.presentation.main import app
+
+
+def _database(tag_name: str):
+    # Une base SQLite par serveur : le même tag n'a pas le même nom sur le primaire et le réplica
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine, tables=[TagModel.__table__])
+    with Session(engine) as session:
+        session.add(TagModel(id=1, name=tag_name, source_address="addr_1"))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def replica_client(authenticated_client, monkeypatch):
+    client, _ = authenticated_client
+    monkeypatch.setattr(settings, "POSTGRES_REPLICA_HOST", "replica")
+    monkeypatch.setattr(db_session, "engine_main", _database("primary"))
+    monkeypatch.setattr(db_session, "engine_main_replica", _database("replica"))
+    yield client
+    client.cookies.clear()
+
+
+def test_get_reads_from_replica(replica_client):
+    response = replica_client.get("/api/v1/tag/1")
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "replica"
+
+
+def test_get_reads_from_primary_after_write(replica_client):
+    app.dependency_overrides[delete_tag_use_case] = lambda: Mock()
+
+    response = replica_client.delete("/api/v1/tag/1")
+
+    assert response.status_code == 204
+    assert float(response.cookies[PRIMARY_UNTIL_COOKIE]) > time.time()
+    assert replica_client.get("/api/v1/tag/1").json()["name"] == "primary"
+
+
+def test_get_reads_from_replica_once_window_expired(replica_client):
+    replica_client.cookies.set(PRIMARY_UNTIL_COOKIE, str(time.time() - 1))
+
+    assert replica_client.get("/api/v1/tag/1").json()["name"] == "replica"
+
+
+@pytest.mark.parametrize("cookie", ["", "not-a-timestamp"])
+def test_get_reads_from_primary_with_malformed_cookie(replica_client, cookie):
+    replica_client.cookies.set(PRIMARY_UNTIL_COOKIE, cookie)
+
+    assert replica_client.get("/api/v1/tag/1").json()["name"] == "primary"
+
+
+def test_failed_write_keeps_replica(replica_client):
+    app.dependency_overrides[delete_tag_use_case] = lambda: Mock(execute=Mock(side_effect=RuntimeError))
+
+    response = replica_client.delete("/api/v1/tag/1")
+
+    assert response.status_code == 500
+    assert PRIMARY_UNTIL_COOKIE not in response.cookies
+
+
+def test_without_replica_reads_from_primary(authenticated_client, monkeypatch):
+    client, _ = authenticated_client
+    monkeypatch.setattr(db_session, "engine_main", _database("primary"))
+
+    app.dependency_overrides[delete_tag_use_case] = lambda: Mock()
+
+    assert PRIMARY_UNTIL_COOKIE not in client.delete("/api/v1/tag/1").cookies
+    assert client.get("/api/v1/tag/1").json()["name"] == "primary"
@@ -21,3 +21,21 @@ def test_read_tool_success(authenticated_client):
 
     for key, value in expected.items():
         assert data[key] == value
+
+
+def test_read_cache_stats(authenticated_client):
+    client, _ = authenticated_client
+
+    response = client.get("/api/v1/tool/cache")
+    assert response.status_code == 200
+    assert set(response.json()["rooms_sensor_data"]) == {"hits", "misses", "size", "max_entries", "ttl_seconds"}
+
+
+def test_read_db_pool_stats(authenticated_client):
+    client, _ = authenticated_client
+
+    response = client.get("/api/v1/tool/db-pools")
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"main", "recorded", "async_main", "async_recorded"}
+    assert set(data["main"]) == {"pool_size", "checked_in", "checked_out", "overflow", "max_overflow"}
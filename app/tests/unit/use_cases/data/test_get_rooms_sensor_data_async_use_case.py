@@ -0,0 +1,106 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.src.common.cache import ResultCache
+from app.src.common.exception import NotFoundError
+from app.src.use_cases.data.get_rooms_latest_values_async_use_case import GetRoomsLatestValuesAsyncUseCase
+from app.src.use_cases.data.get_rooms_sensor_data_async_use_case import GetRoomsSensorDataAsyncUseCase, format_room_data
+from app.src.use_cases.data.get_single_room_sensor_async_use_case import GetSingleRoomSensorDataAsyncUseCase
+from app.src.use_cases.room_tag.delete_room_tag_use_case import DeleteRoomTagUseCase
+
+
+async def test_execute_sorts_rooms_and_uses_cache():
+    data_repository = Mock()
+    data_repository.get_rooms_with_sensor_data = AsyncMock(return_value=[{"id": 2, "tags": []}, {"id": 1, "tags": []}])
+    use_case = GetRoomsSensorDataAsyncUseCase(data_repository, ResultCache(ttl_seconds=60, max_entries=10))
+
+    first = await use_case.execute(room_ids=[1, 2, 3], smooth_interval_minutes=0)
+    second = await use_case.execute(room_ids=[3, 2, 1], smooth_interval_minutes=0)
+
+    assert [room["id"] for room in first.rooms_data] == [1, 2]
+    assert second is first
+    data_repository.get_rooms_with_sensor_data.assert_awaited_once_with(
+        room_ids=[1, 2, 3],
+        first_value_date=None,
+        smooth_interval_minutes=30,
+        since=None,
+        quantiles=False,
+        with_stats=True
+    )
+
+
+async def test_execute_uses_cache_until_mapping_changes():
+    data_repository = Mock()
+    data_repository.get_rooms_with_sensor_data = AsyncMock(return_value=[{"id": 1, "tags": []}])
+    cache = ResultCache(ttl_seconds=60, max_entries=10)
+    use_case = GetRoomsSensorDataAsyncUseCase(data_repository, cache)
+
+    await use_case.execute(room_ids=[1], smooth_interval_minutes=30)
+    await use_case.execute(room_ids=[1], smooth_interval_minutes=30)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    DeleteRoomTagUseCase(Mock(), cache).execute(1)
+    await use_case.execute(room_ids=[1], smooth_interval_minutes=30)
+
+    assert data_repository.get_rooms_with_sensor_data.await_count == 2
+
+
+async def test_stream_formats_each_room():
+    async def rooms(**_):
+        for room_id in (1, 2):
+            yield {"id": room_id, "tags": []}
+
+    data_repository = Mock()
+    data_repository.iter_rooms_with_sensor_data = rooms
+
+    streamed = [room async for room in GetRoomsSensorDataAsyncUseCase(data_repository).stream()]
+
+    assert [room["id"] for room in streamed] == [1, 2]
+
+
+async def test_single_room_not_found():
+    data_repository = Mock()
+    data_repository.get_rooms_with_sensor_data = AsyncMock(return_value=[])
+
+    with pytest.raises(NotFoundError):
+        await GetSingleRoomSensorDataAsyncUseCase(data_repository).execute(room_id=42)
+
+
+async def test_latest_values_formats_times():
+    data_repository = Mock()
+    data_repository.get_rooms_latest_values = AsyncMock(return_value=[{
+        "id": 1,
+        "name": "Room 1",
+        "floor": 0,
+        "building_id": 1,
+        "pressure": {"value": 1013.0, "time": datetime(2025, 1, 1, 10, tzinfo=UTC)},
+    }])
+
+    rooms = await GetRoomsLatestValuesAsyncUseCase(data_repository).execute(building_id=1)
+
+    assert rooms == [{
+        "id": 1,
+        "name": "Room 1",
+        "floor": 0,
+        "building_id": 1,
+        "pressure": {"value": 1013.0, "time": "2025-01-01T10:00:00+00:00"},
+    }]
+
+
+def test_format_room_data_without_stats():
+    quantile_data = [[1_000, 19.0, 20.0, 21.0]]
+    room = format_room_data(
+        {"id": 1, "tags": [], "temperature": {"data": [[1_000, 20.0]], "quantile_data": quantile_data}}
+    )
+
+    assert room["temperature"] == {
+        "min": None,
+        "max": None,
+        "average": None,
+        "nombre_values": None,
+        "data": [[1_000, 20.0]],
+        "quantiles": None,
+        "quantile_data": quantile_data,
+    }
@@ -0,0 +1,65 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+
+from app.src.common.interval_index import TagWindow
+from app.src.infrastructure.db.models.sensor_model import SensorTemperatureModel
+from app.src.infrastructure.db.repositories.sensor_repository_async import AsyncSQLSensorRepository
+from app.src.use_cases.sensor.get_sensor_measurements_async_use_case import GetSensorMeasurementsAsyncUseCase
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+END = datetime(2025, 2, 1, tzinfo=UTC)
+
+
+def _use_case(windows: list[TagWindow] | None = None):
+    data_repository = Mock()
+    data_repository.get_tag_windows = AsyncMock(return_value=windows or [])
+    sensor_repository = Mock()
+    sensor_repository.get_all = AsyncMock(return_value=[])
+    sensor_repository.get_range = AsyncMock(return_value=[])
+    return GetSensorMeasurementsAsyncUseCase(data_repository, sensor_repository), data_repository, sensor_repository
+
+
+async def test_no_filter_reads_whole_table():
+    use_case, data_repository, sensor_repository = _use_case()
+
+    await use_case.execute(100)
+
+    sensor_repository.get_all.assert_awaited_once_with(100, None)
+    data_repository.get_tag_windows.assert_not_called()
+
+
+async def test_source_address_without_lookup():
+    use_case, data_repository, sensor_repository = _use_case()
+
+    await use_case.execute(10, START, END, source_address="abc")
+
+    sensor_repository.get_range.assert_awaited_once_with(START, END, 10, [TagWindow("abc")])
+    data_repository.get_tag_windows.assert_not_called()
+
+
+async def test_room_resolved_to_assignment_windows():
+    windows = [TagWindow("abc", START, None), TagWindow("def", None, START)]
+    use_case, data_repository, sensor_repository = _use_case(windows)
+
+    await use_case.execute(10, room_id=3)
+    await use_case.execute(10, room_id=3, source_address="def")
+
+    data_repository.get_tag_windows.assert_awaited_with(tag_id=None, room_id=3)
+    assert sensor_repository.get_all.await_args_list[0].args == (10, windows)
+    assert sensor_repository.get_all.await_args_list[1].args == (10, [windows[1]])
+
+
+async def test_naive_range_with_room_filter_is_read_as_utc():
+    windows = [TagWindow("abc", START, None)]
+    data_repository = Mock()
+    data_repository.get_tag_windows = AsyncMock(return_value=windows)
+    session = Mock()
+    session.execute = AsyncMock(return_value=Mock(mappings=Mock(return_value=[])))
+    sensor_repository = AsyncSQLSensorRepository(session, SensorTemperatureModel)
+    use_case = GetSensorMeasurementsAsyncUseCase(data_repository, sensor_repository)
+
+    # Avant normalisation : TypeError en comparant la date naïve aux bornes des périodes
+    assert await use_case.execute(10, datetime(2025, 1, 1), datetime(2025, 1, 15, 12), room_id=3) == []
+
+    params = session.execute.await_args.args[0].compile().params.values()
+    assert datetime(2025, 1, 15, 12, tzinfo=UTC) in params
@@ -0,0 +1,66 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+from app.src.infrastructure.db.models.sensor_model import SensorTemperatureModel
+from app.src.infrastructure.db.repositories.sensor_repository_sql import SQLSensorRepository
+from app.src.use_cases.sensor.ingest_sensor_batch_async_use_case import IngestSensorBatchAsyncUseCase, RowError
+
+
+async def _rows(batches):
+    for batch in batches:
+        yield batch
+
+
+async def test_valid_rows_copied_and_invalid_reported():
+    copied = []
+
+    async def copy_records(columns, batches):
+        async for records in batches:
+            copied.extend(dict(zip(columns, record, strict=True)) for record in records)
+        return len(copied)
+
+    sensor_repository = Mock()
+    sensor_repository.record_columns = SQLSensorRepository(None, SensorTemperatureModel).record_columns
+    sensor_repository.copy_records = copy_records
+    rows = [
+        [(1, {"time": "2025-01-01T00:00:00", "temperature": 21.5, "source_address": "abc"})],
+        [(2, {"time": 1735689600, "temperature": "20", "sensor_id": "3"}), (3, ValueError("invalid JSON"))],
+        [(4, {"temperature": 1.0}), (5, {"time": "2025-01-01T00:00:00Z", "sensor_id": 1.5}), (6, {"time": 1, "x": 1})],
+    ]
+
+    report = await IngestSensorBatchAsyncUseCase(sensor_repository).execute(_rows(rows))
+
+    assert report.inserted == 2 and report.rejected == 4
+    assert [error.line for error in report.errors] == [3, 4, 5, 6]
+    assert report.errors[1] == RowError(4, "missing time")
+    assert copied[0]["time"] == datetime(2025, 1, 1, tzinfo=UTC)
+    assert copied[0]["relevance"] == 1.0
+    assert copied[1]["temperature"] == 20.0 and copied[1]["sensor_id"] == 3
+
+
+async def test_values_rejected_by_copy_are_reported_per_row():
+    copied = []
+
+    async def copy_records(columns, batches):
+        async for records in batches:
+            copied.extend(records)
+        return len(copied)
+
+    sensor_repository = Mock()
+    sensor_repository.record_columns = SQLSensorRepository(None, SensorTemperatureModel).record_columns
+    sensor_repository.copy_records = copy_records
+    time = "2025-01-01T00:00:00Z"
+    rows = [[
+        (1, {"time": time, "sensor_id": 2**31 - 1, "host": "ok"}),
+        (2, {"time": time, "sensor_id": 2**31}),
+        (3, {"time": time, "event_id": "-2147483649"}),
+        (4, {"time": time, "source_address": "ab\x00c"}),
+        (5, {"time": 1e20}),
+    ]]
+
+    report = await IngestSensorBatchAsyncUseCase(sensor_repository).execute(_rows(rows))
+
+    assert report.inserted == 1 and report.rejected == 4
+    assert [error.line for error in report.errors] == [2, 3, 4, 5]
+    assert report.errors[0] == RowError(2, "sensor_id: integer out of range 2147483648")
+    assert report.errors[2] == RowError(4, "source_address: string contains a NUL character")
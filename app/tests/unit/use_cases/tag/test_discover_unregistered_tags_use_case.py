@@ -0,0 +1,28 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+from app.src.domain.interface_repositories.sensor_repository import SensorRepository
+from app.src.domain.interface_repositories.tag_repository import TagRepository
+from app.src.use_cases.tag.discover_unregistered_tags_use_case import DiscoverUnregisteredTagsUseCase, UnregisteredSource
+
+
+def _sensor_repo(sources: dict[str, datetime]) -> Mock:
+    repository = Mock(spec=SensorRepository)
+    repository.distinct_source_addresses.return_value = sorted(sources)
+    repository.last_seen.side_effect = lambda addresses: {address: sources[address] for address in addresses}
+    return repository
+
+
+def test_discover_merges_kinds_and_skips_registered():
+    tag_repository = Mock(spec=TagRepository)
+    tag_repository.select_all_source_addresses.return_value = {"known"}
+    temperature = _sensor_repo({"known": datetime(2025, 1, 3, tzinfo=UTC), "new": datetime(2025, 1, 1, tzinfo=UTC)})
+    humidity = _sensor_repo({"new": datetime(2025, 1, 2, tzinfo=UTC), "other": datetime(2025, 1, 1, tzinfo=UTC)})
+
+    result = DiscoverUnregisteredTagsUseCase(tag_repository, {"temperature": temperature, "humidity": humidity}).execute()
+
+    assert result == [
+        UnregisteredSource("new", ["temperature", "humidity"], datetime(2025, 1, 2, tzinfo=UTC)),
+        UnregisteredSource("other", ["humidity"], datetime(2025, 1, 1, tzinfo=UTC)),
+    ]
+    temperature.last_seen.assert_called_once_with(["new"])
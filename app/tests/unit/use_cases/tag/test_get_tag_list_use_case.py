@@ -2,18 +2,29 @@ import pytest
 
 from unittest.mock import Mock
 
+from app.src.common.cache import ResultCache
 from app.src.common.exception import DecodedFailedError
+from app.src.common.pagination import CursorCodec, KeysetCursor, KeysetPage
 from app.src.use_cases.tag.get_tag_list_use_case import GetTagListUseCase, PaginatedTag
 
 
+codec = CursorCodec("test-secret")
+
+
 @pytest.fixture
 def mock_tag_repo():
-    return Mock()
+    repo = Mock()
+    repo.count_all_tags.return_value = 25
+    return repo
 
 
 @pytest.fixture
 def use_case(mock_tag_repo):
-    return GetTagListUseCase(tag_repository=mock_tag_repo)
+    return GetTagListUseCase(tag_repository=mock_tag_repo, cursor_codec=codec)
+
+
+def _page(tags, has_next, has_prev):
+    return KeysetPage(tags, has_next, has_prev, {"id": tags[0].id}, {"id": tags[-1].id})
 
 
 def test_get_tag_list_use_case_build(use_case, mock_tag_repo):
@@ -23,135 +34,81 @@ def test_get_tag_list_use_case_build(use_case, mock_tag_repo):
 
 def test_get_tag_list_use_case_success_no_cursor(use_case, mock_tag_repo, sample_tags_factory):
     sample_tags = sample_tags_factory(1, 26)
+    mock_tag_repo.paginate_tags.return_value = _page(sample_tags[:10], has_next=True, has_prev=False)
 
-    limit = 10
-    total = 25
-    first_tag = sample_tags[0]
-    last_tag = sample_tags[-5]
-
-    mock_tag_repo.paginate_tags.return_value = (sample_tags[:11], total, first_tag, last_tag)
-
-    result: PaginatedTag = use_case.execute(cursor=None, limit=limit)
+    result: PaginatedTag = use_case.execute(cursor=None, limit=10)
 
     assert result.total == 25
     assert result.chunk_size == 10
     assert result.chunk_count == 3
-    assert result.current_cursor == "id=1"
-    assert result.next_cursor == "id=11"
-    assert result.first_cursor == "id=1"
-    assert result.last_cursor == "id=21"
-    assert isinstance(result.tags, list)
     assert result.tags == sample_tags[:10]
-    assert len(result.tags) == 10
+    assert result.current_cursor == result.first_cursor
+    assert codec.decode(result.first_cursor) == KeysetCursor("next", {})
+    assert codec.decode(result.last_cursor) == KeysetCursor("prev", {})
+    assert codec.decode(result.next_cursor) == KeysetCursor("next", {"id": "10"})
+    assert result.prev_cursor is None
 
-    mock_tag_repo.paginate_tags.assert_called_once_with(None, limit + 1, with_rooms=False)
+    mock_tag_repo.paginate_tags.assert_called_once_with(None, 10, with_rooms=False)
 
 
 def test_get_tag_list_use_case_success_with_cursor(use_case, mock_tag_repo, sample_tags_factory):
     sample_tags = sample_tags_factory(1, 26)
+    mock_tag_repo.paginate_tags.return_value = _page(sample_tags[10:20], has_next=True, has_prev=True)
+    cursor = codec.encode(KeysetCursor("next", {"id": 10}))
 
-    limit = 10
-    total = 25
-    first_tag = sample_tags[0]
-    last_tag = sample_tags[-5]
-
-    mock_tag_repo.paginate_tags.return_value = (sample_tags[10:21], total, first_tag, last_tag)
+    result: PaginatedTag = use_case.execute(cursor=cursor, limit=10)
 
-    result: PaginatedTag = use_case.execute(cursor="id=11", limit=limit)
-
-    assert result.total == 25
-    assert result.chunk_size == 10
-    assert result.chunk_count == 3
-    assert result.current_cursor == "id=11"
-    assert result.next_cursor == "id=21"
-    assert result.first_cursor == "id=1"
-    assert result.last_cursor == "id=21"
-    assert isinstance(result.tags, list)
+    assert result.current_cursor == cursor
     assert result.tags == sample_tags[10:20]
-    assert len(result.tags) == 10
-
-    mock_tag_repo.paginate_tags.assert_called_once_with("11", limit + 1, with_rooms=False)
-
+    assert codec.decode(result.next_cursor) == KeysetCursor("next", {"id": "20"})
+    assert codec.decode(result.prev_cursor) == KeysetCursor("prev", {"id": "11"})
 
-def test_get_tag_list_use_case_failed_with_invalid_cursor(use_case):
-    with pytest.raises(DecodedFailedError, match="Failed to decode Tag"):
-        use_case.execute(cursor="id11", limit=10)
+    mock_tag_repo.paginate_tags.assert_called_once_with(KeysetCursor("next", {"id": "10"}), 10, with_rooms=False)
 
 
-def test_get_tag_list_use_case_success_with_limit20(use_case, mock_tag_repo, sample_tags_factory):
+def test_get_tag_list_use_case_last_chunk(use_case, mock_tag_repo, sample_tags_factory):
     sample_tags = sample_tags_factory(1, 26)
+    mock_tag_repo.paginate_tags.return_value = _page(sample_tags[20:25], has_next=False, has_prev=True)
 
-    limit = 20
-    total = 25
-    first_tag = sample_tags[0]
-    last_tag = sample_tags[-5]
-
-    mock_tag_repo.paginate_tags.return_value = (sample_tags[:21], total, first_tag, last_tag)
+    result: PaginatedTag = use_case.execute(cursor=codec.encode(KeysetCursor("prev", {})), limit=10)
 
-    result: PaginatedTag = use_case.execute(cursor="id=1", limit=20)
-
-    assert result.total == 25
-    assert result.chunk_size == 20
-    assert result.chunk_count == 2
-    assert result.current_cursor == "id=1"
-    assert result.next_cursor == "id=21"
-    assert result.first_cursor == "id=1"
-    assert result.last_cursor == "id=21"
-    assert isinstance(result.tags, list)
-    assert result.tags == sample_tags[:20]
-    assert len(result.tags) == 20
-
-    mock_tag_repo.paginate_tags.assert_called_once_with("1", limit + 1, with_rooms=False)
+    assert result.chunk_size == 5
+    assert result.next_cursor is None
+    assert codec.decode(result.prev_cursor) == KeysetCursor("prev", {"id": "21"})
 
 
-def test_get_tag_list_use_case_success_with_cursor_last_cursor(use_case, mock_tag_repo, sample_tags_factory):
-    sample_tags = sample_tags_factory(1, 26)
+@pytest.mark.parametrize("cursor", ["id11", "id=11", codec.encode(KeysetCursor("next", {"id": 1}))[:-2] + "xx"])
+def test_get_tag_list_use_case_failed_with_invalid_cursor(use_case, cursor):
+    with pytest.raises(DecodedFailedError, match="Failed to decode Tag"):
+        use_case.execute(cursor=cursor, limit=10)
 
-    limit = 10
-    total = 25
-    first_tag = sample_tags[0]
-    last_tag = sample_tags[-5]
 
-    mock_tag_repo.paginate_tags.return_value = (sample_tags[21:25], total, first_tag, last_tag)
+def test_get_tag_list_use_case_rejects_cursor_signed_with_other_key(use_case):
+    cursor = CursorCodec("other-secret").encode(KeysetCursor("next", {"id": 10}))
 
-    result: PaginatedTag = use_case.execute(cursor="id=21", limit=limit)
+    with pytest.raises(DecodedFailedError, match="Failed to decode Tag"):
+        use_case.execute(cursor=cursor, limit=10)
 
-    assert result.total == 25
-    assert result.chunk_size == 4
-    assert result.chunk_count == 3
-    assert result.current_cursor == "id=21"
-    assert result.next_cursor is None
-    assert result.first_cursor == "id=1"
-    assert result.last_cursor == "id=21"
-    assert isinstance(result.tags, list)
-    assert result.tags == sample_tags[21:25]
-    assert len(result.tags) == 4
 
-    mock_tag_repo.paginate_tags.assert_called_once_with("21", limit + 1, with_rooms=False)
+def test_get_tag_list_use_case_without_total(use_case, mock_tag_repo, sample_tags_factory):
+    mock_tag_repo.paginate_tags.return_value = _page(sample_tags_factory(1, 3), has_next=False, has_prev=False)
 
+    result: PaginatedTag = use_case.execute(cursor=None, limit=10, with_total=False)
 
-def test_get_tag_list_use_case_next_cursor(use_case, mock_tag_repo, sample_tags_factory):
-    sample_tags = sample_tags_factory(1, 26)
+    assert result.total is None
+    assert result.chunk_count is None
+    mock_tag_repo.count_all_tags.assert_not_called()
 
-    limit = 2
-    total = 25
-    first_tag = sample_tags[0]
-    last_tag = sample_tags[-1]
 
-    mock_tag_repo.paginate_tags.return_value = (sample_tags[:3], total, first_tag, last_tag)
+def test_get_tag_list_use_case_cached_total(mock_tag_repo, sample_tags_factory):
+    use_case = GetTagListUseCase(mock_tag_repo, codec, ResultCache(ttl_seconds=60, max_entries=8))
+    mock_tag_repo.paginate_tags.return_value = _page(sample_tags_factory(1, 11), has_next=True, has_prev=False)
 
-    result: PaginatedTag = use_case.execute(cursor=None, limit=limit)
+    use_case.execute(cursor=None, limit=10)
+    result: PaginatedTag = use_case.execute(cursor=None, limit=10)
 
     assert result.total == 25
-    assert result.chunk_size == 2
-    assert result.chunk_count == 13
-    assert result.current_cursor == "id=1"
-    assert result.next_cursor == "id=3"
-    assert result.first_cursor == "id=1"
-    assert result.last_cursor == "id=25"
-    assert isinstance(result.tags, list)
-    assert result.tags == sample_tags[:2]
-    assert len(result.tags) == 2
+    mock_tag_repo.count_all_tags.assert_called_once()
 
 
 def test_end():